@@ -3,26 +3,172 @@
 Skill Packager - Creates a distributable .skill file of a skill folder
 
 Usage:
-    python utils/package_skill.py <path/to/skill-folder> [output-directory]
+    python utils/package_skill.py <path/to/skill-folder> [output-directory] [--full]
 
 Example:
     python utils/package_skill.py skills/public/my-skill
     python utils/package_skill.py skills/public/my-skill ./dist
+
+Packages are reproducible: entries are written in sorted order with a fixed
+timestamp and normalized permissions, so the same files always produce the
+same bytes. A manifest of file hashes (<skill>.skill.manifest.json) is kept
+next to the .skill file; on the next run, entries whose content is unchanged
+are copied compressed from the previous package instead of being deflated
+again. A copied entry must match the file's current size and CRC-32 and
+inflate to its current bytes, so a stale or hand-edited package is never
+repackaged as is. --full ignores the
+manifest and recompresses everything.
 """
 
+import argparse
+import hashlib
+import json
+import os
+import stat
+import struct
 import sys
 import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from quick_validate import validate_skill
 
+MANIFEST_VERSION = 1
+# 1980-01-01 00:00:00, the earliest DOS timestamp a zip entry can hold
+ZIP_DATE = (1 << 5) | 1
+ZIP_TIME = 0
+LOCAL_HEADER = struct.Struct('<4s5H3L2H')
+CENTRAL_HEADER = struct.Struct('<4s6H3L5H2L')
+END_RECORD = struct.Struct('<4s4H2LH')
+
+
+def manifest_path(skill_filename):
+    return skill_filename.with_name(skill_filename.name + '.manifest.json')
+
+
+def load_manifest(skill_filename):
+    try:
+        manifest = json.loads(manifest_path(skill_filename).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return manifest.get('files', {}) if manifest.get('version') == MANIFEST_VERSION else {}
+
+
+def previous_entries(skill_filename):
+    """{sha256: (method, crc, size, compressed bytes)} from the previous package, via the manifest."""
+    manifest = load_manifest(skill_filename)
+    if not manifest or not skill_filename.exists():
+        return manifest, {}
+    reusable = {}
+    try:
+        with zipfile.ZipFile(skill_filename) as zipf, open(skill_filename, 'rb') as raw:
+            for info in zipf.infolist():
+                recorded = manifest.get(info.filename)
+                if not recorded or info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+                    continue
+                raw.seek(info.header_offset)
+                header = LOCAL_HEADER.unpack(raw.read(LOCAL_HEADER.size))
+                raw.seek(header[-2] + header[-1], os.SEEK_CUR)
+                reusable[recorded['sha256']] = (info.compress_type, info.CRC, info.file_size,
+                                                raw.read(info.compress_size))
+    except (zipfile.BadZipFile, OSError, struct.error):
+        return manifest, {}
+    return manifest, reusable
+
+
+def inflate(method, data):
+    """Uncompressed bytes of a stored or deflated entry, or None if the data is corrupt."""
+    if method == zipfile.ZIP_STORED:
+        return data
+    try:
+        return zlib.decompress(data, -15)
+    except zlib.error:
+        return None
+
+
+def read_entry(file_path, arcname, manifest, reusable):
+    """
+    Loads one file's zip entry, reusing the previous compressed data when the content is unchanged.
+
+    Returns:
+        (arcname, entry dict, reused)
+    """
+    info = file_path.stat()
+    mode = 0o755 if info.st_mode & stat.S_IXUSR else 0o644
+    recorded = manifest.get(arcname)
+    if recorded and recorded['size'] == info.st_size and recorded['mtimeNs'] == info.st_mtime_ns:
+        digest = recorded['sha256']
+        content = None
+    else:
+        content = file_path.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()
+
+    entry = {'sha256': digest, 'size': info.st_size, 'mtimeNs': info.st_mtime_ns, 'mode': mode}
+    if digest in reusable:
+        method, crc, size, data = reusable[digest]
+        # The manifest only vouches for the file; the previous archive may be stale or edited
+        if content is None:
+            content = file_path.read_bytes()
+        if size == len(content) and crc == zlib.crc32(content) and inflate(method, data) == content:
+            entry['method'], entry['crc'], entry['data'] = method, crc, data
+            return arcname, entry, True
+
+    if content is None:
+        content = file_path.read_bytes()
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    data = compressor.compress(content) + compressor.flush()
+    if len(data) < len(content):
+        entry['method'], entry['data'] = zipfile.ZIP_DEFLATED, data
+    else:
+        entry['method'], entry['data'] = zipfile.ZIP_STORED, content
+    entry['crc'] = zlib.crc32(content)
+    entry['size'] = len(content)
+    return arcname, entry, False
+
+
+def zip_bytes(entries):
+    """Serializes sorted (arcname, entry) pairs as a zip archive with fixed timestamps."""
+    parts = []
+    central = []
+    offset = 0
+    for arcname, entry in entries:
+        name = arcname.encode('utf-8')
+        flags = 0x800 if not arcname.isascii() else 0
+        version = 20 if entry['method'] == zipfile.ZIP_DEFLATED else 10
+        data = entry['data']
+        parts.append(LOCAL_HEADER.pack(b'PK\x03\x04', version, flags, entry['method'], ZIP_TIME, ZIP_DATE,
+                                       entry['crc'], len(data), entry['size'], len(name), 0))
+        parts.append(name)
+        parts.append(data)
+        central.append(CENTRAL_HEADER.pack(b'PK\x01\x02', (3 << 8) | 20, version, flags, entry['method'],
+                                           ZIP_TIME, ZIP_DATE, entry['crc'], len(data), entry['size'],
+                                           len(name), 0, 0, 0, 0, (0o100000 | entry['mode']) << 16, offset))
+        central.append(name)
+        offset += LOCAL_HEADER.size + len(name) + len(data)
+
+    directory = b''.join(central)
+    parts.append(directory)
+    parts.append(END_RECORD.pack(b'PK\x05\x06', 0, 0, len(entries), len(entries), len(directory), offset, 0))
+    return b''.join(parts)
 
-def package_skill(skill_path, output_dir=None):
+
+def write_if_changed(path, content):
+    if path.exists() and path.read_bytes() == content:
+        return False
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, path)
+    return True
+
+
+def package_skill(skill_path, output_dir=None, full=False):
     """
     Package a skill folder into a .skill file.
 
     Args:
         skill_path: Path to the skill folder
         output_dir: Optional output directory for the .skill file (defaults to current directory)
+        full: Recompress every file instead of reusing unchanged entries
 
     Returns:
         Path to the created .skill file, or None if error
@@ -62,19 +208,32 @@ def package_skill(skill_path, output_dir=None):
         output_path = Path.cwd()
 
     skill_filename = output_path / f"{skill_name}.skill"
+    outputs = {skill_filename, manifest_path(skill_filename)}
 
     # Create the .skill file (zip format)
     try:
-        with zipfile.ZipFile(skill_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through the skill directory
-            for file_path in skill_path.rglob('*'):
-                if file_path.is_file():
-                    # Calculate the relative path within the zip
-                    arcname = file_path.relative_to(skill_path.parent)
-                    zipf.write(file_path, arcname)
-                    print(f"  Added: {arcname}")
-
-        print(f"\n✅ Successfully packaged skill to: {skill_filename}")
+        manifest, reusable = ({}, {}) if full else previous_entries(skill_filename)
+        files = sorted(
+            (file_path.relative_to(skill_path.parent).as_posix(), file_path)
+            for file_path in skill_path.rglob('*')
+            if file_path.is_file() and file_path not in outputs
+        )
+        with ThreadPoolExecutor() as pool:
+            entries = list(pool.map(lambda item: read_entry(item[1], item[0], manifest, reusable), files))
+
+        written = write_if_changed(skill_filename, zip_bytes([(arcname, entry) for arcname, entry, _ in entries]))
+        write_if_changed(manifest_path(skill_filename), json.dumps({
+            'version': MANIFEST_VERSION,
+            'files': {arcname: {key: entry[key] for key in ('sha256', 'size', 'mtimeNs')}
+                      for arcname, entry, _ in entries},
+        }, indent=2).encode('utf-8'))
+
+        reused = sum(1 for _, _, was_reused in entries if was_reused)
+        print(f"  {len(entries)} files: {len(entries) - reused} compressed, {reused} reused")
+        if written:
+            print(f"\n✅ Successfully packaged skill to: {skill_filename}")
+        else:
+            print(f"\n✅ Package is up to date: {skill_filename}")
         return skill_filename
 
     except Exception as e:
@@ -83,22 +242,18 @@ def package_skill(skill_path, output_dir=None):
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python utils/package_skill.py <path/to/skill-folder> [output-directory]")
-        print("\nExample:")
-        print("  python utils/package_skill.py skills/public/my-skill")
-        print("  python utils/package_skill.py skills/public/my-skill ./dist")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="Package a skill folder into a .skill file")
+    parser.add_argument('skill_path', help="path/to/skill-folder")
+    parser.add_argument('output_dir', nargs='?', help="output directory (defaults to the current directory)")
+    parser.add_argument('--full', action='store_true', help="recompress every file instead of reusing unchanged entries")
+    args = parser.parse_args()
 
-    skill_path = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
-
-    print(f"📦 Packaging skill: {skill_path}")
-    if output_dir:
-        print(f"   Output directory: {output_dir}")
+    print(f"📦 Packaging skill: {args.skill_path}")
+    if args.output_dir:
+        print(f"   Output directory: {args.output_dir}")
     print()
 
-    result = package_skill(skill_path, output_dir)
+    result = package_skill(args.skill_path, args.output_dir, full=args.full)
 
     if result:
         sys.exit(0)
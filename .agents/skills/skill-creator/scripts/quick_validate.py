@@ -1,14 +1,31 @@
 #!/usr/bin/env python3
 """
 Quick validation script for skills - minimal version
+
+Usage:
+    python quick_validate.py <skill_directory>
+    python quick_validate.py --all <root> [--no-cache]
+
+--all finds every skill (a directory with a SKILL.md) under root, visiting
+each real directory once even when it is reachable through several symlinks
+(.agent/skills/x -> .agents/skills/x), validates them concurrently and prints
+one JSON report. Passing results are cached in <root>/.cache/quick_validate.json
+by SKILL.md hash, so unchanged skills are not parsed again.
 """
 
+import argparse
+import hashlib
+import json
 import sys
 import os
 import re
-import yaml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+CACHE_FILE = Path('.cache') / 'quick_validate.json'
+# Directories never searched for skills
+SKIP_DIRS = {'.git', '.cache', 'node_modules', 'dist', '__pycache__'}
+
 def validate_skill(skill_path):
     """Basic validation of a skill"""
     skill_path = Path(skill_path)
@@ -30,7 +47,8 @@ def validate_skill(skill_path):
 
     frontmatter_text = match.group(1)
 
-    # Parse YAML frontmatter
+    # Parse YAML frontmatter (imported here so cached --all runs skip it)
+    import yaml
     try:
         frontmatter = yaml.safe_load(frontmatter_text)
         if not isinstance(frontmatter, dict):
@@ -85,11 +103,119 @@ def validate_skill(skill_path):
 
     return True, "Skill is valid!"
 
+def discover_skills(root):
+    """
+    Finds skill directories under root, following symlinks once.
+
+    Returns:
+        {real skill path: [paths it was found at, sorted]}
+    """
+    skills = {}
+    visited = set()
+    for current, dirs, files in os.walk(root, followlinks=True):
+        real = os.path.realpath(current)
+        if real in visited:
+            dirs[:] = []
+            continue
+        visited.add(real)
+        if 'SKILL.md' in files:
+            skills.setdefault(real, []).append(current)
+            # Skills do not nest; their rules/ and scripts/ need no walk
+            dirs[:] = []
+            continue
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+
+    # Symlinked paths visited after the real directory were pruned above; add them as aliases
+    for current, dirs, _ in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for d in dirs:
+            path = os.path.join(current, d)
+            if os.path.islink(path) and os.path.realpath(path) in skills:
+                skills[os.path.realpath(path)].append(path)
+    return {real: sorted(set(paths)) for real, paths in sorted(skills.items())}
+
+
+def validator_version():
+    """Hash of this script, so cached results are dropped when the rules change."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def load_cache(cache_path):
+    try:
+        cache = json.loads(cache_path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return cache.get('skills', {}) if cache.get('validator') == validator_version() else {}
+
+
+def validate_all(root, use_cache=True):
+    """
+    Validates every skill under root.
+
+    Returns:
+        Report dict with summary and one entry per real skill directory
+    """
+    root = Path(root)
+    cache_path = root / CACHE_FILE
+    cache = load_cache(cache_path) if use_cache else {}
+    skills = discover_skills(root)
+
+    def check(real):
+        digest = hashlib.sha256((Path(real) / 'SKILL.md').read_bytes()).hexdigest()
+        if cache.get(real) == digest:
+            return real, digest, True, "Skill is valid!", True
+        valid, message = validate_skill(real)
+        return real, digest, valid, message, False
+
+    with ThreadPoolExecutor() as pool:
+        results = list(pool.map(check, skills))
+
+    entries = []
+    passing = {}
+    for real, digest, valid, message, cached in results:
+        entries.append({
+            "path": os.path.relpath(real, root),
+            "foundAt": [os.path.relpath(path, root) for path in skills[real]],
+            "valid": valid,
+            "message": message,
+            "cached": cached,
+            "sha256": digest,
+        })
+        if valid:
+            passing[real] = digest
+
+    if use_cache:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps({"validator": validator_version(), "skills": passing}, indent=2))
+
+    return {
+        "root": str(root),
+        "summary": {
+            "skills": len(entries),
+            "valid": sum(1 for entry in entries if entry["valid"]),
+            "invalid": sum(1 for entry in entries if not entry["valid"]),
+            "cached": sum(1 for entry in entries if entry["cached"]),
+        },
+        "skills": entries,
+    }
+
+
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
+    parser = argparse.ArgumentParser(description="Validate a skill, or every skill under a root with --all")
+    parser.add_argument('skill_directory', nargs='?')
+    parser.add_argument('--all', metavar='ROOT', help="validate every skill under ROOT and print a JSON report")
+    parser.add_argument('--no-cache', action='store_true', help="with --all, ignore and do not update cached results")
+    args = parser.parse_args()
+    if bool(args.all) == bool(args.skill_directory):
         print("Usage: python quick_validate.py <skill_directory>")
+        print("       python quick_validate.py --all <root> [--no-cache]")
         sys.exit(1)
-    
-    valid, message = validate_skill(sys.argv[1])
+
+    if args.all:
+        report = validate_all(args.all, use_cache=not args.no_cache)
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        sys.exit(0 if not report["summary"]["invalid"] else 1)
+
+    valid, message = validate_skill(args.skill_directory)
     print(message)
-    sys.exit(0 if valid else 1)
\ No newline at end of file
+    sys.exit(0 if valid else 1)
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Skill Search Index - Finds the skill sections relevant to a query
+
+Usage:
+    skill_index.py build [--root <skills-dir>]
+    skill_index.py query <terms...> [--root <skills-dir>] [--limit N] [--show] [--json]
+
+Examples:
+    skill_index.py query set map lookup
+    skill_index.py query remotion audio trim --show
+    skill_index.py query useEffect dependencies --limit 5 --json
+
+Every SKILL.md, rules/*.md and references/*.md under the skills directory
+(default: the directory holding skill-creator) is split into sections at
+its markdown headings. Frontmatter (name, title, description, tags) counts
+toward the file's first section, and heading words weigh more than body
+words. The inverted index maps each term to the sections containing it;
+each section records its file and byte range, so --show reads only the
+matching sections instead of whole files.
+
+The index is stored compactly in <skills-dir>/.cache/skill_index.json and
+rebuilt automatically when any markdown file is added, removed or changed.
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+
+INDEX_VERSION = 1
+INDEX_FILE = Path('.cache') / 'skill_index.json'
+SKIP_DIRS = {'.git', '.cache', 'node_modules', '__pycache__'}
+FRONTMATTER_FIELDS = {'name', 'title', 'description', 'tags', 'impactdescription'}
+HEADING_WEIGHT = 3
+FRONTMATTER_WEIGHT = 2
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'if', 'in', 'into', 'is', 'it',
+    'of', 'on', 'or', 'that', 'the', 'this', 'to', 'use', 'when', 'with', 'you', 'your',
+}
+
+HEADING_RE = re.compile(rb'^(#{1,6})[ \t]+(.+?)[ \t#]*$')
+FENCE_RE = re.compile(rb'^[ \t]*(```|~~~)')
+FIELD_RE = re.compile(r'^\s*([\w-]+):\s*(.*)$')
+WORD_RE = re.compile(r'\w+')
+CAMEL_RE = re.compile(r'[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+')
+
+
+def default_root():
+    return Path(__file__).resolve().parents[2]
+
+
+def terms(text):
+    """Lowercased words, plus the parts of camelCase and snake_case words."""
+    found = []
+    for word in WORD_RE.findall(text):
+        lowered = word.lower()
+        if len(lowered) > 1 and lowered not in STOPWORDS:
+            found.append(lowered)
+        parts = CAMEL_RE.findall(word)
+        if len(parts) > 1:
+            found.extend(part.lower() for part in parts if len(part) > 1 and part.lower() not in STOPWORDS)
+    return found
+
+
+def markdown_files(root):
+    """(relative posix path, size, mtime_ns) of every indexed markdown file, sorted."""
+    found = []
+    for current, dirs, files in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+        for name in files:
+            if name.endswith('.md'):
+                path = os.path.join(current, name)
+                info = os.stat(path)
+                found.append((Path(path).relative_to(root).as_posix(), info.st_size, info.st_mtime_ns))
+    return sorted(found)
+
+
+def parse_sections(content):
+    """
+    Splits markdown bytes into sections.
+
+    Returns:
+        (frontmatter text, [(heading, start byte, end byte, body text)])
+    """
+    frontmatter = ''
+    body_start = 0
+    if content.startswith(b'---\n'):
+        end = content.find(b'\n---', 4)
+        if end != -1:
+            frontmatter = content[4:end].decode('utf-8', 'replace')
+            body_start = content.find(b'\n', end + 4) + 1 or len(content)
+
+    sections = []
+    heading = ''
+    start = body_start
+    text_start = body_start
+    in_fence = False
+    offset = body_start
+    for line in content[body_start:].splitlines(keepends=True):
+        if FENCE_RE.match(line):
+            in_fence = not in_fence
+        elif not in_fence:
+            match = HEADING_RE.match(line.rstrip(b'\r\n'))
+            if match:
+                title = match.group(2).decode('utf-8', 'replace')
+                if content[text_start:offset].strip():
+                    sections.append((heading, start, offset))
+                    heading = title
+                    start = offset
+                else:
+                    # A heading directly followed by a subheading joins its section
+                    heading = f"{heading} › {title}" if heading else title
+                text_start = offset + len(line)
+        offset += len(line)
+    if content[start:].strip() or not sections:
+        sections.append((heading, start, len(content)))
+    return frontmatter, [(h, s, e, content[s:e].decode('utf-8', 'replace')) for h, s, e in sections]
+
+
+def frontmatter_text(frontmatter):
+    """Values of the searchable frontmatter fields (nested metadata included)."""
+    fields = {}
+    for line in frontmatter.splitlines():
+        match = FIELD_RE.match(line)
+        if match and match.group(1).lower() in FRONTMATTER_FIELDS:
+            fields[match.group(1).lower()] = match.group(2).strip().strip('"\'')
+    return fields
+
+
+def build_index(root):
+    """Indexes every markdown file under root and writes the index file."""
+    root = Path(root)
+    files = []
+    sections = []
+    postings = {}
+    for path, size, mtime_ns in markdown_files(root):
+        frontmatter, file_sections = parse_sections((root / path).read_bytes())
+        fields = frontmatter_text(frontmatter)
+        file_id = len(files)
+        files.append([path, size, mtime_ns, fields.get('title') or fields.get('name') or ''])
+
+        for position, (heading, start, end, text) in enumerate(file_sections):
+            counts = Counter(terms(text))
+            for term in terms(heading):
+                counts[term] += HEADING_WEIGHT - 1
+            if position == 0:
+                for value in fields.values():
+                    for term in terms(value):
+                        counts[term] += FRONTMATTER_WEIGHT
+            section_id = len(sections)
+            sections.append([file_id, heading, start, end, sum(counts.values())])
+            for term, count in counts.items():
+                postings.setdefault(term, []).extend((section_id, count))
+
+    index = {
+        "version": INDEX_VERSION,
+        "files": files,
+        "sections": sections,
+        "postings": dict(sorted(postings.items())),
+    }
+    index_path = root / INDEX_FILE
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_name(index_path.name + '.tmp')
+    tmp_path.write_text(json.dumps(index, separators=(',', ':'), ensure_ascii=False), encoding='utf-8')
+    os.replace(tmp_path, index_path)
+    return index
+
+
+def load_index(root):
+    """The index for root, rebuilt first if it is missing or any markdown file changed."""
+    root = Path(root)
+    try:
+        index = json.loads((root / INDEX_FILE).read_text(encoding='utf-8'))
+    except (FileNotFoundError, json.JSONDecodeError):
+        index = None
+    if (not index or index.get('version') != INDEX_VERSION
+            or [tuple(f[:3]) for f in index['files']] != markdown_files(root)):
+        index = build_index(root)
+    return index
+
+
+def search(index, query, limit=3):
+    """
+    Ranks sections for query with BM25.
+
+    Returns:
+        List of (score, section) best first, section being
+        {path, title, heading, start, end}
+    """
+    sections = index['sections']
+    postings = index['postings']
+    if not sections:
+        return []
+    average = sum(section[4] for section in sections) / len(sections)
+
+    query_terms = set(terms(query))
+    scores = Counter()
+    for term in query_terms:
+        matched = [term] if term in postings else [t for t in postings if t.startswith(term)]
+        for key in matched:
+            flat = postings[key]
+            idf = math.log(1 + (len(sections) - len(flat) / 2 + 0.5) / (len(flat) / 2 + 0.5))
+            for i in range(0, len(flat), 2):
+                section_id, tf = flat[i], flat[i + 1]
+                length = sections[section_id][4]
+                scores[section_id] += idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / average))
+
+    results = []
+    for section_id, score in scores.most_common(limit):
+        file_id, heading, start, end, _ = sections[section_id]
+        path, _, _, title = index['files'][file_id]
+        results.append((round(score, 3), {"path": path, "title": title, "heading": heading, "start": start, "end": end}))
+    return results
+
+
+def read_section(root, section):
+    with open(Path(root) / section['path'], 'rb') as f:
+        f.seek(section['start'])
+        return f.read(section['end'] - section['start']).decode('utf-8', 'replace')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the skill search index")
+    parser.add_argument('command', choices=('build', 'query'))
+    parser.add_argument('terms', nargs='*')
+    parser.add_argument('--root', default=None, help="skills directory (default: the one holding skill-creator)")
+    parser.add_argument('--limit', type=int, default=3)
+    parser.add_argument('--show', action='store_true', help="print the text of each matching section")
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    args = parser.parse_args()
+    root = Path(args.root) if args.root else default_root()
+
+    if args.command == 'build':
+        index = build_index(root)
+        print(f"✅ Indexed {len(index['files'])} files, {len(index['sections'])} sections, "
+              f"{len(index['postings'])} terms -> {root / INDEX_FILE}")
+        return
+
+    if not args.terms:
+        parser.error("query needs at least one term")
+    results = search(load_index(root), ' '.join(args.terms), args.limit)
+    if args.json:
+        print(json.dumps([dict(section, score=score, **({'text': read_section(root, section)} if args.show else {}))
+                          for score, section in results], indent=2, ensure_ascii=False))
+        return
+    if not results:
+        print("No matching sections")
+        sys.exit(1)
+    for score, section in results:
+        heading = f" › {section['heading']}" if section['heading'] else ''
+        print(f"{score:7.3f}  {section['path']}{heading}  [bytes {section['start']}-{section['end']}]")
+        if args.show:
+            print(read_section(root, section).rstrip() + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,13 @@
 
+import os
 import re
-import json
+import sys
 import colorsys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src', 'scripts'))
+from token_io import write_json
+from update_colors import parse_primitives
+
 def hex_to_rgb(hex_color):
     hex_color = hex_color.lstrip('#')
     if len(hex_color) == 8: # Handle alpha definition in file (RRGGBBAA) -> RRGGBB for base, but we preserve full hex
@@ -13,57 +18,6 @@ def rgb_to_hsl_string(r, g, b):
     h, l, s = colorsys.rgb_to_hls(r / 255.0, g / 255.0, b / 255.0)
     return f"hsl({round(h * 360)}, {round(s * 100)}%, {round(l * 100)}%)"
 
-def parse_primitives(file_path):
-    light_data = {}
-    dark_data = {}
-    current_mode = None
-    current_family = None
-    
-    with open(file_path, 'r') as f:
-        lines = f.readlines()
-        
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-            
-        if line.startswith("## Light Theme"):
-            current_mode = "light"
-            continue
-        elif line.startswith("## Dark Theme"):
-            current_mode = "dark"
-            continue
-            
-        if line.startswith("###"):
-            current_family = line.strip("### ").strip()
-            # Initialize family dict if needed
-            if current_mode == "light":
-                if current_family not in light_data: light_data[current_family] = {}
-            else:
-                if current_family not in dark_data: dark_data[current_family] = {}
-            continue
-            
-        if line.startswith("-") and current_family:
-            # - Family/Level: #Hex
-            parts = line.split(":")
-            if len(parts) >= 2:
-                token_part = parts[0].strip("- ").strip()
-                hex_value = parts[1].strip()
-                
-                # Extract level
-                # Token format: Family/Level
-                if "/" in token_part:
-                    _, level = token_part.split("/", 1)
-                else:
-                    level = token_part # Fallback
-                
-                if current_mode == "light":
-                    light_data[current_family][level] = hex_value
-                else:
-                    dark_data[current_family][level] = hex_value
-
-    return light_data, dark_data
-
 def generate_json(light_data, dark_data):
     # Union of all families
     all_families = set(list(light_data.keys()) + list(dark_data.keys()))
@@ -160,7 +114,6 @@ if __name__ == "__main__":
     l_data, d_data = parse_primitives(primitives_path)
     new_json_data = {"colors": {"palette": generate_json(l_data, d_data)}}
     
-    with open(json_path, 'w') as f:
-        json.dump(new_json_data, f, indent=2)
-        
+    write_json(json_path, new_json_data)
+
     print(f"Updated {json_path}")
@@ -1,46 +1,32 @@
 import json
+import os
 import re
+import sys
 
-# Read Primitives.md
-with open('src/data/# Primitives.md', 'r') as f:
-    lines = f.readlines()
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src', 'scripts'))
+from token_io import write_json
+from token_lexer import ENTRY, SECTION, lex_markdown
 
 dark_map = {}
 in_dark_section = False
-current_family = ""
 
 # Parse Dark Theme section
 # Expected format:
 # ## Dark Theme
 # ### Blue
 # - Blue/10: #17191C
-for line in lines:
-    line = line.strip()
-    if line == "## Dark Theme":
+for event in lex_markdown('src/data/# Primitives.md'):
+    if event.kind == SECTION and event.name == "Dark Theme":
         in_dark_section = True
         continue
     if not in_dark_section:
         continue
     
-    if line.startswith("### "):
-        current_family = line.replace("### ", "").strip()
-    elif line.startswith("- "):
+    if event.kind == ENTRY and event.value is not None:
         # - Blue/10: #17191C
-        # Extract "Blue/10" and "#17191C"
-        parts = line.split(":")
-        if len(parts) >= 2:
-            key_part = parts[0].replace("- ", "").strip()
-            # key_part: Blue/10 or Gray/white
-            
-            # The JSON logic relies on Family + Level.
-            # key_part usually is Family/Level.
-            # but sometimes Family in header matches Family in key.
-            
-            # We need to map "Blue/10" -> (Family="Blue", Level="10")
-            
-            token_val = parts[1].strip().split(" ")[0] # #17191C (sometines comments?)
-            
-            dark_map[key_part] = token_val
+        # key is "Blue/10" (Family/Level), matching the JSON 'variable'
+        token_val = event.value.split(" ")[0] # #17191C (sometines comments?)
+        dark_map[event.key] = token_val
 
 # Read color_palette.json
 with open('src/data/color_palette.json', 'r') as f:
@@ -64,5 +50,4 @@ for family_key, tokens in data.items():
 
 print(f"Updated {update_count} tokens with hexDark values.")
 
-with open('src/data/color_palette.json', 'w') as f:
-    json.dump(data, f, indent=2)
+write_json('src/data/color_palette.json', data)
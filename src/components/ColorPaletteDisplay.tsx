@@ -2,7 +2,7 @@ import React, { useState } from 'react';
 import { HighlightText } from './ui/HighlightText';
 import ColorSwatch from '@/components/ui/ColorSwatch';
 import { SearchBar } from './SearchBar';
-import { designSystemData } from '../utils/dataLoader';
+import palette from '../data/tokens/palette';
 import { Switch } from "./ui/switch"
 import { SmartFilterDropdown } from '@/components/ui/SmartFilterDropdown';
 
@@ -172,22 +172,21 @@ const ColorPaletteDisplay: React.FC<ColorPaletteDisplayProps> = ({
   onDarkModeChange,
   showDarkModeControl = true
 }) => {
-  const { colors } = designSystemData;
   const [searchTerm, setSearchTerm] = useState('');
   const [selectedFamilies, setSelectedFamilies] = useState<string[]>(['All']);
   const [internalDarkMode, setInternalDarkMode] = useState(false);
   const isDarkMode = controlledDarkMode ?? internalDarkMode;
   const setDarkMode = onDarkModeChange ?? setInternalDarkMode;
 
-  const allShades = Object.values(colors.palette).flat();
+  const allShades = Object.values(palette).flat();
   const allLevels = [...new Set(allShades.map((s: any) => s.level))];
 
   const scaleOrder = ['Blue', 'Red', 'Orange', 'YellowOrange', 'Green', 'DeepGreen', 'Cyan', 'LightBlue', 'DeepBlue', 'Purple', 'Pink', 'CoolGray'];
   const tableOrder = ['Blue', 'Gray', 'Red', 'Orange', 'YellowOrange', 'Green', 'DeepGreen', 'Cyan', 'LightBlue', 'DeepBlue', 'Purple', 'Pink', 'CoolGray', 'BlackAlpha'];
 
-  const grayFamilies = Object.entries(colors.palette).filter(([family]) => family.toLowerCase() === 'gray');
-  const alphaFamilies = Object.entries(colors.palette).filter(([family]) => family.toLowerCase().includes('alpha'));
-  const chromaticFamilies = Object.entries(colors.palette)
+  const grayFamilies = Object.entries(palette).filter(([family]) => family.toLowerCase() === 'gray');
+  const alphaFamilies = Object.entries(palette).filter(([family]) => family.toLowerCase().includes('alpha'));
+  const chromaticFamilies = Object.entries(palette)
     .filter(([family]) => family.toLowerCase() !== 'gray' && !family.toLowerCase().includes('alpha'))
     .sort(([a], [b]) => {
       const idxA = scaleOrder.indexOf(a);
@@ -213,7 +212,7 @@ const ColorPaletteDisplay: React.FC<ColorPaletteDisplayProps> = ({
 
 
 
-  const filteredColors = Object.entries(colors.palette)
+  const filteredColors = Object.entries(palette)
     .filter(([family]) => selectedFamilies.includes('All') || selectedFamilies.includes(family))
     .reduce((acc, [family, shades]) => {
       const filteredShades = (shades as any[]).filter((color: any) => {
@@ -331,7 +330,7 @@ const ColorPaletteDisplay: React.FC<ColorPaletteDisplayProps> = ({
           <div className="flex items-center gap-2">
             <SmartFilterDropdown
               triggerText={getDropdownTriggerText()}
-              items={Object.keys(colors.palette)
+              items={Object.keys(palette)
                 .sort((a, b) => {
                   const idxA = tableOrder.indexOf(a);
                   const idxB = tableOrder.indexOf(b);
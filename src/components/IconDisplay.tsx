@@ -4,6 +4,8 @@ import { RotateCcw } from 'lucide-react';
 import { SearchBar } from './SearchBar';
 import ColorSwatch from '@/components/ui/ColorSwatch';
 import { designSystemData } from '../utils/dataLoader';
+import semanticIcon from '../data/tokens/semantic/icon';
+import semanticBg from '../data/tokens/semantic/bg';
 import { Button } from '@/components/ui/button';
 import { Card, CardContent } from '@/components/ui/card';
 import { Popover, PopoverContent, PopoverTrigger } from '@/components/ui/popover';
@@ -27,11 +29,6 @@ interface SemanticToken {
   value?: string;
 }
 
-interface SemanticMapping {
-  icon: SemanticToken[];
-  bg: SemanticToken[];
-}
-
 interface IconCollectionInfo {
   notes?: string;
   subfolder?: string;
@@ -204,20 +201,19 @@ const AsyncSvgIcon: React.FC<AsyncSvgIconProps> = ({
 };
 
 const ColorPalette: React.FC<ColorPaletteProps> = ({ onColorSelect, purpose, className = '' }) => {
-  const semanticMapping = designSystemData.colors.semanticMapping as SemanticMapping;
   const customColorInputRef = useRef<HTMLInputElement>(null);
 
   const handleCustomClick = () => {
     customColorInputRef.current?.click();
   };
 
-  const semanticColorTokens = purpose === 'icon' ? semanticMapping.icon : semanticMapping.bg;
+  const semanticColorTokens: SemanticToken[] = purpose === 'icon' ? semanticIcon : semanticBg;
 
   let resolvedColors: { name: string; hex: string }[] = [];
 
   if (purpose === 'icon') {
     resolvedColors = ICON_COLOR_ORDER.map((semanticName) => {
-      const token = semanticMapping.icon.find((item) => item.devToken === semanticName);
+      const token = semanticIcon.find((item: SemanticToken) => item.devToken === semanticName);
       const hex = resolveColorToken(token?.value);
       return { name: semanticName, hex: hex || '#CCCCCC' };
     }).filter((color) => color.hex !== '#CCCCCC');
@@ -1,11 +1,12 @@
-import React, { useState } from 'react';
+import React, { useEffect, useState } from 'react';
 import { HighlightText } from './ui/HighlightText';
 import { SmartFilterDropdown } from "./ui/SmartFilterDropdown";
 import ColorSwatch from '@/components/ui/ColorSwatch';
 import { SearchBar } from './SearchBar';
-import { designSystemData } from '../utils/dataLoader';
+import semanticMapping from '../data/tokens/semantic';
 import { Clipboard } from './ui/clipboard';
-import { resolveSemanticToken } from '../lib/colorUtils';
+import { loadContrastRatios, resolveSemanticToken } from '../lib/colorUtils';
+import type { ContrastRatioLookup } from '../lib/colorUtils';
 
 import {
   Table,
@@ -18,6 +19,8 @@ import {
 
 import { Switch } from "@/components/ui/switch";
 
+const CONTRAST_BACKGROUND = 'bg.primary';
+
 interface SemanticColorMappingDisplayProps {
   isDarkMode?: boolean;
   onDarkModeChange?: (checked: boolean) => void;
@@ -29,13 +32,24 @@ const SemanticColorMappingDisplay: React.FC<SemanticColorMappingDisplayProps> =
   onDarkModeChange,
   showDarkModeControl = true
 }) => {
-  const { colors } = designSystemData;
   const [searchTerm, setSearchTerm] = useState('');
   const [selectedCategories, setSelectedCategories] = useState<string[]>(['All']);
   const [selectedAvatarGroup, setSelectedAvatarGroup] = useState('All');
   const [internalDarkMode, setInternalDarkMode] = useState(false);
   const isDarkMode = controlledDarkMode ?? internalDarkMode;
   const setDarkMode = onDarkModeChange ?? setInternalDarkMode;
+  const [contrastRatio, setContrastRatio] = useState<ContrastRatioLookup>();
+
+  // Precomputed WCAG ratios of text/icon tokens, shown against the page background
+  useEffect(() => {
+    let isMounted = true;
+    loadContrastRatios().then((lookup) => {
+      if (isMounted) setContrastRatio(() => lookup);
+    });
+    return () => {
+      isMounted = false;
+    };
+  }, []);
 
   const AVATAR_SORT_ORDER = [
     'red', 'orange', 'yellowOrange', 'green', 'deepGreen',
@@ -102,7 +116,7 @@ const SemanticColorMappingDisplay: React.FC<SemanticColorMappingDisplayProps> =
   ];
 
   // Extract unique avatar groups
-  const avatarTokens = (colors.semanticMapping['avatar'] || []) as any[];
+  const avatarTokens = (semanticMapping['avatar'] || []) as any[];
   const uniqueAvatarGroups = Array.from(new Set(
     avatarTokens.map(token => {
       const parts = token.devToken.split('.');
@@ -136,7 +150,7 @@ const SemanticColorMappingDisplay: React.FC<SemanticColorMappingDisplayProps> =
   // Calculate filtered token count based on selected display groups
   const filteredTokenCount = selectedCategories.includes('All')
     ? displayGroups.reduce((sum, group) => {
-      const tokens = ((colors.semanticMapping as any)[group.dataKey] || []) as any[];
+      const tokens = ((semanticMapping as any)[group.dataKey] || []) as any[];
       // Filter by group logic (interactive vs non-interactive)
       let groupTokens = tokens.filter(group.filter);
 
@@ -152,7 +166,7 @@ const SemanticColorMappingDisplay: React.FC<SemanticColorMappingDisplayProps> =
     : displayGroups
       .filter(group => selectedCategories.includes(group.id))
       .reduce((sum, group) => {
-        const tokens = ((colors.semanticMapping as any)[group.dataKey] || []) as any[];
+        const tokens = ((semanticMapping as any)[group.dataKey] || []) as any[];
         // Filter by group logic (interactive vs non-interactive)
         let groupTokens = tokens.filter(group.filter);
 
@@ -224,7 +238,7 @@ const SemanticColorMappingDisplay: React.FC<SemanticColorMappingDisplayProps> =
                 return null;
               }
 
-              const rawTokens = ((colors.semanticMapping as any)[group.dataKey] || []) as any[];
+              const rawTokens = ((semanticMapping as any)[group.dataKey] || []) as any[];
               // First filter by group logic (interactive vs non-interactive)
               const groupTokens = rawTokens.filter(group.filter);
 
@@ -303,6 +317,7 @@ const SemanticColorMappingDisplay: React.FC<SemanticColorMappingDisplayProps> =
                     const { devToken, designToken } = token;
                     const { light, dark } = resolveSemanticToken(devToken);
                     const displayColor = isDarkMode ? dark : light;
+                    const ratio = contrastRatio?.(devToken, CONTRAST_BACKGROUND, isDarkMode ? 'dark' : 'light');
 
                     return (
                       <TableRow key={devToken}>
@@ -333,6 +348,11 @@ const SemanticColorMappingDisplay: React.FC<SemanticColorMappingDisplayProps> =
                           <span className="uppercase">
                             {displayColor}
                           </span>
+                          {ratio !== undefined && (
+                            <span className="ml-2" title={`WCAG contrast on ${CONTRAST_BACKGROUND}`}>
+                              {ratio.toFixed(2)}:1
+                            </span>
+                          )}
                         </TableCell>
                       </TableRow>
                     );
@@ -2,7 +2,7 @@ import React, { useState } from 'react';
 import { HighlightText } from './ui/HighlightText';
 import ColorSwatch from '@/components/ui/ColorSwatch';
 import { SearchBar } from './SearchBar';
-import { designSystemData } from '../utils/dataLoader';
+import semanticMapping from '../data/tokens/semantic';
 import { Clipboard } from './ui/clipboard';
 import { resolveSemanticToken } from '../lib/colorUtils';
 
@@ -29,7 +29,6 @@ const SemanticColorMappingDisplay: React.FC<SemanticGroupingDisplayProps> = ({
   onDarkModeChange,
   showDarkModeControl = true
 }) => {
-  const { colors } = designSystemData;
   const [searchTerm, setSearchTerm] = useState('');
   const [selectedCategories, setSelectedCategories] = useState<string[]>(['All']);
   const [selectedAvatarGroup, setSelectedAvatarGroup] = useState('All');
@@ -79,7 +78,7 @@ const SemanticColorMappingDisplay: React.FC<SemanticGroupingDisplayProps> = ({
   };
 
   // Extract unique avatar groups
-  const avatarTokens = (colors.semanticMapping['avatar'] || []) as any[];
+  const avatarTokens = (semanticMapping['avatar'] || []) as any[];
   const uniqueAvatarGroups = Array.from(new Set(
     avatarTokens.map(token => {
       const parts = token.devToken.split('.');
@@ -116,7 +115,7 @@ const SemanticColorMappingDisplay: React.FC<SemanticGroupingDisplayProps> = ({
 
     const contextTotal = contextGroup.groups.reduce((sum, rawGroupId) => {
       const { key, isInteractive } = getGroupData(rawGroupId);
-      const tokens = ((colors.semanticMapping as any)[key] || []) as any[];
+      const tokens = ((semanticMapping as any)[key] || []) as any[];
       const filtered = tokens.filter((t: any) => {
         if (key === 'avatar') return true;
         return isInteractive ? t.devToken.includes('.interactive') : !t.devToken.includes('.interactive');
@@ -196,7 +195,7 @@ const SemanticColorMappingDisplay: React.FC<SemanticGroupingDisplayProps> = ({
                   <TableBody>
                     {contextGroup.groups.map(rawGroupId => {
                       const { key, isInteractive } = getGroupData(rawGroupId);
-                      const rawTokens = ((colors.semanticMapping as any)[key] || []) as any[];
+                      const rawTokens = ((semanticMapping as any)[key] || []) as any[];
 
                       const groupTokens = rawTokens.filter((t: any) => {
                         if (key === 'avatar') return true;
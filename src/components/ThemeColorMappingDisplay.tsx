@@ -2,7 +2,8 @@ import React, { useState } from 'react';
 import { HighlightText } from './ui/HighlightText';
 import ColorSwatch from '@/components/ui/ColorSwatch';
 import { SearchBar } from './SearchBar';
-import { designSystemData } from '../utils/dataLoader';
+import palette from '../data/tokens/palette';
+import themeMapping from '../data/tokens/theme';
 
 import {
   Table,
@@ -33,7 +34,6 @@ const ThemeColorMappingDisplay: React.FC<ThemeColorMappingDisplayProps> = ({
     'Cool Gray', 'Black Alpha'
   ];
 
-  const { colors } = designSystemData;
   const [searchTerm, setSearchTerm] = useState('');
   const [selectedCategories, setSelectedCategories] = useState<string[]>(['All']);
   const [selectedAvatarGroup, setSelectedAvatarGroup] = useState('All');
@@ -64,7 +64,7 @@ const ThemeColorMappingDisplay: React.FC<ThemeColorMappingDisplayProps> = ({
   };
 
   // Extract unique avatar groups
-  const avatarTokens = colors.themeMapping['avatar'] || {};
+  const avatarTokens = themeMapping['avatar'] || {};
   const uniqueAvatarGroups = Array.from(new Set(
     Object.keys(avatarTokens).map(key => {
       // color_avatar_red_20 -> red
@@ -90,11 +90,11 @@ const ThemeColorMappingDisplay: React.FC<ThemeColorMappingDisplayProps> = ({
 
     // Handle simple color names like "color_white" or "color_black"
     if (parts.length === 2 && parts[0] === 'color') {
-      const palette = colors.palette as Record<string, any[]>;
+      const families = palette as Record<string, any[]>;
 
       // Search for the color in all palette families
-      for (const paletteFamily in palette) {
-        const shade = palette[paletteFamily].find(s =>
+      for (const paletteFamily in families) {
+        const shade = families[paletteFamily].find(s =>
           s.variable && s.variable.toLowerCase() === variableName.toLowerCase()
         );
         if (shade) {
@@ -106,9 +106,9 @@ const ThemeColorMappingDisplay: React.FC<ThemeColorMappingDisplayProps> = ({
     // Handle standard pattern: color_Family_Level
     // NEW LOGIC: Try to find by direct variable match in semantic/palette data first
     // This supports the new "Family/Level" format (e.g. "Blue/10") directly
-    const palette = colors.palette as Record<string, any[]>;
-    for (const paletteFamily in palette) {
-      const shade = palette[paletteFamily].find(s => s.variable === variableName);
+    const families = palette as Record<string, any[]>;
+    for (const paletteFamily in families) {
+      const shade = families[paletteFamily].find(s => s.variable === variableName);
       if (shade) {
         return { shade, paletteFamily };
       }
@@ -119,14 +119,14 @@ const ThemeColorMappingDisplay: React.FC<ThemeColorMappingDisplayProps> = ({
       const family = parts[1];
       const level = parts[2];
 
-      for (const paletteFamily in palette) {
+      for (const paletteFamily in families) {
         if (paletteFamily.replace(/\s/g, '').toLowerCase() === family.toLowerCase()) {
           // Try exact match first
-          let shade = palette[paletteFamily].find(s => String(s.level) === level);
+          let shade = families[paletteFamily].find(s => String(s.level) === level);
 
           // If level is 'alpha' and not found, try matching level that contains 'alpha'
           if (!shade && level === 'alpha') {
-            shade = palette[paletteFamily].find(s =>
+            shade = families[paletteFamily].find(s =>
               String(s.level).toLowerCase().includes('alpha')
             );
           }
@@ -143,7 +143,7 @@ const ThemeColorMappingDisplay: React.FC<ThemeColorMappingDisplayProps> = ({
 
   // Calculate filtered token count based on selected categories
   const filteredTokenCount = selectedCategories.includes('All')
-    ? Object.entries(colors.themeMapping).reduce((sum, [category, mappings]) => {
+    ? Object.entries(themeMapping).reduce((sum, [category, mappings]) => {
       if (category === 'avatar' && selectedAvatarGroup !== 'All') {
         const count = Object.keys(mappings).filter(key => {
           const parts = key.replace(/^color_avatar_/, '').split('_');
@@ -155,7 +155,7 @@ const ThemeColorMappingDisplay: React.FC<ThemeColorMappingDisplayProps> = ({
       }
       return sum + Object.keys(mappings).length;
     }, 0)
-    : Object.entries(colors.themeMapping)
+    : Object.entries(themeMapping)
       .filter(([category]) => selectedCategories.includes(category))
       .reduce((sum, [category, mappings]) => {
         if (category === 'avatar' && selectedAvatarGroup !== 'All') {
@@ -227,7 +227,7 @@ const ThemeColorMappingDisplay: React.FC<ThemeColorMappingDisplayProps> = ({
             </TableRow>
           </TableHeader>
           <TableBody>
-            {Object.entries(colors.themeMapping)
+            {Object.entries(themeMapping)
               .sort(([a], [b]) => {
                 const keys = Object.keys(groupNames);
                 const idxA = keys.indexOf(a);
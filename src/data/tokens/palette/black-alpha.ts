@@ -0,0 +1,77 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const paletteBlackAlpha = [
+  {
+    "level": "10",
+    "variable": "BlackAlpha/10",
+    "hex": "#0000001A",
+    "hexDark": "#FFFFFF1A",
+    "rgb": "rgb(0, 0, 0)",
+    "hsl": "hsl(0, 0%, 0%)"
+  },
+  {
+    "level": "20",
+    "variable": "BlackAlpha/20",
+    "hex": "#00000033",
+    "hexDark": "#FFFFFF33",
+    "rgb": "rgb(0, 0, 0)",
+    "hsl": "hsl(0, 0%, 0%)"
+  },
+  {
+    "level": "30",
+    "variable": "BlackAlpha/30",
+    "hex": "#0000004D",
+    "hexDark": "#FFFFFF4D",
+    "rgb": "rgb(0, 0, 0)",
+    "hsl": "hsl(0, 0%, 0%)"
+  },
+  {
+    "level": "40",
+    "variable": "BlackAlpha/40",
+    "hex": "#00000066",
+    "hexDark": "#FFFFFF66",
+    "rgb": "rgb(0, 0, 0)",
+    "hsl": "hsl(0, 0%, 0%)"
+  },
+  {
+    "level": "50",
+    "variable": "BlackAlpha/50",
+    "hex": "#00000080",
+    "hexDark": "#FFFFFF80",
+    "rgb": "rgb(0, 0, 0)",
+    "hsl": "hsl(0, 0%, 0%)"
+  },
+  {
+    "level": "60",
+    "variable": "BlackAlpha/60",
+    "hex": "#00000099",
+    "hexDark": "#FFFFFF99",
+    "rgb": "rgb(0, 0, 0)",
+    "hsl": "hsl(0, 0%, 0%)"
+  },
+  {
+    "level": "70",
+    "variable": "BlackAlpha/70",
+    "hex": "#000000B3",
+    "hexDark": "#FFFFFFB3",
+    "rgb": "rgb(0, 0, 0)",
+    "hsl": "hsl(0, 0%, 0%)"
+  },
+  {
+    "level": "80",
+    "variable": "BlackAlpha/80",
+    "hex": "#000000CC",
+    "hexDark": "#FFFFFFCC",
+    "rgb": "rgb(0, 0, 0)",
+    "hsl": "hsl(0, 0%, 0%)"
+  },
+  {
+    "level": "90",
+    "variable": "BlackAlpha/90",
+    "hex": "#000000E6",
+    "hexDark": "#FFFFFFE6",
+    "rgb": "rgb(0, 0, 0)",
+    "hsl": "hsl(0, 0%, 0%)"
+  }
+];
+
+export default paletteBlackAlpha;
@@ -0,0 +1,85 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const paletteBlue = [
+  {
+    "level": "10",
+    "variable": "Blue/10",
+    "hex": "#E8F3FF",
+    "hexDark": "#17191C",
+    "rgb": "rgb(232, 243, 255)",
+    "hsl": "hsl(211, 100%, 95%)"
+  },
+  {
+    "level": "20",
+    "variable": "Blue/20",
+    "hex": "#D6E7FF",
+    "hexDark": "#001C43",
+    "rgb": "rgb(214, 231, 255)",
+    "hsl": "hsl(215, 100%, 92%)"
+  },
+  {
+    "level": "30",
+    "variable": "Blue/30",
+    "hex": "#ADCDFB",
+    "hexDark": "#052F6A",
+    "rgb": "rgb(173, 205, 251)",
+    "hsl": "hsl(215, 91%, 83%)"
+  },
+  {
+    "level": "40",
+    "variable": "Blue/40",
+    "hex": "#84B5FB",
+    "hexDark": "#90BCFB",
+    "rgb": "rgb(132, 181, 251)",
+    "hsl": "hsl(215, 94%, 75%)"
+  },
+  {
+    "level": "50",
+    "variable": "Blue/50",
+    "hex": "#589BFA",
+    "hexDark": "#78AEFA",
+    "rgb": "rgb(88, 155, 250)",
+    "hsl": "hsl(215, 94%, 66%)"
+  },
+  {
+    "level": "60",
+    "variable": "Blue/60",
+    "hex": "#3182F6",
+    "hexDark": "#458EF7",
+    "rgb": "rgb(49, 130, 246)",
+    "hsl": "hsl(215, 92%, 58%)"
+  },
+  {
+    "level": "70",
+    "variable": "Blue/70",
+    "hex": "#1B64DA",
+    "hexDark": "#2A71E5",
+    "rgb": "rgb(27, 100, 218)",
+    "hsl": "hsl(217, 78%, 48%)"
+  },
+  {
+    "level": "80",
+    "variable": "Blue/80",
+    "hex": "#164A9E",
+    "hexDark": "#1955B4",
+    "rgb": "rgb(22, 74, 158)",
+    "hsl": "hsl(217, 76%, 35%)"
+  },
+  {
+    "level": "90",
+    "variable": "Blue/90",
+    "hex": "#1B3B6D",
+    "hexDark": "#204682",
+    "rgb": "rgb(27, 59, 109)",
+    "hsl": "hsl(217, 60%, 27%)"
+  },
+  {
+    "level": "100",
+    "variable": "Blue/100",
+    "hex": "#252D38",
+    "hexDark": "#D9E0EA",
+    "rgb": "rgb(37, 45, 56)",
+    "hsl": "hsl(215, 20%, 18%)"
+  }
+];
+
+export default paletteBlue;
@@ -0,0 +1,69 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const paletteCoolGray = [
+  {
+    "level": "20",
+    "variable": "CoolGray/20",
+    "hex": "#E4EBF2",
+    "hexDark": "#1E2834",
+    "rgb": "rgb(228, 235, 242)",
+    "hsl": "hsl(210, 35%, 92%)"
+  },
+  {
+    "level": "30",
+    "variable": "CoolGray/30",
+    "hex": "#BECBDD",
+    "hexDark": "#2C415A",
+    "rgb": "rgb(190, 203, 221)",
+    "hsl": "hsl(215, 31%, 81%)"
+  },
+  {
+    "level": "50",
+    "variable": "CoolGray/50",
+    "hex": "#9AABC0",
+    "hexDark": "#9DACC1",
+    "rgb": "rgb(154, 171, 192)",
+    "hsl": "hsl(213, 23%, 68%)"
+  },
+  {
+    "level": "60",
+    "variable": "CoolGray/60",
+    "hex": "",
+    "hexDark": "#889DB9",
+    "rgb": "rgb(136, 157, 185)",
+    "hsl": "hsl(214, 26%, 63%)"
+  },
+  {
+    "level": "70",
+    "variable": "CoolGray/70",
+    "hex": "#7287A2",
+    "hexDark": "",
+    "rgb": "rgb(114, 135, 162)",
+    "hsl": "hsl(214, 21%, 54%)"
+  },
+  {
+    "level": "80",
+    "variable": "CoolGray/80",
+    "hex": "",
+    "hexDark": "#61748C",
+    "rgb": "rgb(97, 116, 140)",
+    "hsl": "hsl(213, 18%, 46%)"
+  },
+  {
+    "level": "90",
+    "variable": "CoolGray/90",
+    "hex": "#4B596B",
+    "hexDark": "",
+    "rgb": "rgb(75, 89, 107)",
+    "hsl": "hsl(214, 18%, 36%)"
+  },
+  {
+    "level": "alpha (10%)",
+    "variable": "CoolGray/alpha",
+    "hex": "#7287A21A",
+    "hexDark": "#889DB94D",
+    "rgb": "rgb(114, 135, 162)",
+    "hsl": "hsl(214, 21%, 54%)"
+  }
+];
+
+export default paletteCoolGray;
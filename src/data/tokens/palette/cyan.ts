@@ -0,0 +1,69 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const paletteCyan = [
+  {
+    "level": "20",
+    "variable": "Cyan/20",
+    "hex": "#DAF9F9",
+    "hexDark": "#072C2B",
+    "rgb": "rgb(218, 249, 249)",
+    "hsl": "hsl(180, 72%, 92%)"
+  },
+  {
+    "level": "30",
+    "variable": "Cyan/30",
+    "hex": "#9BE1DF",
+    "hexDark": "#004846",
+    "rgb": "rgb(155, 225, 223)",
+    "hsl": "hsl(178, 54%, 75%)"
+  },
+  {
+    "level": "50",
+    "variable": "Cyan/50",
+    "hex": "#57CBC8",
+    "hexDark": "#52BBB8",
+    "rgb": "rgb(87, 203, 200)",
+    "hsl": "hsl(178, 53%, 57%)"
+  },
+  {
+    "level": "60",
+    "variable": "Cyan/60",
+    "hex": "",
+    "hexDark": "#0DADAA",
+    "rgb": "rgb(13, 173, 170)",
+    "hsl": "hsl(179, 86%, 36%)"
+  },
+  {
+    "level": "70",
+    "variable": "Cyan/70",
+    "hex": "#23A8A5",
+    "hexDark": "",
+    "rgb": "rgb(35, 168, 165)",
+    "hsl": "hsl(179, 66%, 40%)"
+  },
+  {
+    "level": "80",
+    "variable": "Cyan/80",
+    "hex": "",
+    "hexDark": "#00807D",
+    "rgb": "rgb(0, 128, 125)",
+    "hsl": "hsl(179, 100%, 25%)"
+  },
+  {
+    "level": "90",
+    "variable": "Cyan/90",
+    "hex": "#067A77",
+    "hexDark": "",
+    "rgb": "rgb(6, 122, 119)",
+    "hsl": "hsl(178, 91%, 25%)"
+  },
+  {
+    "level": "alpha (10%)",
+    "variable": "Cyan/alpha",
+    "hex": "#23A8A51A",
+    "hexDark": "#0DADAA4D",
+    "rgb": "rgb(35, 168, 165)",
+    "hsl": "hsl(179, 66%, 40%)"
+  }
+];
+
+export default paletteCyan;
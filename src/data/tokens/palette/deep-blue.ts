@@ -0,0 +1,69 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const paletteDeepBlue = [
+  {
+    "level": "20",
+    "variable": "DeepBlue/20",
+    "hex": "#E4EAF9",
+    "hexDark": "#1A2741",
+    "rgb": "rgb(228, 234, 249)",
+    "hsl": "hsl(223, 64%, 94%)"
+  },
+  {
+    "level": "30",
+    "variable": "DeepBlue/30",
+    "hex": "#CFDCFA",
+    "hexDark": "#273F6B",
+    "rgb": "rgb(207, 220, 250)",
+    "hsl": "hsl(222, 81%, 90%)"
+  },
+  {
+    "level": "50",
+    "variable": "DeepBlue/50",
+    "hex": "#7299EB",
+    "hexDark": "#8BABF0",
+    "rgb": "rgb(114, 153, 235)",
+    "hsl": "hsl(221, 75%, 68%)"
+  },
+  {
+    "level": "60",
+    "variable": "DeepBlue/60",
+    "hex": "",
+    "hexDark": "#6E9AEF",
+    "rgb": "rgb(110, 154, 239)",
+    "hsl": "hsl(220, 80%, 68%)"
+  },
+  {
+    "level": "70",
+    "variable": "DeepBlue/70",
+    "hex": "#3E6AC8",
+    "hexDark": "",
+    "rgb": "rgb(62, 106, 200)",
+    "hsl": "hsl(221, 56%, 51%)"
+  },
+  {
+    "level": "80",
+    "variable": "DeepBlue/80",
+    "hex": "",
+    "hexDark": "#4470C0",
+    "rgb": "rgb(68, 112, 192)",
+    "hsl": "hsl(219, 50%, 51%)"
+  },
+  {
+    "level": "90",
+    "variable": "DeepBlue/90",
+    "hex": "#385BA3",
+    "hexDark": "",
+    "rgb": "rgb(56, 91, 163)",
+    "hsl": "hsl(220, 49%, 43%)"
+  },
+  {
+    "level": "alpha (10%)",
+    "variable": "DeepBlue/alpha",
+    "hex": "#3E6AC81A",
+    "hexDark": "#6E9AEF4D",
+    "rgb": "rgb(62, 106, 200)",
+    "hsl": "hsl(221, 56%, 51%)"
+  }
+];
+
+export default paletteDeepBlue;
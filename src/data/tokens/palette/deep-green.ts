@@ -0,0 +1,69 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const paletteDeepGreen = [
+  {
+    "level": "20",
+    "variable": "DeepGreen/20",
+    "hex": "#E8F2D9",
+    "hexDark": "#202C0B",
+    "rgb": "rgb(232, 242, 217)",
+    "hsl": "hsl(84, 49%, 90%)"
+  },
+  {
+    "level": "30",
+    "variable": "DeepGreen/30",
+    "hex": "#C5E295",
+    "hexDark": "#304706",
+    "rgb": "rgb(197, 226, 149)",
+    "hsl": "hsl(83, 57%, 74%)"
+  },
+  {
+    "level": "50",
+    "variable": "DeepGreen/50",
+    "hex": "#8DBF3F",
+    "hexDark": "#8DB947",
+    "rgb": "rgb(141, 191, 63)",
+    "hsl": "hsl(83, 50%, 50%)"
+  },
+  {
+    "level": "60",
+    "variable": "DeepGreen/60",
+    "hex": "",
+    "hexDark": "#78A91C",
+    "rgb": "rgb(120, 169, 28)",
+    "hsl": "hsl(81, 72%, 39%)"
+  },
+  {
+    "level": "70",
+    "variable": "DeepGreen/70",
+    "hex": "#64931A",
+    "hexDark": "",
+    "rgb": "rgb(100, 147, 26)",
+    "hsl": "hsl(83, 70%, 34%)"
+  },
+  {
+    "level": "80",
+    "variable": "DeepGreen/80",
+    "hex": "",
+    "hexDark": "#567D05",
+    "rgb": "rgb(86, 125, 5)",
+    "hsl": "hsl(79, 92%, 25%)"
+  },
+  {
+    "level": "90",
+    "variable": "DeepGreen/90",
+    "hex": "#42660B",
+    "hexDark": "",
+    "rgb": "rgb(66, 102, 11)",
+    "hsl": "hsl(84, 81%, 22%)"
+  },
+  {
+    "level": "alpha (10%)",
+    "variable": "DeepGreen/alpha",
+    "hex": "#64931A1A",
+    "hexDark": "#78A91C33",
+    "rgb": "rgb(100, 147, 26)",
+    "hsl": "hsl(83, 70%, 34%)"
+  }
+];
+
+export default paletteDeepGreen;
@@ -0,0 +1,93 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const paletteGray = [
+  {
+    "level": "white",
+    "variable": "Gray/white",
+    "hex": "#FFFFFF",
+    "hexDark": "#17191C",
+    "rgb": "rgb(255, 255, 255)",
+    "hsl": "hsl(0, 0%, 100%)"
+  },
+  {
+    "level": "10",
+    "variable": "Gray/10",
+    "hex": "#F6F8FA",
+    "hexDark": "#1D2026",
+    "rgb": "rgb(246, 248, 250)",
+    "hsl": "hsl(210, 29%, 97%)"
+  },
+  {
+    "level": "20",
+    "variable": "Gray/20",
+    "hex": "#E9ECEF",
+    "hexDark": "#212833",
+    "rgb": "rgb(233, 236, 239)",
+    "hsl": "hsl(210, 16%, 93%)"
+  },
+  {
+    "level": "30",
+    "variable": "Gray/30",
+    "hex": "#D1D6DB",
+    "hexDark": "#2E3848",
+    "rgb": "rgb(209, 214, 219)",
+    "hsl": "hsl(210, 12%, 84%)"
+  },
+  {
+    "level": "40",
+    "variable": "Gray/40",
+    "hex": "#B5BBC2",
+    "hexDark": "#B5BBC2",
+    "rgb": "rgb(181, 187, 194)",
+    "hsl": "hsl(212, 10%, 74%)"
+  },
+  {
+    "level": "50",
+    "variable": "Gray/50",
+    "hex": "#979DA8",
+    "hexDark": "#979DA8",
+    "rgb": "rgb(151, 157, 168)",
+    "hsl": "hsl(219, 9%, 63%)"
+  },
+  {
+    "level": "60",
+    "variable": "Gray/60",
+    "hex": "#717985",
+    "hexDark": "#717985",
+    "rgb": "rgb(113, 121, 133)",
+    "hsl": "hsl(216, 8%, 48%)"
+  },
+  {
+    "level": "70",
+    "variable": "Gray/70",
+    "hex": "#57606F",
+    "hexDark": "#57606F",
+    "rgb": "rgb(87, 96, 111)",
+    "hsl": "hsl(218, 12%, 39%)"
+  },
+  {
+    "level": "80",
+    "variable": "Gray/80",
+    "hex": "#424C5E",
+    "hexDark": "#424C5E",
+    "rgb": "rgb(66, 76, 94)",
+    "hsl": "hsl(219, 18%, 31%)"
+  },
+  {
+    "level": "90",
+    "variable": "Gray/90",
+    "hex": "#313B48",
+    "hexDark": "#374352",
+    "rgb": "rgb(49, 59, 72)",
+    "hsl": "hsl(214, 19%, 24%)"
+  },
+  {
+    "level": "100",
+    "variable": "Gray/100",
+    "hex": "#252D38",
+    "hexDark": "#F0F0F0",
+    "rgb": "rgb(37, 45, 56)",
+    "hsl": "hsl(215, 20%, 18%)"
+  }
+];
+
+export default paletteGray;
@@ -0,0 +1,93 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const paletteGreen = [
+  {
+    "level": "10",
+    "variable": "Green/10",
+    "hex": "#EAF9F1",
+    "hexDark": "#202920",
+    "rgb": "rgb(234, 249, 241)",
+    "hsl": "hsl(148, 56%, 95%)"
+  },
+  {
+    "level": "20",
+    "variable": "Green/20",
+    "hex": "#DCF5E8",
+    "hexDark": "#103723",
+    "rgb": "rgb(220, 245, 232)",
+    "hsl": "hsl(149, 56%, 91%)"
+  },
+  {
+    "level": "30",
+    "variable": "Green/30",
+    "hex": "#B6E8CF",
+    "hexDark": "#9AE3BE",
+    "rgb": "rgb(182, 232, 207)",
+    "hsl": "hsl(150, 52%, 81%)"
+  },
+  {
+    "level": "40",
+    "variable": "Green/40",
+    "hex": "#86DEB0",
+    "hexDark": "#74D4A1",
+    "rgb": "rgb(134, 222, 176)",
+    "hsl": "hsl(149, 57%, 70%)"
+  },
+  {
+    "level": "50",
+    "variable": "Green/50",
+    "hex": "#45CE85",
+    "hexDark": "#4AC686",
+    "rgb": "rgb(69, 206, 133)",
+    "hsl": "hsl(148, 58%, 54%)"
+  },
+  {
+    "level": "60",
+    "variable": "Green/60",
+    "hex": "#05C072",
+    "hexDark": "#00BE6F",
+    "rgb": "rgb(5, 192, 114)",
+    "hsl": "hsl(155, 95%, 39%)"
+  },
+  {
+    "level": "70",
+    "variable": "Green/70",
+    "hex": "#139F56",
+    "hexDark": "#00A660",
+    "rgb": "rgb(19, 159, 86)",
+    "hsl": "hsl(149, 79%, 35%)"
+  },
+  {
+    "level": "80",
+    "variable": "Green/80",
+    "hex": "#0C8346",
+    "hexDark": "#00954F",
+    "rgb": "rgb(12, 131, 70)",
+    "hsl": "hsl(149, 83%, 28%)"
+  },
+  {
+    "level": "90",
+    "variable": "Green/90",
+    "hex": "#085B32",
+    "hexDark": "#117E46",
+    "rgb": "rgb(8, 91, 50)",
+    "hsl": "hsl(150, 84%, 19%)"
+  },
+  {
+    "level": "100",
+    "variable": "Green/100",
+    "hex": "#053E20",
+    "hexDark": "#C1FADC",
+    "rgb": "rgb(5, 62, 32)",
+    "hsl": "hsl(148, 85%, 13%)"
+  },
+  {
+    "level": "alpha (10%)",
+    "variable": "Green/alpha",
+    "hex": "#05C0721A",
+    "hexDark": "#00BE6F33",
+    "rgb": "rgb(5, 192, 114)",
+    "hsl": "hsl(155, 95%, 39%)"
+  }
+];
+
+export default paletteGreen;
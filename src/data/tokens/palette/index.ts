@@ -0,0 +1,34 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+import paletteDeepGreen from './deep-green';
+import paletteRed from './red';
+import paletteBlue from './blue';
+import palettePink from './pink';
+import paletteBlackAlpha from './black-alpha';
+import paletteCyan from './cyan';
+import paletteDeepBlue from './deep-blue';
+import palettePurple from './purple';
+import paletteCoolGray from './cool-gray';
+import paletteGreen from './green';
+import paletteGray from './gray';
+import paletteOrange from './orange';
+import paletteLightBlue from './light-blue';
+import paletteYellowOrange from './yellow-orange';
+
+const palette = {
+  "DeepGreen": paletteDeepGreen,
+  "Red": paletteRed,
+  "Blue": paletteBlue,
+  "Pink": palettePink,
+  "BlackAlpha": paletteBlackAlpha,
+  "Cyan": paletteCyan,
+  "DeepBlue": paletteDeepBlue,
+  "Purple": palettePurple,
+  "CoolGray": paletteCoolGray,
+  "Green": paletteGreen,
+  "Gray": paletteGray,
+  "Orange": paletteOrange,
+  "LightBlue": paletteLightBlue,
+  "YellowOrange": paletteYellowOrange,
+};
+
+export default palette;
@@ -0,0 +1,69 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const paletteLightBlue = [
+  {
+    "level": "20",
+    "variable": "LightBlue/20",
+    "hex": "#D9E7FF",
+    "hexDark": "#10274D",
+    "rgb": "rgb(217, 231, 255)",
+    "hsl": "hsl(218, 100%, 93%)"
+  },
+  {
+    "level": "30",
+    "variable": "LightBlue/30",
+    "hex": "#ABC7FD",
+    "hexDark": "#073E81",
+    "rgb": "rgb(171, 199, 253)",
+    "hsl": "hsl(220, 95%, 83%)"
+  },
+  {
+    "level": "50",
+    "variable": "LightBlue/50",
+    "hex": "#5E92F5",
+    "hexDark": "#7EABFF",
+    "rgb": "rgb(94, 146, 245)",
+    "hsl": "hsl(219, 88%, 66%)"
+  },
+  {
+    "level": "60",
+    "variable": "LightBlue/60",
+    "hex": "#3E80F4",
+    "hexDark": "#619AFE",
+    "rgb": "rgb(62, 128, 244)",
+    "hsl": "hsl(218, 89%, 60%)"
+  },
+  {
+    "level": "70",
+    "variable": "LightBlue/70",
+    "hex": "#2E6AE9",
+    "hexDark": "#4184EF",
+    "rgb": "rgb(46, 106, 233)",
+    "hsl": "hsl(221, 81%, 55%)"
+  },
+  {
+    "level": "80",
+    "variable": "LightBlue/80",
+    "hex": "",
+    "hexDark": "#006FE4",
+    "rgb": "rgb(0, 111, 228)",
+    "hsl": "hsl(211, 100%, 45%)"
+  },
+  {
+    "level": "90",
+    "variable": "LightBlue/90",
+    "hex": "#006FE4",
+    "hexDark": "",
+    "rgb": "rgb(0, 111, 228)",
+    "hsl": "hsl(211, 100%, 45%)"
+  },
+  {
+    "level": "alpha (10%)",
+    "variable": "LightBlue/alpha",
+    "hex": "#2E6AE91A",
+    "hexDark": "#619AFE4D",
+    "rgb": "rgb(46, 106, 233)",
+    "hsl": "hsl(221, 81%, 55%)"
+  }
+];
+
+export default paletteLightBlue;
@@ -0,0 +1,53 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const paletteOrange = [
+  {
+    "level": "20",
+    "variable": "Orange/20",
+    "hex": "#FEF0DE",
+    "hexDark": "#3D2100",
+    "rgb": "rgb(254, 240, 222)",
+    "hsl": "hsl(34, 94%, 93%)"
+  },
+  {
+    "level": "30",
+    "variable": "Orange/30",
+    "hex": "#FFD19A",
+    "hexDark": "#6C420C",
+    "rgb": "rgb(255, 209, 154)",
+    "hsl": "hsl(33, 100%, 80%)"
+  },
+  {
+    "level": "50",
+    "variable": "Orange/50",
+    "hex": "#FCAF5C",
+    "hexDark": "#ECAC68",
+    "rgb": "rgb(252, 175, 92)",
+    "hsl": "hsl(31, 96%, 67%)"
+  },
+  {
+    "level": "60",
+    "variable": "Orange/60",
+    "hex": "#FAA131",
+    "hexDark": "#E29438",
+    "rgb": "rgb(250, 161, 49)",
+    "hsl": "hsl(33, 95%, 59%)"
+  },
+  {
+    "level": "80",
+    "variable": "Orange/80",
+    "hex": "#EC8A0E",
+    "hexDark": "#BA7419",
+    "rgb": "rgb(236, 138, 14)",
+    "hsl": "hsl(34, 89%, 49%)"
+  },
+  {
+    "level": "alpha (10%)",
+    "variable": "Orange/alpha",
+    "hex": "#FAA1311A",
+    "hexDark": "#E2943866",
+    "rgb": "rgb(250, 161, 49)",
+    "hsl": "hsl(33, 95%, 59%)"
+  }
+];
+
+export default paletteOrange;
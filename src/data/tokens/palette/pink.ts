@@ -0,0 +1,69 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const palettePink = [
+  {
+    "level": "20",
+    "variable": "Pink/20",
+    "hex": "#FCE8ED",
+    "hexDark": "#431A26",
+    "rgb": "rgb(252, 232, 237)",
+    "hsl": "hsl(345, 77%, 95%)"
+  },
+  {
+    "level": "30",
+    "variable": "Pink/30",
+    "hex": "#F8B7C9",
+    "hexDark": "#771B3D",
+    "rgb": "rgb(248, 183, 201)",
+    "hsl": "hsl(343, 82%, 85%)"
+  },
+  {
+    "level": "50",
+    "variable": "Pink/50",
+    "hex": "#F083A2",
+    "hexDark": "#F48CA9",
+    "rgb": "rgb(240, 131, 162)",
+    "hsl": "hsl(343, 78%, 73%)"
+  },
+  {
+    "level": "60",
+    "variable": "Pink/60",
+    "hex": "",
+    "hexDark": "#EC7598",
+    "rgb": "rgb(236, 117, 152)",
+    "hsl": "hsl(342, 76%, 69%)"
+  },
+  {
+    "level": "70",
+    "variable": "Pink/70",
+    "hex": "#E9648A",
+    "hexDark": "",
+    "rgb": "rgb(233, 100, 138)",
+    "hsl": "hsl(343, 75%, 65%)"
+  },
+  {
+    "level": "80",
+    "variable": "Pink/80",
+    "hex": "",
+    "hexDark": "#BD496F",
+    "rgb": "rgb(189, 73, 111)",
+    "hsl": "hsl(340, 47%, 51%)"
+  },
+  {
+    "level": "90",
+    "variable": "Pink/90",
+    "hex": "#C74168",
+    "hexDark": "",
+    "rgb": "rgb(199, 65, 104)",
+    "hsl": "hsl(343, 54%, 52%)"
+  },
+  {
+    "level": "alpha (10%)",
+    "variable": "Pink/alpha",
+    "hex": "#E9648A1A",
+    "hexDark": "#EC75984D",
+    "rgb": "rgb(233, 100, 138)",
+    "hsl": "hsl(343, 75%, 65%)"
+  }
+];
+
+export default palettePink;
@@ -0,0 +1,69 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const palettePurple = [
+  {
+    "level": "20",
+    "variable": "Purple/20",
+    "hex": "#ECE8FF",
+    "hexDark": "#2E1B5D",
+    "rgb": "rgb(236, 232, 255)",
+    "hsl": "hsl(250, 100%, 95%)"
+  },
+  {
+    "level": "30",
+    "variable": "Purple/30",
+    "hex": "#CBB9FF",
+    "hexDark": "#492795",
+    "rgb": "rgb(203, 185, 255)",
+    "hsl": "hsl(255, 100%, 86%)"
+  },
+  {
+    "level": "50",
+    "variable": "Purple/50",
+    "hex": "#9B77FC",
+    "hexDark": "#B59CFA",
+    "rgb": "rgb(155, 119, 252)",
+    "hsl": "hsl(256, 96%, 73%)"
+  },
+  {
+    "level": "60",
+    "variable": "Purple/60",
+    "hex": "",
+    "hexDark": "#A787FF",
+    "rgb": "rgb(167, 135, 255)",
+    "hsl": "hsl(256, 100%, 76%)"
+  },
+  {
+    "level": "70",
+    "variable": "Purple/70",
+    "hex": "#8057EE",
+    "hexDark": "",
+    "rgb": "rgb(128, 87, 238)",
+    "hsl": "hsl(256, 82%, 64%)"
+  },
+  {
+    "level": "80",
+    "variable": "Purple/80",
+    "hex": "",
+    "hexDark": "#7E5BD7",
+    "rgb": "rgb(126, 91, 215)",
+    "hsl": "hsl(257, 61%, 60%)"
+  },
+  {
+    "level": "90",
+    "variable": "Purple/90",
+    "hex": "#5B3FCB",
+    "hexDark": "",
+    "rgb": "rgb(91, 63, 203)",
+    "hsl": "hsl(252, 57%, 52%)"
+  },
+  {
+    "level": "alpha (10%)",
+    "variable": "Purple/alpha",
+    "hex": "#8057EE1A",
+    "hexDark": "#A787FF4D",
+    "rgb": "rgb(128, 87, 238)",
+    "hsl": "hsl(256, 82%, 64%)"
+  }
+];
+
+export default palettePurple;
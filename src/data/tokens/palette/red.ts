@@ -0,0 +1,53 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const paletteRed = [
+  {
+    "level": "20",
+    "variable": "Red/20",
+    "hex": "#FEEAE7",
+    "hexDark": "#401E1A",
+    "rgb": "rgb(254, 234, 231)",
+    "hsl": "hsl(8, 92%, 95%)"
+  },
+  {
+    "level": "30",
+    "variable": "Red/30",
+    "hex": "#FFC1B9",
+    "hexDark": "#781F16",
+    "rgb": "rgb(255, 193, 185)",
+    "hsl": "hsl(7, 100%, 86%)"
+  },
+  {
+    "level": "50",
+    "variable": "Red/50",
+    "hex": "#F77E6E",
+    "hexDark": "#FF8A7A",
+    "rgb": "rgb(247, 126, 110)",
+    "hsl": "hsl(7, 90%, 70%)"
+  },
+  {
+    "level": "60",
+    "variable": "Red/60",
+    "hex": "#EF5E4B",
+    "hexDark": "#F47564",
+    "rgb": "rgb(239, 94, 75)",
+    "hsl": "hsl(7, 84%, 62%)"
+  },
+  {
+    "level": "80",
+    "variable": "Red/80",
+    "hex": "#D84936",
+    "hexDark": "#C34A3A",
+    "rgb": "rgb(216, 73, 54)",
+    "hsl": "hsl(7, 68%, 53%)"
+  },
+  {
+    "level": "alpha (10%)",
+    "variable": "Red/alpha",
+    "hex": "#EF5E4B1A",
+    "hexDark": "#F475644D",
+    "rgb": "rgb(239, 94, 75)",
+    "hsl": "hsl(7, 84%, 62%)"
+  }
+];
+
+export default paletteRed;
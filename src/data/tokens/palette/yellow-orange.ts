@@ -0,0 +1,69 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const paletteYellowOrange = [
+  {
+    "level": "20",
+    "variable": "YellowOrange/20",
+    "hex": "#FDF3D9",
+    "hexDark": "#362500",
+    "rgb": "rgb(253, 243, 217)",
+    "hsl": "hsl(43, 90%, 92%)"
+  },
+  {
+    "level": "30",
+    "variable": "YellowOrange/30",
+    "hex": "#FEE29F",
+    "hexDark": "#62470B",
+    "rgb": "rgb(254, 226, 159)",
+    "hsl": "hsl(42, 98%, 81%)"
+  },
+  {
+    "level": "50",
+    "variable": "YellowOrange/50",
+    "hex": "#F6C243",
+    "hexDark": "#E5B047",
+    "rgb": "rgb(246, 194, 67)",
+    "hsl": "hsl(43, 91%, 61%)"
+  },
+  {
+    "level": "60",
+    "variable": "YellowOrange/60",
+    "hex": "",
+    "hexDark": "#D59C19",
+    "rgb": "rgb(213, 156, 25)",
+    "hsl": "hsl(42, 79%, 47%)"
+  },
+  {
+    "level": "70",
+    "variable": "YellowOrange/70",
+    "hex": "#D49C13",
+    "hexDark": "",
+    "rgb": "rgb(212, 156, 19)",
+    "hsl": "hsl(43, 84%, 45%)"
+  },
+  {
+    "level": "80",
+    "variable": "YellowOrange/80",
+    "hex": "",
+    "hexDark": "#A97C19",
+    "rgb": "rgb(169, 124, 25)",
+    "hsl": "hsl(41, 74%, 38%)"
+  },
+  {
+    "level": "90",
+    "variable": "YellowOrange/90",
+    "hex": "#A6780B",
+    "hexDark": "",
+    "rgb": "rgb(166, 120, 11)",
+    "hsl": "hsl(42, 88%, 35%)"
+  },
+  {
+    "level": "alpha (10%)",
+    "variable": "YellowOrange/alpha",
+    "hex": "#D49C131A",
+    "hexDark": "#D59C194D",
+    "rgb": "rgb(212, 156, 19)",
+    "hsl": "hsl(43, 84%, 45%)"
+  }
+];
+
+export default paletteYellowOrange;
@@ -0,0 +1,45 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const semanticAvatarCoolGray = [
+  {
+    "devToken": "avatar.coolGray.text",
+    "designToken": "Color/avatar/cool gray/text",
+    "value": "avatar/coolGray/70"
+  },
+  {
+    "devToken": "avatar.coolGray.text_inverse",
+    "designToken": "Color/avatar/cool gray/text-inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "avatar.coolGray.icon",
+    "designToken": "Color/avatar/cool gray/icon",
+    "value": "avatar/coolGray/50"
+  },
+  {
+    "devToken": "avatar.coolGray.icon_inverse",
+    "designToken": "Color/avatar/cool gray/icon-inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "avatar.coolGray.bg",
+    "designToken": "Color/avatar/cool gray/bg",
+    "value": "avatar/coolGray/20"
+  },
+  {
+    "devToken": "avatar.coolGray.bg_bold",
+    "designToken": "Color/avatar/cool gray/bg-bold",
+    "value": "avatar/coolGray/30"
+  },
+  {
+    "devToken": "avatar.coolGray.border",
+    "designToken": "Color/avatar/cool gray/border",
+    "value": "avatar/coolGray/alpha"
+  },
+  {
+    "devToken": "avatar.coolGray.border_black",
+    "designToken": "Color/avatar/cool gray/border-black",
+    "value": "avatar/blackAlpha/10"
+  }
+];
+
+export default semanticAvatarCoolGray;
@@ -0,0 +1,45 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const semanticAvatarCyan = [
+  {
+    "devToken": "avatar.cyan.text",
+    "designToken": "Color/avatar/cyan/text",
+    "value": "avatar/cyan/70"
+  },
+  {
+    "devToken": "avatar.cyan.text_inverse",
+    "designToken": "Color/avatar/cyan/text-inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "avatar.cyan.icon",
+    "designToken": "Color/avatar/cyan/icon",
+    "value": "avatar/cyan/50"
+  },
+  {
+    "devToken": "avatar.cyan.icon_inverse",
+    "designToken": "Color/avatar/cyan/icon-inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "avatar.cyan.bg",
+    "designToken": "Color/avatar/cyan/bg",
+    "value": "avatar/cyan/20"
+  },
+  {
+    "devToken": "avatar.cyan.bg_bold",
+    "designToken": "Color/avatar/cyan/bg-bold",
+    "value": "avatar/cyan/50"
+  },
+  {
+    "devToken": "avatar.cyan.border",
+    "designToken": "Color/avatar/cyan/border",
+    "value": "avatar/cyan/alpha"
+  },
+  {
+    "devToken": "avatar.cyan.border_black",
+    "designToken": "Color/avatar/cyan/border-black",
+    "value": "avatar/blackAlpha/10"
+  }
+];
+
+export default semanticAvatarCyan;
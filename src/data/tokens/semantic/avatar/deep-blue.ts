@@ -0,0 +1,45 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const semanticAvatarDeepBlue = [
+  {
+    "devToken": "avatar.deepBlue.text",
+    "designToken": "Color/avatar/deep blue/text",
+    "value": "avatar/deepBlue/70"
+  },
+  {
+    "devToken": "avatar.deepBlue.text_inverse",
+    "designToken": "Color/avatar/deep blue/text-inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "avatar.deepBlue.icon",
+    "designToken": "Color/avatar/deep blue/icon",
+    "value": "avatar/deepBlue/70"
+  },
+  {
+    "devToken": "avatar.deepBlue.icon_inverse",
+    "designToken": "Color/avatar/deep blue/icon-inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "avatar.deepBlue.bg",
+    "designToken": "Color/avatar/deep blue/bg",
+    "value": "avatar/deepBlue/20"
+  },
+  {
+    "devToken": "avatar.deepBlue.bg_bold",
+    "designToken": "Color/avatar/deep blue/bg-bold",
+    "value": "avatar/deepBlue/70"
+  },
+  {
+    "devToken": "avatar.deepBlue.border",
+    "designToken": "Color/avatar/deep blue/border",
+    "value": "avatar/deepBlue/alpha"
+  },
+  {
+    "devToken": "avatar.deepBlue.border_black",
+    "designToken": "Color/avatar/deep blue/border-black",
+    "value": "avatar/blackAlpha/10"
+  }
+];
+
+export default semanticAvatarDeepBlue;
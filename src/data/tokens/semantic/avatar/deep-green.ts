@@ -0,0 +1,45 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const semanticAvatarDeepGreen = [
+  {
+    "devToken": "avatar.deepGreen.text",
+    "designToken": "Color/avatar/deep green/text",
+    "value": "avatar/deepGreen/70"
+  },
+  {
+    "devToken": "avatar.deepGreen.text_inverse",
+    "designToken": "Color/avatar/deep green/text-inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "avatar.deepGreen.icon",
+    "designToken": "Color/avatar/deep green/icon",
+    "value": "avatar/deepGreen/50"
+  },
+  {
+    "devToken": "avatar.deepGreen.icon_inverse",
+    "designToken": "Color/avatar/deep green/icon-inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "avatar.deepGreen.bg",
+    "designToken": "Color/avatar/deep green/bg",
+    "value": "avatar/deepGreen/20"
+  },
+  {
+    "devToken": "avatar.deepGreen.bg_bold",
+    "designToken": "Color/avatar/deep green/bg-bold",
+    "value": "avatar/deepGreen/50"
+  },
+  {
+    "devToken": "avatar.deepGreen.border",
+    "designToken": "Color/avatar/deep green/border",
+    "value": "avatar/deepGreen/alpha"
+  },
+  {
+    "devToken": "avatar.deepGreen.border_black",
+    "designToken": "Color/avatar/deep green/border-black",
+    "value": "avatar/blackAlpha/10"
+  }
+];
+
+export default semanticAvatarDeepGreen;
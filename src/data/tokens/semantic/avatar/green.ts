@@ -0,0 +1,50 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const semanticAvatarGreen = [
+  {
+    "devToken": "avatar.green.text",
+    "designToken": "Color/avatar/green/text",
+    "value": "avatar/green/60"
+  },
+  {
+    "devToken": "avatar.green.text_inverse",
+    "designToken": "Color/avatar/green/text-inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "avatar.green.icon",
+    "designToken": "Color/avatar/green/icon",
+    "value": "avatar/green/50"
+  },
+  {
+    "devToken": "avatar.green.icon_docu",
+    "designToken": "Color/avatar/green/icon-docu",
+    "value": "avatar/green/60"
+  },
+  {
+    "devToken": "avatar.green.icon_inverse",
+    "designToken": "Color/avatar/green/icon-inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "avatar.green.bg",
+    "designToken": "Color/avatar/green/bg",
+    "value": "avatar/green/20"
+  },
+  {
+    "devToken": "avatar.green.bg_bold",
+    "designToken": "Color/avatar/green/bg-bold",
+    "value": "avatar/green/50"
+  },
+  {
+    "devToken": "avatar.green.border",
+    "designToken": "Color/avatar/green/border",
+    "value": "avatar/green/alpha"
+  },
+  {
+    "devToken": "avatar.green.border_black",
+    "designToken": "Color/avatar/green/border-black",
+    "value": "avatar/blackAlpha/10"
+  }
+];
+
+export default semanticAvatarGreen;
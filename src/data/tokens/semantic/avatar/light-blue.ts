@@ -0,0 +1,50 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const semanticAvatarLightBlue = [
+  {
+    "devToken": "avatar.lightBlue.text",
+    "designToken": "Color/avatar/light blue/text",
+    "value": "avatar/lightBlue/70"
+  },
+  {
+    "devToken": "avatar.lightBlue.text_inverse",
+    "designToken": "Color/avatar/light blue/text-inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "avatar.lightBlue.icon",
+    "designToken": "Color/avatar/light blue/icon",
+    "value": "avatar/lightBlue/50"
+  },
+  {
+    "devToken": "avatar.lightBlue.icon_docu",
+    "designToken": "Color/avatar/light blue/icon-docu",
+    "value": "avatar/lightBlue/60"
+  },
+  {
+    "devToken": "avatar.lightBlue.icon_inverse",
+    "designToken": "Color/avatar/light blue/icon-inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "avatar.lightBlue.bg",
+    "designToken": "Color/avatar/light blue/bg",
+    "value": "avatar/lightBlue/20"
+  },
+  {
+    "devToken": "avatar.lightBlue.bg_bold",
+    "designToken": "Color/avatar/light blue/bg-bold",
+    "value": "avatar/lightBlue/50"
+  },
+  {
+    "devToken": "avatar.lightBlue.border",
+    "designToken": "Color/avatar/light blue/border",
+    "value": "avatar/lightBlue/alpha"
+  },
+  {
+    "devToken": "avatar.lightBlue.border_black",
+    "designToken": "Color/avatar/light blue/border-black",
+    "value": "avatar/blackAlpha/10"
+  }
+];
+
+export default semanticAvatarLightBlue;
@@ -0,0 +1,45 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const semanticAvatarOrange = [
+  {
+    "devToken": "avatar.orange.text",
+    "designToken": "Color/avatar/orange/text",
+    "value": "avatar/orange/60"
+  },
+  {
+    "devToken": "avatar.orange.text_inverse",
+    "designToken": "Color/avatar/orange/text-inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "avatar.orange.icon",
+    "designToken": "Color/avatar/orange/icon",
+    "value": "avatar/orange/50"
+  },
+  {
+    "devToken": "avatar.orange.icon_inverse",
+    "designToken": "Color/avatar/orange/icon-inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "avatar.orange.bg",
+    "designToken": "Color/avatar/orange/bg",
+    "value": "avatar/orange/20"
+  },
+  {
+    "devToken": "avatar.orange.bg_bold",
+    "designToken": "Color/avatar/orange/bg-bold",
+    "value": "avatar/orange/50"
+  },
+  {
+    "devToken": "avatar.orange.border",
+    "designToken": "Color/avatar/orange/border",
+    "value": "avatar/orange/alpha"
+  },
+  {
+    "devToken": "avatar.orange.border_black",
+    "designToken": "Color/avatar/orange/border-black",
+    "value": "avatar/blackAlpha/10"
+  }
+];
+
+export default semanticAvatarOrange;
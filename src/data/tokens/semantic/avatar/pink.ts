@@ -0,0 +1,45 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const semanticAvatarPink = [
+  {
+    "devToken": "avatar.pink.text",
+    "designToken": "Color/avatar/pink/text",
+    "value": "avatar/pink/70"
+  },
+  {
+    "devToken": "avatar.pink.text_inverse",
+    "designToken": "Color/avatar/pink/text-inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "avatar.pink.icon",
+    "designToken": "Color/avatar/pink/icon",
+    "value": "avatar/pink/50"
+  },
+  {
+    "devToken": "avatar.pink.icon_inverse",
+    "designToken": "Color/avatar/pink/icon-inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "avatar.pink.bg",
+    "designToken": "Color/avatar/pink/bg",
+    "value": "avatar/pink/20"
+  },
+  {
+    "devToken": "avatar.pink.bg_bold",
+    "designToken": "Color/avatar/pink/bg-bold",
+    "value": "avatar/pink/70"
+  },
+  {
+    "devToken": "avatar.pink.border",
+    "designToken": "Color/avatar/pink/border",
+    "value": "avatar/pink/alpha"
+  },
+  {
+    "devToken": "avatar.pink.border_black",
+    "designToken": "Color/avatar/pink/border-black",
+    "value": "avatar/blackAlpha/10"
+  }
+];
+
+export default semanticAvatarPink;
@@ -0,0 +1,45 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const semanticAvatarPurple = [
+  {
+    "devToken": "avatar.purple.text",
+    "designToken": "Color/avatar/purple/text",
+    "value": "avatar/purple/70"
+  },
+  {
+    "devToken": "avatar.purple.text_inverse",
+    "designToken": "Color/avatar/purple/text-inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "avatar.purple.icon",
+    "designToken": "Color/avatar/purple/icon",
+    "value": "avatar/purple/50"
+  },
+  {
+    "devToken": "avatar.purple.icon_inverse",
+    "designToken": "Color/avatar/purple/icon-inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "avatar.purple.bg",
+    "designToken": "Color/avatar/purple/bg",
+    "value": "avatar/purple/20"
+  },
+  {
+    "devToken": "avatar.purple.bg_bold",
+    "designToken": "Color/avatar/purple/bg-bold",
+    "value": "avatar/purple/50"
+  },
+  {
+    "devToken": "avatar.purple.border",
+    "designToken": "Color/avatar/purple/border",
+    "value": "avatar/purple/alpha"
+  },
+  {
+    "devToken": "avatar.purple.border_black",
+    "designToken": "Color/avatar/purple/border-black",
+    "value": "avatar/blackAlpha/10"
+  }
+];
+
+export default semanticAvatarPurple;
@@ -0,0 +1,45 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const semanticAvatarRed = [
+  {
+    "devToken": "avatar.red.text",
+    "designToken": "Color/avatar/red/text",
+    "value": "avatar/red/60"
+  },
+  {
+    "devToken": "avatar.red.text_inverse",
+    "designToken": "Color/avatar/red/text-inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "avatar.red.icon",
+    "designToken": "Color/avatar/red/icon",
+    "value": "avatar/red/50"
+  },
+  {
+    "devToken": "avatar.red.icon_inverse",
+    "designToken": "Color/avatar/red/icon-inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "avatar.red.bg",
+    "designToken": "Color/avatar/red/bg",
+    "value": "avatar/red/20"
+  },
+  {
+    "devToken": "avatar.red.bg_bold",
+    "designToken": "Color/avatar/red/bg-bold",
+    "value": "avatar/red/50"
+  },
+  {
+    "devToken": "avatar.red.border",
+    "designToken": "Color/avatar/red/border",
+    "value": "avatar/red/alpha"
+  },
+  {
+    "devToken": "avatar.red.border_black",
+    "designToken": "Color/avatar/red/border-black",
+    "value": "avatar/blackAlpha/10"
+  }
+];
+
+export default semanticAvatarRed;
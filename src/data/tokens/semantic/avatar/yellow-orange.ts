@@ -0,0 +1,45 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const semanticAvatarYellowOrange = [
+  {
+    "devToken": "avatar.yellowOrange.text",
+    "designToken": "Color/avatar/yellow orange/text",
+    "value": "avatar/yellowOrange/70"
+  },
+  {
+    "devToken": "avatar.yellowOrange.text_inverse",
+    "designToken": "Color/avatar/yellow orange/text-inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "avatar.yellowOrange.icon",
+    "designToken": "Color/avatar/yellow orange/icon",
+    "value": "avatar/yellowOrange/50"
+  },
+  {
+    "devToken": "avatar.yellowOrange.icon_inverse",
+    "designToken": "Color/avatar/yellow orange/icon-inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "avatar.yellowOrange.bg",
+    "designToken": "Color/avatar/yellow orange/bg",
+    "value": "avatar/yellowOrange/20"
+  },
+  {
+    "devToken": "avatar.yellowOrange.bg_bold",
+    "designToken": "Color/avatar/yellow orange/bg-bold",
+    "value": "avatar/yellowOrange/50"
+  },
+  {
+    "devToken": "avatar.yellowOrange.border",
+    "designToken": "Color/avatar/yellow orange/border",
+    "value": "avatar/yellowOrange/alpha"
+  },
+  {
+    "devToken": "avatar.yellowOrange.border_black",
+    "designToken": "Color/avatar/yellow orange/border-black",
+    "value": "avatar/blackAlpha/10"
+  }
+];
+
+export default semanticAvatarYellowOrange;
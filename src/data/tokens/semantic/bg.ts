@@ -0,0 +1,170 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const semanticBg = [
+  {
+    "devToken": "bg.primary",
+    "designToken": "Color/bg/primary",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "bg.secondary",
+    "designToken": "Color/bg/secondary",
+    "value": "neutral/10"
+  },
+  {
+    "devToken": "bg.tertiary",
+    "designToken": "Color/bg/tertiary",
+    "value": "neutral/20"
+  },
+  {
+    "devToken": "bg.strong",
+    "designToken": "Color/bg/strong",
+    "value": "CoolGray/70"
+  },
+  {
+    "devToken": "bg.tooltip",
+    "designToken": "Color/bg/tooltip",
+    "value": "CoolGray/90"
+  },
+  {
+    "devToken": "bg.brand",
+    "designToken": "Color/bg/brand",
+    "value": "brand/60"
+  },
+  {
+    "devToken": "bg.error",
+    "designToken": "Color/bg/error",
+    "value": "error/60"
+  },
+  {
+    "devToken": "bg.error_disabled",
+    "designToken": "Color/bg/error_disabled",
+    "value": "error/20"
+  },
+  {
+    "devToken": "bg.success",
+    "designToken": "Color/bg/success",
+    "value": "success/60"
+  },
+  {
+    "devToken": "bg.success_disabled",
+    "designToken": "Color/bg/success_disabled",
+    "value": "success/20"
+  },
+  {
+    "devToken": "bg.loading",
+    "designToken": "Color/bg/loading",
+    "value": "loading/60"
+  },
+  {
+    "devToken": "bg.loading_disabled",
+    "designToken": "Color/bg/loading_disabled",
+    "value": "loading/20"
+  },
+  {
+    "devToken": "bg.interactive.primary",
+    "designToken": "Color/bg/interactive/primary",
+    "value": "neutral/20"
+  },
+  {
+    "devToken": "bg.interactive.primary_hover",
+    "designToken": "Color/bg/interactive/primary-hover",
+    "value": "neutral/30"
+  },
+  {
+    "devToken": "bg.interactive.primary_disabled",
+    "designToken": "Color/bg/interactive/primary-disabled",
+    "value": "neutral/20"
+  },
+  {
+    "devToken": "bg.interactive.secondary",
+    "designToken": "Color/bg/interactive/secondary",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "bg.interactive.secondary_hover",
+    "designToken": "Color/bg/interactive/secondary-hover",
+    "value": "neutral/20"
+  },
+  {
+    "devToken": "bg.interactive.secondary_disabled",
+    "designToken": "Color/bg/interactive/secondary-disabled",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "bg.interactive.tertiary",
+    "designToken": "Color/bg/interactive/tertiary",
+    "value": "neutral/10"
+  },
+  {
+    "devToken": "bg.interactive.brand",
+    "designToken": "Color/bg/interactive/brand",
+    "value": "brand/60"
+  },
+  {
+    "devToken": "bg.interactive.brand_hover",
+    "designToken": "Color/bg/interactive/brand-hover",
+    "value": "brand/70"
+  },
+  {
+    "devToken": "bg.interactive.brand_disabled",
+    "designToken": "Color/bg/interactive/brand-disabled",
+    "value": "brand/30"
+  },
+  {
+    "devToken": "bg.interactive.brand_secondary",
+    "designToken": "Color/bg/interactive/brand-secondary",
+    "value": "brand/10"
+  },
+  {
+    "devToken": "bg.interactive.brand_secondary_hover",
+    "designToken": "Color/bg/interactive/brand-secondary-hover",
+    "value": "brand/30"
+  },
+  {
+    "devToken": "bg.interactive.selected",
+    "designToken": "Color/bg/interactive/selected",
+    "value": "brand/10"
+  },
+  {
+    "devToken": "bg.interactive.error",
+    "designToken": "Color/bg/interactive/error",
+    "value": "error/20"
+  },
+  {
+    "devToken": "bg.interactive.error_hovered",
+    "designToken": "Color/bg/interactive/error-hovered",
+    "value": "error/60"
+  },
+  {
+    "devToken": "bg.interactive.error_disabled",
+    "designToken": "Color/bg/interactive/error-disabled",
+    "value": "error/20"
+  },
+  {
+    "devToken": "bg.interactive.error_popup",
+    "designToken": "Color/bg/interactive/error-popup",
+    "value": "error/60"
+  },
+  {
+    "devToken": "bg.interactive.error_popup_hovered",
+    "designToken": "Color/bg/interactive/error-popup-hovered",
+    "value": "error/80"
+  },
+  {
+    "devToken": "bg.interactive.error_popup_disabled",
+    "designToken": "Color/bg/interactive/error-popup-disabled",
+    "value": "error/20"
+  },
+  {
+    "devToken": "bg.interactive.toggle_on",
+    "designToken": "Color/bg/interactive/toggle-on",
+    "value": "brand/60"
+  },
+  {
+    "devToken": "bg.interactive.toggle_off",
+    "designToken": "Color/bg/interactive/toggle-off",
+    "value": "neutral/60"
+  }
+];
+
+export default semanticBg;
@@ -0,0 +1,60 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const semanticBorder = [
+  {
+    "devToken": "border.primary",
+    "designToken": "Color/border/primary",
+    "value": "neutral/20"
+  },
+  {
+    "devToken": "border.secondary",
+    "designToken": "Color/border/secondary",
+    "value": "neutral/30"
+  },
+  {
+    "devToken": "border.tertiary",
+    "designToken": "Color/border/tertiary",
+    "value": "neutral/10"
+  },
+  {
+    "devToken": "border.info",
+    "designToken": "Color/border/info",
+    "value": "neutral/40"
+  },
+  {
+    "devToken": "border.inverse",
+    "designToken": "Color/border/inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "border.interactive.input",
+    "designToken": "Color/border/interactive/input",
+    "value": "neutral/30"
+  },
+  {
+    "devToken": "border.interactive.input_hover",
+    "designToken": "Color/border/interactive/input-hover",
+    "value": "neutral/40"
+  },
+  {
+    "devToken": "border.interactive.card",
+    "designToken": "Color/border/interactive/card",
+    "value": "neutral/20"
+  },
+  {
+    "devToken": "border.interactive.popup",
+    "designToken": "Color/border/interactive/popup",
+    "value": "neutral/20"
+  },
+  {
+    "devToken": "border.interactive.selected",
+    "designToken": "Color/border/interactive/selected",
+    "value": "brand/60"
+  },
+  {
+    "devToken": "border.interactive.error",
+    "designToken": "Color/border/interactive/error",
+    "value": "error/60"
+  }
+];
+
+export default semanticBorder;
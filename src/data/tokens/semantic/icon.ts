@@ -0,0 +1,95 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const semanticIcon = [
+  {
+    "devToken": "icon.primary",
+    "designToken": "Color/icon/primary",
+    "value": "neutral/100"
+  },
+  {
+    "devToken": "icon.brand",
+    "designToken": "Color/icon/brand",
+    "value": "brand/60"
+  },
+  {
+    "devToken": "icon.error",
+    "designToken": "Color/icon/error",
+    "value": "error/60"
+  },
+  {
+    "devToken": "icon.success",
+    "designToken": "Color/icon/success",
+    "value": "success/60"
+  },
+  {
+    "devToken": "icon.loading",
+    "designToken": "Color/icon/loading",
+    "value": "loading/60"
+  },
+  {
+    "devToken": "icon.info",
+    "designToken": "Color/icon/info",
+    "value": "neutral/40"
+  },
+  {
+    "devToken": "icon.inverse",
+    "designToken": "Color/icon/inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "icon.interactive.primary",
+    "designToken": "Color/icon/interactive/primary",
+    "value": "neutral/100"
+  },
+  {
+    "devToken": "icon.interactive.primary_disabled",
+    "designToken": "Color/icon/interactive/primary-disabled",
+    "value": "neutral/30"
+  },
+  {
+    "devToken": "icon.interactive.secondary",
+    "designToken": "Color/icon/interactive/secondary",
+    "value": "neutral/40"
+  },
+  {
+    "devToken": "icon.interactive.secondary_disabled",
+    "designToken": "Color/icon/interactive/secondary-disabled",
+    "value": "neutral/30"
+  },
+  {
+    "devToken": "icon.interactive.tertiary",
+    "designToken": "Color/icon/interactive/tertiary",
+    "value": "neutral/60"
+  },
+  {
+    "devToken": "icon.interactive.brand",
+    "designToken": "Color/icon/interactive/brand",
+    "value": "brand/60"
+  },
+  {
+    "devToken": "icon.interactive.brand_hovered",
+    "designToken": "Color/icon/interactive/brand-hovered",
+    "value": "brand/70"
+  },
+  {
+    "devToken": "icon.interactive.brand_disabled",
+    "designToken": "Color/icon/interactive/brand-disabled",
+    "value": "brand/30"
+  },
+  {
+    "devToken": "icon.interactive.error",
+    "designToken": "Color/icon/interactive/error",
+    "value": "error/60"
+  },
+  {
+    "devToken": "icon.interactive.selected",
+    "designToken": "Color/icon/interactive/selected",
+    "value": "brand/60"
+  },
+  {
+    "devToken": "icon.interactive.inverse",
+    "designToken": "Color/icon/interactive/inverse",
+    "value": "neutral/white"
+  }
+];
+
+export default semanticIcon;
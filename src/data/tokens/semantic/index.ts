@@ -0,0 +1,26 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+import semanticText from './text';
+import semanticIcon from './icon';
+import semanticBg from './bg';
+import semanticBorder from './border';
+import semanticAvatarRed from './avatar/red';
+import semanticAvatarOrange from './avatar/orange';
+import semanticAvatarYellowOrange from './avatar/yellow-orange';
+import semanticAvatarGreen from './avatar/green';
+import semanticAvatarDeepGreen from './avatar/deep-green';
+import semanticAvatarCyan from './avatar/cyan';
+import semanticAvatarLightBlue from './avatar/light-blue';
+import semanticAvatarDeepBlue from './avatar/deep-blue';
+import semanticAvatarPurple from './avatar/purple';
+import semanticAvatarPink from './avatar/pink';
+import semanticAvatarCoolGray from './avatar/cool-gray';
+
+const semanticMapping = {
+  "text": semanticText,
+  "icon": semanticIcon,
+  "bg": semanticBg,
+  "border": semanticBorder,
+  "avatar": [...semanticAvatarRed, ...semanticAvatarOrange, ...semanticAvatarYellowOrange, ...semanticAvatarGreen, ...semanticAvatarDeepGreen, ...semanticAvatarCyan, ...semanticAvatarLightBlue, ...semanticAvatarDeepBlue, ...semanticAvatarPurple, ...semanticAvatarPink, ...semanticAvatarCoolGray],
+};
+
+export default semanticMapping;
@@ -0,0 +1,100 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const semanticText = [
+  {
+    "devToken": "text.primary",
+    "designToken": "Color/text/primary",
+    "value": "neutral/100"
+  },
+  {
+    "devToken": "text.secondary",
+    "designToken": "Color/text/secondary",
+    "value": "neutral/60"
+  },
+  {
+    "devToken": "text.disabled",
+    "designToken": "Color/text/disabled",
+    "value": "neutral/30"
+  },
+  {
+    "devToken": "text.inverse",
+    "designToken": "Color/text/inverse",
+    "value": "neutral/white"
+  },
+  {
+    "devToken": "text.brand",
+    "designToken": "Color/text/brand",
+    "value": "brand/60"
+  },
+  {
+    "devToken": "text.error",
+    "designToken": "Color/text/error",
+    "value": "error/60"
+  },
+  {
+    "devToken": "text.error_light",
+    "designToken": "Color/text/error-light",
+    "value": "error/50"
+  },
+  {
+    "devToken": "text.success",
+    "designToken": "Color/text/success",
+    "value": "success/60"
+  },
+  {
+    "devToken": "text.success_light",
+    "designToken": "Color/text/success-light",
+    "value": "success/50"
+  },
+  {
+    "devToken": "text.loading",
+    "designToken": "Color/text/loading",
+    "value": "loading/60"
+  },
+  {
+    "devToken": "text.info",
+    "designToken": "Color/text/info",
+    "value": "neutral/40"
+  },
+  {
+    "devToken": "text.interactive.primary",
+    "designToken": "Color/text/interactive/primary",
+    "value": "neutral/100"
+  },
+  {
+    "devToken": "text.interactive.primary_disabled",
+    "designToken": "Color/text/interactive/primary-disabled",
+    "value": "neutral/30"
+  },
+  {
+    "devToken": "text.interactive.brand",
+    "designToken": "Color/text/interactive/brand",
+    "value": "brand/60"
+  },
+  {
+    "devToken": "text.interactive.brand_hover",
+    "designToken": "Color/text/interactive/brand-hover",
+    "value": "brand/70"
+  },
+  {
+    "devToken": "text.interactive.brand_disabled",
+    "designToken": "Color/text/interactive/brand-disabled",
+    "value": "brand/30"
+  },
+  {
+    "devToken": "text.interactive.error",
+    "designToken": "Color/text/interactive/error",
+    "value": "error/60"
+  },
+  {
+    "devToken": "text.interactive.error_disabled",
+    "designToken": "Color/text/interactive/error-disabled",
+    "value": "error/20"
+  },
+  {
+    "devToken": "text.interactive.inverse",
+    "designToken": "Color/text/interactive/inverse",
+    "value": "neutral/white"
+  }
+];
+
+export default semanticText;
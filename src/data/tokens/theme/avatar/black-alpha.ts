@@ -0,0 +1,6 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const themeAvatarBlackAlpha = {
+  "color_avatar_black_alpha_10": "BlackAlpha/10"
+};
+
+export default themeAvatarBlackAlpha;
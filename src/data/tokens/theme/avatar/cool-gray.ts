@@ -0,0 +1,11 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const themeAvatarCoolGray = {
+  "color_avatar_cool_gray_20": "CoolGray/20",
+  "color_avatar_cool_gray_30": "CoolGray/30",
+  "color_avatar_cool_gray_50": "CoolGray/50",
+  "color_avatar_cool_gray_70": "CoolGray/70",
+  "color_avatar_cool_gray_90": "CoolGray/90",
+  "color_avatar_cool_gray_alpha": "CoolGray/alpha"
+};
+
+export default themeAvatarCoolGray;
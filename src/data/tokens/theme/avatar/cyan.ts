@@ -0,0 +1,11 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const themeAvatarCyan = {
+  "color_avatar_cyan_20": "Cyan/20",
+  "color_avatar_cyan_30": "Cyan/30",
+  "color_avatar_cyan_50": "Cyan/50",
+  "color_avatar_cyan_70": "Cyan/70",
+  "color_avatar_cyan_90": "Cyan/90",
+  "color_avatar_cyan_alpha": "Cyan/alpha"
+};
+
+export default themeAvatarCyan;
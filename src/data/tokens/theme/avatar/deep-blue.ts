@@ -0,0 +1,11 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const themeAvatarDeepBlue = {
+  "color_avatar_deep_blue_20": "DeepBlue/20",
+  "color_avatar_deep_blue_30": "DeepBlue/30",
+  "color_avatar_deep_blue_50": "DeepBlue/50",
+  "color_avatar_deep_blue_70": "DeepBlue/70",
+  "color_avatar_deep_blue_90": "DeepBlue/90",
+  "color_avatar_deep_blue_alpha": "DeepBlue/alpha"
+};
+
+export default themeAvatarDeepBlue;
@@ -0,0 +1,11 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const themeAvatarDeepGreen = {
+  "color_avatar_deep_green_20": "DeepGreen/20",
+  "color_avatar_deep_green_30": "DeepGreen/30",
+  "color_avatar_deep_green_50": "DeepGreen/50",
+  "color_avatar_deep_green_70": "DeepGreen/70",
+  "color_avatar_deep_green_90": "DeepGreen/90",
+  "color_avatar_deep_green_alpha": "DeepGreen/alpha"
+};
+
+export default themeAvatarDeepGreen;
@@ -0,0 +1,11 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const themeAvatarGreen = {
+  "color_avatar_green_20": "Green/20",
+  "color_avatar_green_30": "Green/30",
+  "color_avatar_green_50": "Green/50",
+  "color_avatar_green_60": "Green/60",
+  "color_avatar_green_80": "Green/80",
+  "color_avatar_green_alpha": "Green/alpha"
+};
+
+export default themeAvatarGreen;
@@ -0,0 +1,12 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const themeAvatarLightBlue = {
+  "color_avatar_light_blue_20": "LightBlue/20",
+  "color_avatar_light_blue_30": "LightBlue/30",
+  "color_avatar_light_blue_50": "LightBlue/50",
+  "color_avatar_light_blue_60": "LightBlue/60",
+  "color_avatar_light_blue_70": "LightBlue/70",
+  "color_avatar_light_blue_90": "LightBlue/90",
+  "color_avatar_light_blue_alpha": "LightBlue/alpha"
+};
+
+export default themeAvatarLightBlue;
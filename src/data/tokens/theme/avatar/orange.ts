@@ -0,0 +1,11 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const themeAvatarOrange = {
+  "color_avatar_orange_20": "Orange/20",
+  "color_avatar_orange_30": "Orange/30",
+  "color_avatar_orange_50": "Orange/50",
+  "color_avatar_orange_60": "Orange/60",
+  "color_avatar_orange_80": "Orange/80",
+  "color_avatar_orange_alpha": "Orange/alpha"
+};
+
+export default themeAvatarOrange;
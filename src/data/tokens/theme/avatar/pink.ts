@@ -0,0 +1,11 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const themeAvatarPink = {
+  "color_avatar_pink_20": "Pink/20",
+  "color_avatar_pink_30": "Pink/30",
+  "color_avatar_pink_50": "Pink/50",
+  "color_avatar_pink_70": "Pink/70",
+  "color_avatar_pink_90": "Pink/90",
+  "color_avatar_pink_alpha": "Pink/alpha"
+};
+
+export default themeAvatarPink;
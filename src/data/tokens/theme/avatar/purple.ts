@@ -0,0 +1,11 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const themeAvatarPurple = {
+  "color_avatar_purple_20": "Purple/20",
+  "color_avatar_purple_30": "Purple/30",
+  "color_avatar_purple_50": "Purple/50",
+  "color_avatar_purple_70": "Purple/70",
+  "color_avatar_purple_90": "Purple/90",
+  "color_avatar_purple_alpha": "Purple/alpha"
+};
+
+export default themeAvatarPurple;
@@ -0,0 +1,11 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const themeAvatarRed = {
+  "color_avatar_red_20": "Red/20",
+  "color_avatar_red_30": "Red/30",
+  "color_avatar_red_50": "Red/50",
+  "color_avatar_red_60": "Red/60",
+  "color_avatar_red_80": "Red/80",
+  "color_avatar_red_alpha": "Red/alpha"
+};
+
+export default themeAvatarRed;
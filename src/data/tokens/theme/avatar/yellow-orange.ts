@@ -0,0 +1,11 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const themeAvatarYellowOrange = {
+  "color_avatar_yellow_orange_20": "YellowOrange/20",
+  "color_avatar_yellow_orange_30": "YellowOrange/30",
+  "color_avatar_yellow_orange_50": "YellowOrange/50",
+  "color_avatar_yellow_orange_70": "YellowOrange/70",
+  "color_avatar_yellow_orange_90": "YellowOrange/90",
+  "color_avatar_yellow_orange_alpha": "YellowOrange/alpha"
+};
+
+export default themeAvatarYellowOrange;
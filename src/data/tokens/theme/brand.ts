@@ -0,0 +1,15 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const themeBrand = {
+  "color_brand_10": "Blue/10",
+  "color_brand_20": "Blue/20",
+  "color_brand_30": "Blue/30",
+  "color_brand_40": "Blue/40",
+  "color_brand_50": "Blue/50",
+  "color_brand_60": "Blue/60",
+  "color_brand_70": "Blue/70",
+  "color_brand_80": "Blue/80",
+  "color_brand_90": "Blue/90",
+  "color_brand_100": "Blue/100"
+};
+
+export default themeBrand;
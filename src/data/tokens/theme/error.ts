@@ -0,0 +1,10 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const themeError = {
+  "color_error_20": "Red/20",
+  "color_error_30": "Red/30",
+  "color_error_50": "Red/50",
+  "color_error_60": "Red/60",
+  "color_error_80": "Red/80"
+};
+
+export default themeError;
@@ -0,0 +1,29 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+import themeBrand from './brand';
+import themeNeutral from './neutral';
+import themeError from './error';
+import themeLoading from './loading';
+import themeSuccess from './success';
+import themeAvatarRed from './avatar/red';
+import themeAvatarOrange from './avatar/orange';
+import themeAvatarYellowOrange from './avatar/yellow-orange';
+import themeAvatarGreen from './avatar/green';
+import themeAvatarDeepGreen from './avatar/deep-green';
+import themeAvatarCyan from './avatar/cyan';
+import themeAvatarLightBlue from './avatar/light-blue';
+import themeAvatarDeepBlue from './avatar/deep-blue';
+import themeAvatarPurple from './avatar/purple';
+import themeAvatarPink from './avatar/pink';
+import themeAvatarCoolGray from './avatar/cool-gray';
+import themeAvatarBlackAlpha from './avatar/black-alpha';
+
+const themeMapping = {
+  "brand": themeBrand,
+  "neutral": themeNeutral,
+  "error": themeError,
+  "loading": themeLoading,
+  "success": themeSuccess,
+  "avatar": { ...themeAvatarRed, ...themeAvatarOrange, ...themeAvatarYellowOrange, ...themeAvatarGreen, ...themeAvatarDeepGreen, ...themeAvatarCyan, ...themeAvatarLightBlue, ...themeAvatarDeepBlue, ...themeAvatarPurple, ...themeAvatarPink, ...themeAvatarCoolGray, ...themeAvatarBlackAlpha },
+};
+
+export default themeMapping;
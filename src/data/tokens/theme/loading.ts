@@ -0,0 +1,10 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const themeLoading = {
+  "color_loading_20": "Orange/20",
+  "color_loading_30": "Orange/30",
+  "color_loading_50": "Orange/50",
+  "color_loading_60": "Orange/60",
+  "color_loading_80": "Orange/80"
+};
+
+export default themeLoading;
@@ -0,0 +1,16 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const themeNeutral = {
+  "color_neutral_white": "Gray/white",
+  "color_neutral_10": "Gray/10",
+  "color_neutral_20": "Gray/20",
+  "color_neutral_30": "Gray/30",
+  "color_neutral_40": "Gray/40",
+  "color_neutral_50": "Gray/50",
+  "color_neutral_60": "Gray/60",
+  "color_neutral_70": "Gray/70",
+  "color_neutral_80": "Gray/80",
+  "color_neutral_90": "Gray/90",
+  "color_neutral_100": "Gray/100"
+};
+
+export default themeNeutral;
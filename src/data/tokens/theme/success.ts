@@ -0,0 +1,11 @@
+// Generated by src/scripts/tokens.py build. Do not edit by hand.
+const themeSuccess = {
+  "color_success_20": "Green/20",
+  "color_success_30": "Green/30",
+  "color_success_50": "Green/50",
+  "color_success_60": "Green/60",
+  "color_success_70": "Green/70",
+  "color_success_80": "Green/80"
+};
+
+export default themeSuccess;
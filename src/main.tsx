@@ -1,5 +1,6 @@
 import { StrictMode } from 'react'
 import { createRoot } from 'react-dom/client'
+import './data/tokens.css'
 import './index.css'
 import App from './App.tsx'
 
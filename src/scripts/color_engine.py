@@ -0,0 +1,145 @@
+"""
+Batched color-space computation for palette generation.
+
+All hex values are decoded in one bytes.fromhex() call into a flat RGBA
+buffer, then a single loop over the decoded channels does the per-color
+math through 256-entry lookup tables (sRGB -> linear), so per-color work
+is a handful of multiply-adds rather than string parsing and colorsys
+calls. The scripts are stdlib-only, so there is no array library to
+vectorize the loop itself.
+
+compute_colors() returns, per input hex:
+
+    rgb             (r, g, b) 0-255
+    alpha           0-1
+    hsl             (h 0-360, s 0-100, l 0-100), same math as colorsys.rgb_to_hls
+    oklch           (L 0-1, C, h 0-360)
+    luminance       WCAG relative luminance 0-1 (alpha ignored)
+    premultiplied   (r, g, b) 0-255 multiplied by alpha
+"""
+
+import math
+import re
+
+import token_trace
+
+HEX_RE = re.compile(r'#?([0-9A-Fa-f]{3,4}|[0-9A-Fa-f]{6}|[0-9A-Fa-f]{8})')
+
+# sRGB channel byte -> linear light
+LINEAR = [
+    (v / 255.0) / 12.92 if v / 255.0 <= 0.04045 else ((v / 255.0 + 0.055) / 1.055) ** 2.4
+    for v in range(256)
+]
+UNIT = [v / 255.0 for v in range(256)]
+
+
+def normalize_hex(hex_value):
+    """'#abc' / '#AABBCC' / '#AABBCCDD' -> 'AABBCCDD'"""
+    match = HEX_RE.fullmatch(hex_value.strip())
+    if not match:
+        raise ValueError(f"Invalid hex color: {hex_value!r}")
+    digits = match.group(1).upper()
+    if len(digits) <= 4:
+        digits = ''.join(c * 2 for c in digits)
+    if len(digits) == 6:
+        digits += 'FF'
+    return digits
+
+
+def decode_hex_batch(hex_values):
+    """Decodes hex colors into four channel byte strings (r, g, b, a)."""
+    buf = bytes.fromhex(''.join(normalize_hex(h) for h in hex_values))
+    return buf[0::4], buf[1::4], buf[2::4], buf[3::4]
+
+
+def _hsl(r, g, b):
+    # colorsys.rgb_to_hls, inlined so rounded output stays identical
+    maxc = max(r, g, b)
+    minc = min(r, g, b)
+    sumc = maxc + minc
+    rangec = maxc - minc
+    l = sumc / 2.0
+    if minc == maxc:
+        return 0.0, 0.0, l * 100
+    if l <= 0.5:
+        s = rangec / sumc
+    else:
+        s = rangec / (2.0 - maxc - minc)
+    rc = (maxc - r) / rangec
+    gc = (maxc - g) / rangec
+    bc = (maxc - b) / rangec
+    if r == maxc:
+        h = bc - gc
+    elif g == maxc:
+        h = 2.0 + rc - bc
+    else:
+        h = 4.0 + gc - rc
+    return ((h / 6.0) % 1.0) * 360, s * 100, l * 100
+
+
+def _oklch(lr, lg, lb):
+    l = 0.4122214708 * lr + 0.5363325363 * lg + 0.0514459929 * lb
+    m = 0.2119034982 * lr + 0.6806995451 * lg + 0.1073969566 * lb
+    s = 0.0883024619 * lr + 0.2817188376 * lg + 0.6299787005 * lb
+    l_, m_, s_ = l ** (1 / 3), m ** (1 / 3), s ** (1 / 3)
+    L = 0.2104542553 * l_ + 0.7936177850 * m_ - 0.0040720468 * s_
+    a = 1.9779984951 * l_ - 2.4285922050 * m_ + 0.4505937099 * s_
+    b = 0.0259040371 * l_ + 0.7827717662 * m_ - 0.8086757660 * s_
+    C = math.hypot(a, b)
+    H = math.degrees(math.atan2(b, a)) % 360 if C > 1e-4 else 0.0
+    return L, C, H
+
+
+def luminance(rgb):
+    """WCAG relative luminance of an (r, g, b) byte triple."""
+    return 0.2126 * LINEAR[rgb[0]] + 0.7152 * LINEAR[rgb[1]] + 0.0722 * LINEAR[rgb[2]]
+
+
+def composite(rgba, backdrop):
+    """Source-over blend of an (r, g, b, a) color onto an opaque (r, g, b) backdrop."""
+    r, g, b, a = rgba
+    if a == 255:
+        return r, g, b
+    alpha = UNIT[a]
+    return tuple(round(c * alpha + d * (1 - alpha)) for c, d in zip((r, g, b), backdrop))
+
+
+def contrast_ratio(lum_a, lum_b):
+    lighter, darker = max(lum_a, lum_b), min(lum_a, lum_b)
+    return (lighter + 0.05) / (darker + 0.05)
+
+
+def compute_colors(hex_values):
+    """Computes every color space for a list of hex strings in one pass."""
+    with token_trace.span('compute colors') as info:
+        info['tokens'] = len(hex_values)
+        return _compute_colors(hex_values)
+
+
+def _compute_colors(hex_values):
+    rs, gs, bs, alphas = decode_hex_batch(hex_values)
+    results = []
+    for r, g, b, a in zip(rs, gs, bs, alphas):
+        lr, lg, lb = LINEAR[r], LINEAR[g], LINEAR[b]
+        alpha = UNIT[a]
+        results.append({
+            'rgb': (r, g, b),
+            'alpha': alpha,
+            'hsl': _hsl(UNIT[r], UNIT[g], UNIT[b]),
+            'oklch': _oklch(lr, lg, lb),
+            'luminance': 0.2126 * lr + 0.7152 * lg + 0.0722 * lb,
+            'premultiplied': (round(r * alpha), round(g * alpha), round(b * alpha)),
+        })
+    return results
+
+
+def format_rgb(rgb):
+    return f"rgb({rgb[0]}, {rgb[1]}, {rgb[2]})"
+
+
+def format_hsl(hsl):
+    return f"hsl({round(hsl[0])}, {round(hsl[1])}%, {round(hsl[2])}%)"
+
+
+def format_oklch(oklch):
+    return f"oklch({oklch[0] * 100:.2f}% {oklch[1]:.4f} {oklch[2]:.2f})"
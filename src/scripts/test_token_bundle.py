@@ -0,0 +1,47 @@
+import struct
+import unittest
+
+import token_pipeline
+from token_bundle import MAGIC, build_token_bundle, decode_bundle, encode_bundle
+
+CATEGORIES = [
+    ('palette', 'Blue', [
+        ('Blue/60', None, None, '#3182F6', '#4C94F8'),
+        ('Blue/dark-only', None, None, None, '#0A2A5C'),
+    ]),
+    ('semantic', 'text', [
+        ('text.brand', 'Blue/60', 'Color/text/brand', '#3182F6', None),
+        ('text.overlay', 'BlackAlpha/50', 'Color/text/overlay é', '#00000080', '#00000080'),
+    ]),
+]
+
+
+class TokenBundleTest(unittest.TestCase):
+    def test_round_trip(self):
+        self.assertEqual(decode_bundle(encode_bundle(CATEGORIES)), CATEGORIES)
+
+    def test_strings_are_interned_once(self):
+        data = encode_bundle(CATEGORIES)
+        string_count = struct.unpack_from('<I', data, 8)[0]
+        # 'Blue/60' is both a palette ref and an alias target; colors are packed as integers
+        self.assertEqual(string_count, 11)
+
+    def test_rejects_other_data(self):
+        with self.assertRaises(ValueError):
+            decode_bundle(b'{"colors": {}}' + bytes(20))
+
+    def test_repo_bundle_and_chunks_round_trip(self):
+        data_dir = token_pipeline.DATA_DIR
+        stage = next(stage for stage in token_pipeline.STAGES if stage.name == 'bundle')
+        files = build_token_bundle(*(f"{data_dir}/{name}" for name in stage.inputs))
+        self.assertTrue(files['tokens.bin'].startswith(MAGIC))
+
+        categories = decode_bundle(files['tokens.bin'])
+        self.assertEqual(len(files), len(categories) + 1)
+        for kind, name, tokens in categories:
+            chunk = files[f"chunks/{kind}.{name}.bin".replace(' ', '_')]
+            self.assertEqual(decode_bundle(chunk), [(kind, name, tokens)])
+
+
+if __name__ == '__main__':
+    unittest.main()
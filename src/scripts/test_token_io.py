@@ -0,0 +1,58 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from token_io import patch_json, write_json
+
+
+class PatchJsonTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix='token-io-')
+        self.path = os.path.join(self.tmp, 'semantic.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def read(self):
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+    def write(self, text):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def test_missing_file_is_written_in_full(self):
+        self.assertEqual(patch_json(self.path, {'a': 1}), (True, None))
+        self.assertEqual(self.read(), b'{\n  "a": 1\n}')
+
+    def test_unchanged_sections_keep_their_bytes(self):
+        # Hand-formatted sections that write_json would lay out differently
+        self.write('{\n  "text": [{"devToken": "text.primary"}],\n  "bg": [ 1,2 ],\n  "icon": []\n}')
+        written, changed = patch_json(self.path, {'text': [{'devToken': 'text.primary'}], 'bg': [1, 3], 'icon': []})
+        self.assertTrue(written)
+        self.assertEqual(changed, ['bg'])
+        self.assertEqual(self.read(), b'{\n  "text": [{"devToken": "text.primary"}],\n'
+                                      b'  "bg": [\n    1,\n    3\n  ],\n  "icon": []\n}')
+
+    def test_identical_data_is_not_rewritten(self):
+        write_json(self.path, {'text': ['é'], 'bg': []}, ensure_ascii=False)
+        before = self.read()
+        self.assertEqual(patch_json(self.path, {'text': ['é'], 'bg': []}, ensure_ascii=False), (False, []))
+        self.assertEqual(self.read(), before)
+
+    def test_removed_and_added_sections_are_reported(self):
+        write_json(self.path, {'text': [], 'bg': []})
+        written, changed = patch_json(self.path, {'text': [], 'border': []})
+        self.assertTrue(written)
+        self.assertEqual(changed, ['border', 'bg'])
+        self.assertEqual(self.read(), b'{\n  "text": [],\n  "border": []\n}')
+
+    def test_non_object_file_falls_back_to_full_write(self):
+        self.write('[1, 2]')
+        self.assertEqual(patch_json(self.path, {'a': 1}), (True, None))
+        self.assertEqual(self.read(), b'{\n  "a": 1\n}')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import token_cache
+import token_pipeline
+
+DATA_STAGES = ('primitives', 'theme', 'semantic')
+
+
+class ProdProfileTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix='token-pipeline-')
+        self.data_dir = os.path.join(self.tmp, 'data')
+        self.cache_dir = os.path.join(self.tmp, 'cache')
+        shutil.copytree(token_pipeline.DATA_DIR, self.data_dir, ignore=shutil.ignore_patterns('prod'))
+        self.stages = [stage for stage in token_pipeline.STAGES if stage.name in DATA_STAGES]
+        self.cache_enabled = token_cache.ENABLED
+        token_cache.ENABLED = False
+
+    def tearDown(self):
+        token_cache.ENABLED = self.cache_enabled
+        shutil.rmtree(self.tmp)
+
+    def build(self):
+        return dict(token_pipeline.build(self.data_dir, self.cache_dir, stages=self.stages, profile='prod'))
+
+    def test_second_prod_build_skips_every_stage(self):
+        self.build()
+        self.assertTrue(os.path.exists(os.path.join(self.data_dir, 'prod', 'semantic_color_mapping.json')))
+        self.assertEqual(self.build(), {name: 'skipped' for name in DATA_STAGES})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from token_resolver import AliasGraph, ResolutionError, load_graph
+
+PALETTE = {'colors': {'palette': {'Blue': [
+    {'level': '10', 'variable': 'Blue/10', 'hex': '#E5F0FF', 'hexDark': '#0A2A5C'},
+    {'level': '60', 'variable': 'Blue/60', 'hex': '#3182F6', 'hexDark': '#4C94F8'},
+]}}}
+
+
+class AliasGraphTest(unittest.TestCase):
+    def resolve_problems(self, graph):
+        with self.assertRaises(ResolutionError) as caught:
+            graph.resolve()
+        return caught.exception.problems
+
+    def test_resolves_chains_to_terminal_values(self):
+        graph = AliasGraph()
+        graph.add_value('Blue/60', {'hex': '#3182F6'})
+        graph.add_alias('brand/60', 'Blue/60')
+        graph.add_alias('text.brand', 'brand/60')
+        resolved = graph.resolve()
+        self.assertEqual(resolved['text.brand'], 'Blue/60')
+        self.assertEqual(graph.value('text.brand', resolved), {'hex': '#3182F6'})
+
+    def test_reports_cycle(self):
+        graph = AliasGraph()
+        graph.add_alias('a', 'b', 'Theme.md', 1)
+        graph.add_alias('b', 'a', 'Theme.md', 2)
+        problems = self.resolve_problems(graph)
+        self.assertEqual(len(problems), 1)
+        self.assertIn('alias cycle a -> b -> a', problems[0])
+
+    def test_reports_dangling_reference(self):
+        graph = AliasGraph()
+        graph.add_alias('text.primary', 'neutral/100', 'Semantic.md', 4)
+        self.assertEqual(self.resolve_problems(graph),
+                         ["Semantic.md:4: 'text.primary' references unknown token 'neutral/100'"])
+
+    def test_reports_duplicate_with_both_locations(self):
+        graph = AliasGraph()
+        graph.add_value('Blue/60', {}, 'palette.json')
+        graph.add_alias('brand/60', 'Blue/60', 'Theme.md', 3)
+        graph.add_alias('brand/60', 'Blue/60', 'Theme.md', 9)
+        self.assertEqual(self.resolve_problems(graph),
+                         ["Theme.md:9: 'brand/60' is already defined at Theme.md:3"])
+
+    def test_reports_empty_value(self):
+        graph = AliasGraph()
+        graph.add_alias('text.primary', '', 'Semantic.md', 4)
+        self.assertEqual(self.resolve_problems(graph), ["Semantic.md:4: 'text.primary' has no value"])
+
+    def test_collects_every_problem(self):
+        graph = AliasGraph()
+        graph.add_alias('a', 'missing')
+        graph.add_alias('b', '')
+        graph.add_alias('c', 'a')
+        self.assertEqual(len(self.resolve_problems(graph)), 2)
+
+    def test_long_chain_does_not_recurse(self):
+        graph = AliasGraph()
+        graph.add_value('t0', 'value')
+        for i in range(1, 5000):
+            graph.add_alias(f't{i}', f't{i - 1}')
+        self.assertEqual(graph.resolve()['t4999'], 't0')
+
+
+class LoadGraphTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix='token-resolver-')
+        self.palette = self.write('color_palette.json', json.dumps(PALETTE))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def write(self, name, text):
+        path = os.path.join(self.tmp, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return path
+
+    def test_problems_point_at_markdown_lines(self):
+        theme = self.write('# Theme.md', "## BRAND\n- brand/10: Blue/10\n- brand/60: Blue/99\n")
+        semantic = self.write('# Semantic_dev_code.md',
+                              "# Dev\n\n## COLOR - text\n- text.brand: brand/60\n- text.primary:\n"
+                              "- text.brand: brand/10\n")
+        with self.assertRaises(ResolutionError) as caught:
+            load_graph(self.palette, theme, semantic).resolve()
+        self.assertEqual(sorted(caught.exception.problems), sorted([
+            "# Semantic_dev_code.md:6: 'text.brand' is already defined at # Semantic_dev_code.md:4",
+            "# Theme.md:3: 'brand/60' references unknown token 'Blue/99'",
+            "# Semantic_dev_code.md:5: 'text.primary' has no value",
+        ]))
+
+    def test_valid_sources_resolve(self):
+        theme = self.write('# Theme.md', "## BRAND\n- brand/60: Blue/60\n")
+        semantic = self.write('# Semantic_dev_code.md', "## COLOR - text\n- text.brand: brand/60\n")
+        graph = load_graph(self.palette, theme, semantic)
+        self.assertEqual(graph.value('text.brand', graph.resolve())['hex'], '#3182F6')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,231 @@
+"""
+Benchmarks for the color token pipeline on synthetic design systems.
+
+generate_sources() writes # Primitives.md, # Theme.md, # Semantic.md and
+# Semantic_dev_code.md at a multiple of today's size (14 families, ~114
+theme and ~171 semantic tokens). They include alpha levels, light and
+dark sections, and theme alias chains CHAIN_DEPTH deep that the semantic
+tokens point into.
+
+run_benchmarks() times each stage (best of `repeat` runs) and records its
+peak traced memory in a separate run, because tracemalloc slows the
+timing runs down:
+
+    parse_primitives   parse_primitives()
+    generate_json      generate_json() over the parsed light/dark data
+    parse_theme        parse_theme_md()
+    semantic_merge     parse_design_tokens() + parse_dev_tokens() + merge_semantic()
+    resolve            alias graph build + resolve()
+    rename             RenameMap build + apply() over a theme mapping that still
+                       uses legacy color_<family>_<level> names (refactor_variables)
+
+Results are plain JSON so runs can be compared with compare_results().
+"""
+
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from token_rename import RenameMap
+from token_resolver import graph_from_sources, semantic_aliases, theme_aliases
+from update_colors import generate_json, parse_primitives
+from update_semantic_json import merge_semantic, parse_design_tokens, parse_dev_tokens
+from update_theme_json import SECTION_MAP, parse_theme_md
+
+BASE_FAMILIES = 14
+BASE_THEME_TOKENS = 114
+BASE_SEMANTIC_TOKENS = 171
+BASE_CATEGORIES = 5
+LEVELS = ['10', '20', '30', '50', '60', '80', 'alpha']
+CHAIN_DEPTH = 8
+DEFAULT_SCALES = (10, 100, 1000)
+
+
+def _hex(n, alpha=False):
+    value = f"#{(n * 2654435761) & 0xFFFFFF:06X}"
+    return value + '1A' if alpha else value
+
+
+def generate_sources(out_dir, scale):
+    """
+    Writes the four markdown sources at scale x today's size into out_dir.
+
+    Returns:
+        Dict of source counts
+    """
+    families = [f"Family{i}" for i in range(BASE_FAMILIES * scale)]
+    with open(os.path.join(out_dir, '# Primitives.md'), 'w', encoding='utf-8') as f:
+        for mode, offset in (('Light Theme', 0), ('Dark Theme', 7)):
+            f.write(f"## {mode}\n\n")
+            for i, family in enumerate(families):
+                f.write(f"### {family}\n")
+                for j, level in enumerate(LEVELS):
+                    f.write(f"- {family}/{level}: {_hex(i * 31 + j + offset, level == 'alpha')}\n")
+                f.write("\n")
+
+    # Theme tokens come in chains: the first aliases a primitive, each
+    # following one aliases the previous token of its chain
+    sections = list(SECTION_MAP)
+    theme_tokens = []
+    chain_ends = []
+    with open(os.path.join(out_dir, '# Theme.md'), 'w', encoding='utf-8') as f:
+        by_section = {section: [] for section in sections}
+        for t in range(BASE_THEME_TOKENS * scale):
+            chain, depth = divmod(t, CHAIN_DEPTH)
+            section = sections[chain % len(sections)]
+            key = f"{section.lower()}{chain}/{depth}"
+            if depth == 0:
+                target = f"{families[chain % len(families)]}/{LEVELS[chain % len(LEVELS)]}"
+            else:
+                target = f"{section.lower()}{chain}/{depth - 1}"
+            by_section[section].append(f"- {key}: {target}\n")
+            theme_tokens.append(key)
+            if depth == CHAIN_DEPTH - 1:
+                chain_ends.append(key)
+        for section in sections:
+            f.write(f"## {section}\n")
+            f.writelines(by_section[section])
+            f.write("\n")
+    chain_ends = chain_ends or theme_tokens
+
+    categories = [f"cat{c}" for c in range(BASE_CATEGORIES * scale)]
+    semantic_count = BASE_SEMANTIC_TOKENS * scale
+    with open(os.path.join(out_dir, '# Semantic.md'), 'w', encoding='utf-8') as design, \
+            open(os.path.join(out_dir, '# Semantic_dev_code.md'), 'w', encoding='utf-8') as dev:
+        per_category = -(-semantic_count // len(categories))
+        for c, category in enumerate(categories):
+            design.write(f"## COLOR - {category}\n")
+            dev.write(f"## COLOR - {category}\n")
+            for j in range(per_category):
+                n = c * per_category + j
+                if n >= semantic_count:
+                    break
+                design.write(f"- Color/{category}/tok-{j}\n")
+                dev.write(f"- {category}.tok_{j}: {chain_ends[n % len(chain_ends)]}\n")
+            design.write("\n")
+            dev.write("\n")
+
+    return {
+        "families": len(families),
+        "primitives": len(families) * len(LEVELS) * 2,
+        "themeTokens": len(theme_tokens),
+        "semanticTokens": semantic_count,
+        "aliasDepth": CHAIN_DEPTH + 1,
+    }
+
+
+def _stages(src):
+    """(name, fn) pairs; each fn returns the number of tokens it handled."""
+    primitives_md = os.path.join(src, '# Primitives.md')
+    theme_md = os.path.join(src, '# Theme.md')
+    design_md = os.path.join(src, '# Semantic.md')
+    dev_md = os.path.join(src, '# Semantic_dev_code.md')
+
+    light, dark = parse_primitives(primitives_md)
+    palette = generate_json(light, dark)
+    theme = parse_theme_md(theme_md)
+    theme_refs = theme_aliases(theme_md)
+    semantic_refs = semantic_aliases(dev_md)
+
+    def run_parse_primitives():
+        l, d = parse_primitives(primitives_md)
+        return sum(map(len, l.values())) + sum(map(len, d.values()))
+
+    def run_generate_json():
+        return sum(map(len, generate_json(light, dark).values()))
+
+    def run_parse_theme():
+        return sum(map(len, parse_theme_md(theme_md).values()))
+
+    def run_semantic_merge():
+        merged = merge_semantic(parse_design_tokens(design_md), parse_dev_tokens(dev_md))
+        return sum(map(len, merged.values()))
+
+    def run_resolve():
+        return len(graph_from_sources(palette, theme_refs, semantic_refs).resolve())
+
+    # refactor_variables input: palette variables under their legacy names,
+    # and a mapping that spells them with a capitalized family
+    legacy = {}
+    legacy_mapping = {}
+    for family, shades in palette.items():
+        for shade in shades:
+            level = shade['variable'].split('/', 1)[1]
+            legacy[f"color_{family.lower()}_{level}"] = shade['variable']
+    for section, tokens in theme.items():
+        legacy_mapping[section] = {key: f"color_{value.replace('/', '_')}" for key, value in tokens.items()}
+
+    def run_rename():
+        mapping = {section: dict(tokens) for section, tokens in legacy_mapping.items()}
+        return len(RenameMap(legacy).apply(mapping))
+
+    return [
+        ('parse_primitives', run_parse_primitives),
+        ('generate_json', run_generate_json),
+        ('parse_theme', run_parse_theme),
+        ('semantic_merge', run_semantic_merge),
+        ('resolve', run_resolve),
+        ('rename', run_rename),
+    ]
+
+
+def bench_scale(scale, repeat=3):
+    with tempfile.TemporaryDirectory(prefix=f"token-bench-{scale}x-") as src:
+        sizes = generate_sources(src, scale)
+        sizes['sourceBytes'] = sum(os.path.getsize(os.path.join(src, name)) for name in os.listdir(src))
+        stages = {}
+        for name, fn in _stages(src):
+            best = None
+            for _ in range(repeat):
+                start = time.perf_counter()
+                tokens = fn()
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+
+            tracemalloc.start()
+            try:
+                fn()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+            stages[name] = {"seconds": round(best, 6), "peakBytes": peak, "tokens": tokens}
+        return {"sizes": sizes, "stages": stages}
+
+
+def run_benchmarks(scales=DEFAULT_SCALES, repeat=3, progress=None):
+    results = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "created": time.strftime('%Y-%m-%dT%H:%M:%S'),
+        "repeat": repeat,
+        "scales": {},
+    }
+    for scale in scales:
+        results["scales"][str(scale)] = bench_scale(scale, repeat)
+        if progress:
+            progress(scale, results["scales"][str(scale)])
+    return results
+
+
+def compare_results(baseline, current, threshold=1.25):
+    """
+    Returns (rows, regressions) comparing stage times present in both runs.
+
+    rows are (scale, stage, baseline seconds, current seconds, ratio);
+    regressions are the rows whose ratio exceeds threshold.
+    """
+    rows = []
+    for scale, result in current["scales"].items():
+        previous = baseline.get("scales", {}).get(scale)
+        if not previous:
+            continue
+        for stage, timing in result["stages"].items():
+            before = previous["stages"].get(stage)
+            if not before or not before["seconds"]:
+                continue
+            rows.append((scale, stage, before["seconds"], timing["seconds"], timing["seconds"] / before["seconds"]))
+    return rows, [row for row in rows if row[4] > threshold]
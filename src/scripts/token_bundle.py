@@ -0,0 +1,169 @@
+"""
+Compact binary color token bundle (tokens.bin) and per-category chunks.
+
+Layout (little-endian, every field a u32 unless noted):
+
+    header      magic 'DSTB', version u16, reserved u16,
+                string count, category count, token count
+    offsets     string count + 1 byte offsets into the string blob
+    categories  kind, name, first token, token count
+    tokens      name, target, design token, flags, light RGBA, dark RGBA
+    blob        UTF-8 bytes of every interned string, back to back
+
+Strings are interned once and referenced by index (NONE when absent).
+target is the reference a theme/semantic token aliases; light/dark hold
+the resolved color packed as 0xRRGGBBAA, valid when flags has HAS_LIGHT /
+HAS_DARK set. Categories are palette families, theme sections and
+semantic categories, e.g. ('palette', 'Blue'), ('semantic', 'text').
+
+chunks/<kind>.<name>.bin use the same layout holding a single category.
+
+The stage is optional (tokens.py build --bundle) and its outputs are not
+committed: the site reads the JSON/TS outputs, the bundle is for consumers
+that want the tokens without a JSON parser. decode_bundle is the reference
+reader.
+"""
+
+import json
+import struct
+
+from color_engine import normalize_hex
+from token_lexer import ENTRY, SECTION, lex_markdown
+from token_resolver import load_graph
+from update_theme_json import SECTION_MAP
+
+MAGIC = b'DSTB'
+VERSION = 1
+NONE = 0xFFFFFFFF
+HAS_LIGHT = 1
+HAS_DARK = 2
+CHUNK_DIR = 'chunks'
+
+
+def pack_rgba(hex_value):
+    return int(normalize_hex(hex_value), 16) if hex_value else 0
+
+
+class StringTable:
+    def __init__(self):
+        self.ids = {}
+        self.strings = []
+
+    def intern(self, value):
+        if value is None:
+            return NONE
+        sid = self.ids.get(value)
+        if sid is None:
+            sid = self.ids[value] = len(self.strings)
+            self.strings.append(value)
+        return sid
+
+
+def encode_bundle(categories):
+    """
+    Encodes [(kind, name, tokens)] where each token is
+    (name, target, design token, light hex, dark hex).
+    """
+    strings = StringTable()
+    category_rows = []
+    token_rows = []
+    for kind, name, tokens in categories:
+        category_rows += [strings.intern(kind), strings.intern(name), len(token_rows) // 6, len(tokens)]
+        for token_name, target, design_token, light, dark in tokens:
+            flags = (HAS_LIGHT if light else 0) | (HAS_DARK if dark else 0)
+            token_rows += [strings.intern(token_name), strings.intern(target), strings.intern(design_token),
+                           flags, pack_rgba(light), pack_rgba(dark)]
+
+    encoded = [s.encode('utf-8') for s in strings.strings]
+    offsets = [0]
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+
+    header = MAGIC + struct.pack('<HH3I', VERSION, 0, len(encoded), len(categories), len(token_rows) // 6)
+    words = offsets + category_rows + token_rows
+    return header + struct.pack(f'<{len(words)}I', *words) + b''.join(encoded)
+
+
+def decode_bundle(data):
+    """Decodes encode_bundle output back to [(kind, name, tokens)]."""
+    if data[:4] != MAGIC:
+        raise ValueError('Not a token bundle')
+    version, _, string_count, category_count, token_count = struct.unpack_from('<HH3I', data, 4)
+    if version != VERSION:
+        raise ValueError(f"Unsupported token bundle version {version}")
+
+    word_count = string_count + 1 + category_count * 4 + token_count * 6
+    words = struct.unpack_from(f'<{word_count}I', data, 20)
+    blob = data[20 + word_count * 4:]
+    strings = [blob[words[i]:words[i + 1]].decode('utf-8') for i in range(string_count)]
+
+    def string(sid):
+        return None if sid == NONE else strings[sid]
+
+    def unpack_rgba(value):
+        digits = f"{value:08X}"
+        return '#' + (digits[:6] if digits.endswith('FF') else digits)
+
+    categories_at = string_count + 1
+    tokens_at = categories_at + category_count * 4
+    categories = []
+    for c in range(category_count):
+        kind, name, first, count = words[categories_at + c * 4:categories_at + c * 4 + 4]
+        tokens = []
+        for t in range(first, first + count):
+            name_id, target, design_token, flags, light, dark = words[tokens_at + t * 6:tokens_at + t * 6 + 6]
+            tokens.append((string(name_id), string(target), string(design_token),
+                           unpack_rgba(light) if flags & HAS_LIGHT else None,
+                           unpack_rgba(dark) if flags & HAS_DARK else None))
+        categories.append((string(kind), string(name), tokens))
+    return categories
+
+
+def theme_sections(theme_md):
+    """Yields (section, key) for # Theme.md entries the graph includes."""
+    section = None
+    for event in lex_markdown(theme_md):
+        if event.kind == SECTION:
+            section = SECTION_MAP.get(event.name)
+        elif event.kind == ENTRY and section and event.value is not None:
+            yield section, event.key
+
+
+def collect_categories(palette_path, theme_md, semantic_dev_md, semantic_json):
+    graph = load_graph(palette_path, theme_md, semantic_dev_md)
+    resolved = graph.resolve()
+
+    def token(ref, design_token=None):
+        target = graph.nodes[ref][0]
+        shade = graph.value(ref, resolved)
+        return ref, target, design_token, shade['hex'], shade['hexDark']
+
+    with open(palette_path, 'r', encoding='utf-8') as f:
+        palette = json.load(f)['colors']['palette']
+    categories = [('palette', family, [token(shade['variable']) for shade in shades])
+                  for family, shades in palette.items()]
+
+    theme = {}
+    for section, key in theme_sections(theme_md):
+        theme.setdefault(section, []).append(token(key))
+    categories += [('theme', section, tokens) for section, tokens in theme.items()]
+
+    with open(semantic_json, 'r', encoding='utf-8') as f:
+        semantic = json.load(f)
+    for category, entries in semantic.items():
+        categories.append(('semantic', category, [token(entry['devToken'], entry['designToken'] or None)
+                                                  for entry in entries]))
+    return categories
+
+
+def chunk_name(kind, name):
+    return f"{CHUNK_DIR}/{kind}.{name}.bin".replace(' ', '_')
+
+
+def build_token_bundle(palette_path, theme_md, semantic_dev_md, semantic_json):
+    """Returns {relative path: bytes} for tokens.bin and every category chunk."""
+    categories = collect_categories(palette_path, theme_md, semantic_dev_md, semantic_json)
+    files = {'tokens.bin': encode_bundle(categories)}
+    for category in categories:
+        files[chunk_name(category[0], category[1])] = encode_bundle([category])
+    return files
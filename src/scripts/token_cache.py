@@ -0,0 +1,166 @@
+"""
+On-disk cache for parsed markdown token sources.
+
+Parsed results are stored under .cache/tokens/parse/ and looked up by
+(parser, path). An entry is reused when the file's size and mtime still
+match, or when they changed but the content hash did not (e.g. a touch or
+a git checkout). Parser and lexer source are part of the key so editing
+either invalidates the entries. Least recently used entries are evicted once the
+cache holds more than MAX_ENTRIES.
+"""
+
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import time
+
+import token_trace
+from token_io import write_json
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+repo_root = os.path.dirname(base_dir)
+CACHE_DIR = os.path.join(repo_root, '.cache', 'tokens')
+INDEX_FILE = 'index.json'
+MAX_ENTRIES = 64
+TOUCH_INTERVAL = 60
+
+# Set TOKENS_NO_CACHE=1 (or tokens.py build --no-cache) to always parse
+ENABLED = os.environ.get('TOKENS_NO_CACHE', '') in ('', '0')
+
+# The update_* parsers read their markdown through the shared lexer
+PARSER_DEPENDENCIES = ('token_lexer',)
+
+_parser_versions = {}
+
+
+def parser_version(parse_fn):
+    """
+    Hash of the module source defining parse_fn plus the modules it parses
+    through (PARSER_DEPENDENCIES), so parser or lexer edits invalidate entries.
+    """
+    key = f"{parse_fn.__module__}.{parse_fn.__qualname__}"
+    if key not in _parser_versions:
+        modules = [inspect.getmodule(parse_fn)] + [importlib.import_module(name) for name in PARSER_DEPENDENCIES]
+        sources = []
+        for module in modules:
+            try:
+                sources.append(inspect.getsource(module))
+            except (OSError, TypeError):
+                sources.append('')
+        source = '\n'.join(sources)
+        _parser_versions[key] = hashlib.sha256(f"{key}\n{source}".encode('utf-8')).hexdigest()[:16]
+    return _parser_versions[key]
+
+
+def _load_index(parse_dir):
+    try:
+        with open(os.path.join(parse_dir, INDEX_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_index(parse_dir, index):
+    write_json(os.path.join(parse_dir, INDEX_FILE), index)
+
+
+def _read_entry(parse_dir, entry):
+    try:
+        with open(os.path.join(parse_dir, entry['file']), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _evict(parse_dir, index):
+    if len(index) <= MAX_ENTRIES:
+        return
+    by_age = sorted(index.items(), key=lambda item: item[1]['lastUsed'])
+    for key, entry in by_age[:len(index) - MAX_ENTRIES]:
+        del index[key]
+        try:
+            os.remove(os.path.join(parse_dir, entry['file']))
+        except FileNotFoundError:
+            pass
+
+
+def cached_parse(parse_fn, path, cache_dir=None):
+    """
+    Returns parse_fn(path), served from the on-disk cache when the source is unchanged.
+
+    Cached results round-trip through JSON, so tuples come back as lists.
+    """
+    with token_trace.span('parse', source=os.path.basename(path), parser=parse_fn.__name__) as info:
+        result = _cached_parse(parse_fn, path, cache_dir, info)
+        if token_trace.ENABLED:
+            info['tokens'] = count_tokens(result)
+        return result
+
+
+def count_tokens(data):
+    """Leaf entries of a parse result: scalar values, with a flat dict in a list (one dev token) counting once."""
+    if isinstance(data, dict):
+        return sum(count_tokens(value) if isinstance(value, (dict, list, tuple)) else 1 for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return sum(1 if not isinstance(item, (dict, list, tuple)) or _is_flat(item) else count_tokens(item)
+                   for item in data)
+    return 1
+
+
+def _is_flat(item):
+    return isinstance(item, dict) and not any(isinstance(value, (dict, list, tuple)) for value in item.values())
+
+
+def _cached_parse(parse_fn, path, cache_dir, info):
+    if not ENABLED:
+        info['cache'] = 'off'
+        return parse_fn(path)
+
+    parse_dir = os.path.join(cache_dir or CACHE_DIR, 'parse')
+    os.makedirs(parse_dir, exist_ok=True)
+
+    version = parser_version(parse_fn)
+    abs_path = os.path.abspath(path)
+    key = f"{parse_fn.__module__}.{parse_fn.__qualname__}@{version}:{abs_path}"
+    stat = os.stat(abs_path)
+
+    index = _load_index(parse_dir)
+    entry = index.get(key)
+    result = None
+    now = time.time()
+
+    if entry and entry['size'] == stat.st_size and entry['mtimeNs'] == stat.st_mtime_ns:
+        result = _read_entry(parse_dir, entry)
+        # Plain hits only refresh the LRU timestamp once it is stale, to avoid an index write per lookup
+        if result is not None and now - entry['lastUsed'] < TOUCH_INTERVAL:
+            info['cache'] = 'hit'
+            return result
+
+    if result is None:
+        with open(abs_path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        if entry and entry['sha256'] == digest:
+            result = _read_entry(parse_dir, entry)
+        if result is None:
+            info['cache'] = 'miss'
+            result = parse_fn(path)
+            stale_file = entry['file'] if entry else None
+            entry = {'file': f"{parse_fn.__name__}-{version}-{digest[:24]}.json", 'sha256': digest}
+            write_json(os.path.join(parse_dir, entry['file']), result, ensure_ascii=False, indent=None)
+            if stale_file and stale_file != entry['file'] and not any(
+                    other['file'] == stale_file for other_key, other in index.items() if other_key != key):
+                try:
+                    os.remove(os.path.join(parse_dir, stale_file))
+                except FileNotFoundError:
+                    pass
+        entry['size'] = stat.st_size
+        entry['mtimeNs'] = stat.st_mtime_ns
+
+    entry['lastUsed'] = now
+    index[key] = entry
+    _evict(parse_dir, index)
+    _save_index(parse_dir, index)
+    info.setdefault('cache', 'hit')
+    return result
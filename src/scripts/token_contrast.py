@@ -0,0 +1,76 @@
+"""
+Precomputed WCAG contrast matrix (contrast_matrix.json).
+
+Every text.* and icon.* semantic token is paired with every bg.* token,
+in light and dark. Ratios are stored as one packed integer array scaled
+by 100 (450 = 4.50:1), laid out as
+
+    ratios[(theme * len(foreground) + fg) * len(background) + bg]
+
+0 marks a pair where one side has no color in that theme. Translucent
+backgrounds are composited over the base surface (neutral/white) and
+translucent foregrounds over the background before measuring.
+"""
+
+import json
+
+from color_engine import composite, contrast_ratio, decode_hex_batch, luminance
+
+THEMES = ['light', 'dark']
+FOREGROUND_CATEGORIES = ['text', 'icon']
+BACKGROUND_CATEGORIES = ['bg']
+SURFACE_TOKEN = 'neutral/white'
+SCALE = 100
+
+
+def _load(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def theme_hex(entry, theme):
+    # Same fallback as resolveSemanticToken: dark falls back to light
+    if theme == 'light':
+        return entry['hex'] or None
+    return entry['hexDark'] or entry['hex'] or None
+
+
+def _decode(hex_values):
+    """Decodes a list of hex strings (None allowed) into (r, g, b, a) tuples."""
+    present = [h for h in hex_values if h]
+    channels = iter(zip(*decode_hex_batch(present))) if present else iter(())
+    return [next(channels) if h else None for h in hex_values]
+
+
+def build_contrast_matrix(index_path, semantic_path):
+    index = _load(index_path)
+    semantic = _load(semantic_path)
+
+    foreground = [t['devToken'] for cat in FOREGROUND_CATEGORIES for t in semantic.get(cat, [])]
+    background = [t['devToken'] for cat in BACKGROUND_CATEGORIES for t in semantic.get(cat, [])]
+
+    ratios = []
+    for theme in THEMES:
+        surface = _decode([theme_hex(index[SURFACE_TOKEN], theme)])[0]
+        bg_rgb = [bg and composite(bg, surface[:3]) for bg in _decode([theme_hex(index[t], theme) for t in background])]
+        bg_lum = [rgb and luminance(rgb) for rgb in bg_rgb]
+
+        for fg in _decode([theme_hex(index[t], theme) for t in foreground]):
+            if fg is None:
+                ratios.extend([0] * len(background))
+                continue
+            fg_lum = luminance(fg[:3]) if fg[3] == 255 else None
+            for rgb, lum in zip(bg_rgb, bg_lum):
+                if rgb is None:
+                    ratios.append(0)
+                    continue
+                pair_lum = fg_lum if fg_lum is not None else luminance(composite(fg, rgb))
+                ratios.append(round(contrast_ratio(pair_lum, lum) * SCALE))
+
+    return {
+        "themes": THEMES,
+        "foreground": foreground,
+        "background": background,
+        "scale": SCALE,
+        "ratios": ratios,
+    }
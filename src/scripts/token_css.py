@@ -0,0 +1,62 @@
+"""
+Compiled CSS custom properties (tokens.css).
+
+Primitives get literal values in :root and their dark values in .dark.
+Theme and semantic tokens are emitted as var() aliases of the primitive
+they resolve through, so switching theme is just the .dark class toggle:
+
+    Blue/60               --color-blue-60: #3182F6;
+    brand/60              --color-brand-60: var(--color-blue-60);
+    text.primary          --color-text-primary: var(--color-neutral-100);
+
+A primitive defined in only one mode uses that value in both, like the
+palette's rgb/hsl columns: a dark-only shade (e.g. DeepGreen/60) gets its
+dark hex in :root, so aliases of it still resolve in light mode.
+"""
+
+import re
+
+from token_resolver import load_graph
+
+HEADER = "/* Generated by src/scripts/tokens.py build. Do not edit by hand. */\n"
+
+
+def css_var(ref):
+    """Blue/60 -> --color-blue-60, avatar/yellowOrange/20 -> --color-avatar-yellow-orange-20"""
+    name = re.sub(r'(?<=[a-z0-9])(?=[A-Z])', '-', ref)
+    name = re.sub(r'[^a-zA-Z0-9]+', '-', name).strip('-').lower()
+    return f"--color-{name}"
+
+
+def build_tokens_css(palette_path, theme_md, semantic_dev_md):
+    graph = load_graph(palette_path, theme_md, semantic_dev_md)
+    # Fails on dangling references and cycles before anything is emitted
+    graph.resolve()
+
+    light = []
+    dark = []
+    aliases = []
+    owners = {}
+
+    for ref, (target, shade, _, _) in graph.nodes.items():
+        name = css_var(ref)
+        if name in owners:
+            raise ValueError(f"CSS variable {name} generated for both '{owners[name]}' and '{ref}'")
+        owners[name] = ref
+
+        if target is not None:
+            aliases.append(f"  {name}: var({css_var(target)});")
+            continue
+        if shade['hex'] or shade['hexDark']:
+            light.append(f"  {name}: {shade['hex'] or shade['hexDark']};")
+        # Without a dark value the :root one applies under .dark too
+        if shade['hexDark']:
+            dark.append(f"  {name}: {shade['hexDark']};")
+
+    # Aliases are repeated under .dark so they re-resolve on any element carrying the class
+    return (
+        HEADER
+        + ":root {\n" + "\n".join(light) + "\n}\n\n"
+        + ".dark {\n" + "\n".join(dark) + "\n}\n\n"
+        + ":root,\n.dark {\n" + "\n".join(aliases) + "\n}\n"
+    )
@@ -0,0 +1,307 @@
+"""
+Long-running token daemon (tokens.py serve).
+
+Loads color_palette.json, # Theme.md and # Semantic_dev_code.md once,
+keeps the resolved alias graph in memory and rebuilds + reloads when a
+source markdown file changes. Queries are newline-delimited JSON-RPC 2.0
+over a Unix socket (default .cache/tokens/daemon.sock) or, with a port,
+over TCP on 127.0.0.1. One request per line, one response per line:
+
+    {"jsonrpc": "2.0", "id": 1, "method": "resolve", "params": {"refs": ["text.primary"]}}
+
+Methods:
+
+    resolve         {refs: [...]}  -> {ref: {hex, hexDark, rgb, hsl, chain} or null}
+    reverse-lookup  {hex: "#..."}  -> refs whose light or dark value is hex
+                    {ref: "..."}   -> refs aliasing ref, directly or through other aliases
+    rebuild         {force: bool}  -> pipeline results, then reloads the graph
+    status          {}             -> token count, load and build times
+
+A failed build or reload (e.g. a dangling alias while a file is half
+edited, or an icon validation error) keeps serving the previous graph, if
+any, and reports the problems in status.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from collections import defaultdict, deque
+
+import token_pipeline
+import token_watch
+from token_cache import CACHE_DIR
+from token_index import index_from_graph
+from token_resolver import ResolutionError, load_graph
+
+SOCKET_PATH = os.path.join(CACHE_DIR, 'daemon.sock')
+HOST = '127.0.0.1'
+SOURCES = ('color_palette.json', '# Theme.md', '# Semantic_dev_code.md')
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+
+
+class RpcError(Exception):
+    def __init__(self, code, message, data=None):
+        super().__init__(message)
+        self.code = code
+        self.data = data
+
+
+class TokenStore:
+    """
+    Resolved tokens plus reverse indexes, swapped in whole on every reload.
+
+    Readers use the current snapshot without locking; rebuilds are serialized.
+    """
+
+    def __init__(self, data_dir=token_pipeline.DATA_DIR):
+        self.data_dir = data_dir
+        self.rebuild_lock = threading.Lock()
+        self.snapshot = None
+        self.problems = []
+        self.last_build = None
+
+    def load(self):
+        started = time.perf_counter()
+        graph = load_graph(*(os.path.join(self.data_dir, name) for name in SOURCES))
+        resolved = graph.resolve()
+        index = index_from_graph(graph, resolved)
+
+        by_hex = defaultdict(set)
+        dependents = defaultdict(list)
+        for ref, (target, _, _, _) in graph.nodes.items():
+            for value in (index[ref]['hex'], index[ref]['hexDark']):
+                if value:
+                    by_hex[value.upper()].add(ref)
+            if target is not None:
+                dependents[target].append(ref)
+
+        self.snapshot = {
+            "nodes": graph.nodes,
+            "index": index,
+            "byHex": {key: sorted(refs) for key, refs in by_hex.items()},
+            "dependents": dependents,
+            "loadedAt": time.time(),
+            "loadSeconds": time.perf_counter() - started,
+        }
+        self.problems = []
+
+    def rebuild(self, force=False):
+        with self.rebuild_lock:
+            try:
+                results = token_pipeline.build(data_dir=self.data_dir, force=force)
+                self.last_build = {"at": time.time(), "results": results}
+                self.load()
+            except ResolutionError as e:
+                self.problems = e.problems
+                raise
+            except Exception as e:
+                # Icon validation, missing inputs, ...: keep serving and report them in status
+                self.problems = [f"{type(e).__name__}: {e}"]
+                raise
+            return results
+
+    def resolve(self, refs):
+        snapshot = self._current()
+        nodes = snapshot["nodes"]
+        answer = {}
+        for ref in refs:
+            entry = snapshot["index"].get(ref)
+            if entry is None:
+                answer[ref] = None
+                continue
+            chain = [ref]
+            while nodes[chain[-1]][0] is not None:
+                chain.append(nodes[chain[-1]][0])
+            answer[ref] = dict(entry, chain=chain)
+        return answer
+
+    def reverse_lookup(self, hex_value=None, ref=None):
+        snapshot = self._current()
+        if hex_value is not None:
+            return snapshot["byHex"].get(hex_value.upper(), [])
+
+        dependents = snapshot["dependents"]
+        found = []
+        seen = {ref}
+        queue = deque([ref])
+        while queue:
+            for alias in dependents.get(queue.popleft(), ()):
+                if alias not in seen:
+                    seen.add(alias)
+                    found.append(alias)
+                    queue.append(alias)
+        return found
+
+    def status(self):
+        snapshot = self.snapshot
+        return {
+            "tokens": len(snapshot["index"]) if snapshot else 0,
+            "loadedAt": snapshot["loadedAt"] if snapshot else None,
+            "loadSeconds": round(snapshot["loadSeconds"], 6) if snapshot else None,
+            "lastBuild": self.last_build,
+            "problems": self.problems,
+            "pid": os.getpid(),
+        }
+
+    def _current(self):
+        if self.snapshot is None:
+            raise RpcError(SERVER_ERROR, "Tokens are not loaded", self.problems)
+        return self.snapshot
+
+
+def _method_table(store):
+    def resolve(params):
+        refs = params.get("refs", [params["ref"]] if "ref" in params else None)
+        if not isinstance(refs, list):
+            raise RpcError(INVALID_PARAMS, "resolve needs 'refs' (list) or 'ref'")
+        return store.resolve(refs)
+
+    def reverse_lookup(params):
+        if "hex" in params:
+            return store.reverse_lookup(hex_value=params["hex"])
+        if "ref" in params:
+            return store.reverse_lookup(ref=params["ref"])
+        raise RpcError(INVALID_PARAMS, "reverse-lookup needs 'hex' or 'ref'")
+
+    def rebuild(params):
+        return [{"stage": name, "status": status} for name, status in store.rebuild(bool(params.get("force")))]
+
+    return {
+        "resolve": resolve,
+        "reverse-lookup": reverse_lookup,
+        "rebuild": rebuild,
+        "status": lambda params: store.status(),
+    }
+
+
+def handle_request(methods, line):
+    """One JSON-RPC request line -> response dict (None for notifications)."""
+    request_id = None
+    try:
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise RpcError(PARSE_ERROR, f"Parse error: {e}")
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            raise RpcError(INVALID_REQUEST, "Invalid request")
+        request_id = request.get("id")
+        method = methods.get(request["method"])
+        if method is None:
+            raise RpcError(METHOD_NOT_FOUND, f"Unknown method '{request['method']}'")
+        params = request.get("params") or {}
+        if not isinstance(params, dict):
+            raise RpcError(INVALID_PARAMS, "params must be an object")
+        result = method(params)
+        if "id" not in request:
+            return None
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+    except RpcError as e:
+        error = {"code": e.code, "message": str(e)}
+        if e.data is not None:
+            error["data"] = e.data
+    except ResolutionError as e:
+        error = {"code": SERVER_ERROR, "message": "Token resolution failed", "data": e.problems}
+    except Exception as e:
+        error = {"code": SERVER_ERROR, "message": f"{type(e).__name__}: {e}"}
+    return {"jsonrpc": "2.0", "id": request_id, "error": error}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = handle_request(self.server.methods, line)
+            if response is not None:
+                self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n')
+                self.wfile.flush()
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _TcpServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def _claim_socket(path):
+    """Removes a stale socket file; fails if a daemon is already listening on it."""
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        os.remove(path)
+    else:
+        raise RuntimeError(f"A token daemon is already listening on {path}")
+    finally:
+        probe.close()
+
+
+def serve(store, socket_path=SOCKET_PATH, port=None, watch=True, polling=False, on_ready=None):
+    """Builds, loads and serves until interrupted."""
+    try:
+        store.rebuild()
+    except Exception as e:
+        # Serve anyway; status reports the problems and the watcher retries on the next save
+        print(e)
+
+    if watch:
+        def on_change(names):
+            print(f"[{time.strftime('%H:%M:%S')}] Changed: {', '.join(names)}")
+            try:
+                store.rebuild()
+                print(f"Reloaded {len(store.snapshot['index'])} tokens")
+            except Exception as e:
+                print(f"Rebuild failed, serving the previous tokens: {e}")
+
+        threading.Thread(target=token_watch.watch, args=(store.data_dir, on_change),
+                         kwargs={"polling": polling}, daemon=True).start()
+
+    if port is not None:
+        server = _TcpServer((HOST, port), _Handler)
+        address = f"{HOST}:{server.server_address[1]}"
+    else:
+        _claim_socket(socket_path)
+        server = _UnixServer(socket_path, _Handler)
+        address = socket_path
+    server.methods = _method_table(store)
+
+    try:
+        if on_ready:
+            on_ready(address)
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if port is None and os.path.exists(socket_path):
+            os.remove(socket_path)
+
+
+def request(method, params=None, socket_path=SOCKET_PATH, port=None, timeout=10):
+    """Sends one request to a running daemon and returns its result (raises RpcError on error)."""
+    if port is not None:
+        conn = socket.create_connection((HOST, port), timeout=timeout)
+    else:
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        conn.settimeout(timeout)
+        conn.connect(socket_path)
+    with conn, conn.makefile('rwb') as stream:
+        stream.write(json.dumps({"jsonrpc": "2.0", "id": 1, "method": method, "params": params or {}}).encode('utf-8') + b'\n')
+        stream.flush()
+        response = json.loads(stream.readline())
+    if "error" in response:
+        error = response["error"]
+        raise RpcError(error["code"], error["message"], error.get("data"))
+    return response["result"]
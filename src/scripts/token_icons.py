@@ -0,0 +1,231 @@
+"""
+Icon sprite sheets and manifest from src/assets/icons.
+
+Each style directory (line, fill, stroke, and every illust/<subfolder>)
+becomes one sprite, sprites/<style>.svg, holding a <symbol> per icon:
+
+    <svg xmlns="http://www.w3.org/2000/svg"><symbol id="line-add_circle" viewBox="0 0 20 20" fill="none">...</symbol>...</svg>
+
+Icons are optimized on the way in: XML declarations, comments and
+whitespace between tags are dropped, width/height/xmlns move off the root,
+and internal ids (masks, clip paths, gradients) are prefixed with the
+symbol id so they cannot collide inside one sprite.
+
+icon_manifest.json records, per style, the sprite path and size and, per
+icon, the symbol id, its byte offset and length in the sprite, its viewBox
+and a content hash. Optimized symbols are cached in
+.cache/tokens/icons.json by file size, mtime and sha256, so unchanged
+icons are not re-read or re-optimized.
+
+The mapping JSONs are validated against the files: a mapping entry that
+names a missing SVG fails the build (IconError); unreferenced SVGs and
+duplicate labels are recorded under "warnings" in the manifest and printed
+when the manifest changes.
+
+The sprites and manifest are build outputs for tools outside the site and
+are not committed; the icon pages render the SVGs from src/assets/icons.
+"""
+
+import hashlib
+import json
+import os
+import re
+
+from token_cache import CACHE_DIR
+from token_io import dumps_json, file_digest, write_json
+
+CACHE_FILE = os.path.join(CACHE_DIR, 'icons.json')
+MANIFEST_VERSION = 1
+SPRITE_DIR = 'sprites'
+FLAT_STYLES = ('line', 'fill', 'stroke')
+ILLUST_DIR = 'illust'
+# icon_filename_mapping.json section -> style directory
+MAPPING_STYLES = {'line_icons': 'line', 'filled_icons': 'fill'}
+
+ROOT_RE = re.compile(r'<svg\b([^>]*)>(.*)</svg>\s*$', re.S)
+ATTR_RE = re.compile(r'([\w:-]+)="([^"]*)"')
+ID_RE = re.compile(r'\bid="([^"]+)"')
+DROP_RE = re.compile(r'<\?xml.*?\?>|<!--.*?-->|<!DOCTYPE[^>]*>|<metadata\b.*?</metadata>', re.S)
+ROOT_ONLY_ATTRS = {'width', 'height', 'xmlns', 'xmlns:xlink', 'version', 'viewBox', 'id'}
+
+
+class IconError(ValueError):
+    pass
+
+
+def optimize_svg(text, symbol_id):
+    """
+    Converts one SVG document into a <symbol>.
+
+    Returns:
+        (symbol markup, [min-x, min-y, width, height])
+    """
+    text = DROP_RE.sub('', text)
+    match = ROOT_RE.search(text)
+    if not match:
+        raise IconError(f"{symbol_id}: not an <svg> document")
+    attrs = dict(ATTR_RE.findall(match.group(1)))
+    body = re.sub(r'>\s+<', '><', match.group(2).strip())
+
+    if 'viewBox' in attrs:
+        view_box = [float(v) for v in attrs['viewBox'].replace(',', ' ').split()]
+    elif 'width' in attrs and 'height' in attrs:
+        view_box = [0.0, 0.0, float(attrs['width'].rstrip('px')), float(attrs['height'].rstrip('px'))]
+    else:
+        raise IconError(f"{symbol_id}: no viewBox or width/height")
+    view_box = [int(v) if v == int(v) else v for v in view_box]
+
+    for old in set(ID_RE.findall(body)):
+        new = f"{symbol_id}-{old}"
+        body = body.replace(f'id="{old}"', f'id="{new}"')
+        body = body.replace(f'url(#{old})', f'url(#{new})')
+        body = body.replace(f'href="#{old}"', f'href="#{new}"')
+
+    extra = ''.join(f' {name}="{value}"' for name, value in attrs.items() if name not in ROOT_ONLY_ATTRS)
+    view_box_text = ' '.join(str(v) for v in view_box)
+    return f'<symbol id="{symbol_id}" viewBox="{view_box_text}"{extra}>{body}</symbol>', view_box
+
+
+def scan_styles(icons_dir):
+    """{style: {icon name: path}} for every style directory, names sorted."""
+    styles = {}
+    for style in FLAT_STYLES:
+        directory = os.path.join(icons_dir, style)
+        if os.path.isdir(directory):
+            styles[style] = _svgs(directory)
+    illust_dir = os.path.join(icons_dir, ILLUST_DIR)
+    if os.path.isdir(illust_dir):
+        for sub in sorted(os.listdir(illust_dir)):
+            if os.path.isdir(os.path.join(illust_dir, sub)):
+                styles[f"{ILLUST_DIR}-{sub}"] = _svgs(os.path.join(illust_dir, sub))
+    return styles
+
+
+def _svgs(directory):
+    return {name[:-4]: os.path.join(directory, name)
+            for name in sorted(os.listdir(directory)) if name.lower().endswith('.svg')}
+
+
+def load_cache(path=CACHE_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def cached_symbol(cache, path, symbol_id, stats):
+    """Optimized symbol for path, reusing the cache entry when the file is unchanged."""
+    stat = os.stat(path)
+    entry = cache.get(path)
+    if entry and entry['id'] == symbol_id and entry['size'] == stat.st_size and entry['mtimeNs'] == stat.st_mtime_ns:
+        stats['cached'] += 1
+        return entry
+
+    with open(path, 'rb') as f:
+        content = f.read()
+    digest = hashlib.sha256(content).hexdigest()
+    if entry and entry['id'] == symbol_id and entry['sha256'] == digest:
+        stats['cached'] += 1
+    else:
+        symbol, view_box = optimize_svg(content.decode('utf-8'), symbol_id)
+        entry = {'id': symbol_id, 'sha256': digest, 'symbol': symbol, 'viewBox': view_box}
+        stats['optimized'] += 1
+    entry.update(size=stat.st_size, mtimeNs=stat.st_mtime_ns)
+    cache[path] = entry
+    return entry
+
+
+def validate(styles, filename_mapping, label_lists, illustration_icons):
+    """
+    Checks the mapping JSONs against the scanned icons.
+
+    Returns:
+        (errors, warnings) as lists of messages
+    """
+    errors = []
+    warnings = []
+    for section, style in MAPPING_STYLES.items():
+        files = styles.get(style, {})
+        mapped = filename_mapping.get(section, {})
+        for label, filename in mapped.items():
+            if filename not in files:
+                errors.append(f"icon_filename_mapping.json: {section}['{label}'] -> {style}/{filename}.svg does not exist")
+        unreferenced = sorted(set(files) - set(mapped.values()))
+        if unreferenced:
+            warnings.append(f"{style}: {len(unreferenced)} SVGs not in icon_filename_mapping.json: {', '.join(unreferenced)}")
+
+        labels = label_lists.get(section, [])
+        seen = set()
+        for label in labels:
+            if label in seen:
+                warnings.append(f"{section}: duplicate label '{label}'")
+            seen.add(label)
+            if label not in mapped:
+                errors.append(f"{section}: label '{label}' has no entry in icon_filename_mapping.json")
+
+    for group, config in illustration_icons.items():
+        subfolder = config.get('subfolder')
+        if subfolder and f"{ILLUST_DIR}-{subfolder}" not in styles:
+            errors.append(f"illustration_icons.json: {group} -> {ILLUST_DIR}/{subfolder}/ does not exist")
+    return errors, warnings
+
+
+def build_icon_assets(icons_dir, mapping_json, line_json, filled_json, illustration_json, cache_path=CACHE_FILE):
+    """Returns {relative path: bytes} for icon_manifest.json and every sprite."""
+    styles = scan_styles(icons_dir)
+
+    def load(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    label_lists = {**load(line_json), **load(filled_json)}
+    errors, warnings = validate(styles, load(mapping_json), label_lists, load(illustration_json))
+    if errors:
+        raise IconError("Icon validation failed:\n" + "\n".join(f"  {e}" for e in errors))
+
+    cache = load_cache(cache_path)
+    stats = {'cached': 0, 'optimized': 0}
+    files = {}
+    manifest = {"version": MANIFEST_VERSION, "warnings": warnings, "styles": {}}
+    for style, icons in styles.items():
+        head = b'<svg xmlns="http://www.w3.org/2000/svg">'
+        parts = [head]
+        offset = len(head)
+        entries = {}
+        for name, path in icons.items():
+            entry = cached_symbol(cache, path, f"{style}-{name}", stats)
+            symbol = entry['symbol'].encode('utf-8')
+            entries[name] = {
+                "id": entry['id'],
+                "offset": offset,
+                "length": len(symbol),
+                "viewBox": entry['viewBox'],
+                "sha256": entry['sha256'][:16],
+            }
+            parts.append(symbol)
+            offset += len(symbol)
+        parts.append(b'</svg>\n')
+        sprite = b''.join(parts)
+
+        sprite_name = f"{SPRITE_DIR}/{style}.svg"
+        files[sprite_name] = sprite
+        manifest["styles"][style] = {
+            "sprite": sprite_name,
+            "bytes": len(sprite),
+            "sha256": hashlib.sha256(sprite).hexdigest()[:16],
+            "icons": entries,
+        }
+
+    # Drop entries for icons that were deleted or moved
+    live = {path for icons in styles.values() for path in icons.values()}
+    write_json(cache_path, {path: entry for path, entry in cache.items() if path in live}, ensure_ascii=False, indent=None)
+
+    files['icon_manifest.json'] = dumps_json(manifest, ensure_ascii=False, indent=None).encode('utf-8')
+    # Report only when the output changes, not on every rebuild with the same icons and mappings
+    manifest_path = os.path.join(os.path.dirname(mapping_json), 'icon_manifest.json')
+    if file_digest(manifest_path) != hashlib.sha256(files['icon_manifest.json']).hexdigest():
+        for warning in warnings:
+            print(f"Icon warning: {warning}")
+        print(f"Icons: {stats['optimized']} optimized, {stats['cached']} unchanged")
+    return files
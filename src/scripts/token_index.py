@@ -0,0 +1,36 @@
+"""
+Flat token resolution index (token_index.json).
+
+Maps every token reference the site resolves at runtime to its final
+color values, so colorUtils.ts answers with a single lookup instead of
+walking the palette, theme and semantic data:
+
+    "Blue/60"        primitive variable
+    "brand/60"       theme token (as referenced from semantic values)
+    "avatar/red/20"  avatar theme token
+    "text.primary"   semantic dev token
+
+Each entry is {hex, hexDark} copied from the resolved palette entry. The
+daemon and variant builds keep rgb and hsl too (index_from_graph's default).
+"""
+
+from token_resolver import load_graph
+
+FIELDS = ('hex', 'hexDark', 'rgb', 'hsl')
+# All colorUtils.ts reads; rgb and hsl are derivable from hex on the client
+SITE_FIELDS = ('hex', 'hexDark')
+
+
+def build_token_index(palette_path, theme_md, semantic_dev_md):
+    return index_from_graph(load_graph(palette_path, theme_md, semantic_dev_md), fields=SITE_FIELDS)
+
+
+def index_from_graph(graph, resolved=None, fields=FIELDS):
+    if resolved is None:
+        resolved = graph.resolve()
+
+    index = {}
+    for ref in graph.nodes:
+        shade = graph.value(ref, resolved)
+        index[ref] = {field: shade[field] for field in fields}
+    return index
@@ -0,0 +1,168 @@
+"""
+Shared output helpers for the token scripts.
+
+write_json serializes in memory and only touches the target when its
+content actually changed, so unchanged outputs keep their mtime and do
+not trigger Vite reloads. Writes go through a temp file in the same
+directory followed by os.replace, so an interrupted run never leaves
+half-written JSON behind.
+
+patch_json rewrites only the top-level sections whose value changed and
+copies every other section's text from the previous file unchanged.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+import token_trace
+
+_umask = os.umask(0)
+os.umask(_umask)
+DEFAULT_MODE = 0o666 & ~_umask
+
+
+def dumps_json(data, ensure_ascii=True, indent=2):
+    return json.dumps(data, indent=indent, ensure_ascii=ensure_ascii)
+
+
+def file_digest(path):
+    """sha256 of a file's bytes, or None if it does not exist."""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def write_bytes(path, content):
+    """
+    Atomically writes content to path unless it already holds exactly those bytes.
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    with token_trace.span('write', file=os.path.basename(path), bytes=len(content)) as info:
+        info['written'] = _write_bytes(path, content)
+        return info['written']
+
+
+def _write_bytes(path, content):
+    if file_digest(path) == hashlib.sha256(content).hexdigest():
+        return False
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = DEFAULT_MODE
+
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return True
+
+
+def write_text(path, text):
+    return write_bytes(path, text.encode('utf-8'))
+
+
+def write_json(path, data, ensure_ascii=True, indent=2):
+    """Writes data as JSON (json.dump formatting) only if the serialized output changed."""
+    with token_trace.span('serialize', file=os.path.basename(path)):
+        text = dumps_json(data, ensure_ascii=ensure_ascii, indent=indent)
+    return write_text(path, text)
+
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+
+def _skip(text, i):
+    while i < len(text) and text[i] in _WHITESPACE:
+        i += 1
+    return i
+
+
+def json_sections(text):
+    """
+    Splits a JSON object document into its top-level members.
+
+    Returns:
+        Dict of key -> (value, start, end) with the value's character span
+        in text, or None if text is not a single JSON object
+    """
+    sections = {}
+    try:
+        i = _skip(text, 0)
+        if text[i] != '{':
+            return None
+        i = _skip(text, i + 1)
+        if text[i] == '}':
+            return sections if _skip(text, i + 1) == len(text) else None
+        while True:
+            key, i = _decoder.raw_decode(text, i)
+            i = _skip(text, i)
+            if text[i] != ':':
+                return None
+            start = _skip(text, i + 1)
+            value, end = _decoder.raw_decode(text, start)
+            sections[key] = (value, start, end)
+            i = _skip(text, end)
+            if text[i] == '}':
+                return sections if _skip(text, i + 1) == len(text) else None
+            if text[i] != ',':
+                return None
+            i = _skip(text, i + 1)
+    except (IndexError, ValueError):
+        return None
+
+
+def patch_json(path, data, ensure_ascii=True, indent=2):
+    """
+    Writes the dict data to path, re-serializing only top-level sections that changed.
+
+    Sections whose value equals the one already in the file keep their exact
+    previous text, so a one-category edit yields a one-category diff. Falls
+    back to a full write_json when the file is missing or not an object.
+
+    Returns:
+        (written, changed keys); changed keys is None after a full write
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            previous = f.read()
+    except FileNotFoundError:
+        previous = None
+    sections = json_sections(previous) if previous is not None else None
+    if not sections or not data:
+        return write_json(path, data, ensure_ascii=ensure_ascii, indent=indent), None
+
+    pad = ' ' * indent
+    members = []
+    changed = []
+    with token_trace.span('serialize', file=os.path.basename(path)) as info:
+        for key, value in data.items():
+            old = sections.get(key)
+            if old is not None and old[0] == value:
+                value_text = previous[old[1]:old[2]]
+            else:
+                changed.append(key)
+                value_text = dumps_json(value, ensure_ascii=ensure_ascii, indent=indent).replace('\n', '\n' + pad)
+            members.append(f"{pad}{json.dumps(key, ensure_ascii=ensure_ascii)}: {value_text}")
+        changed += [key for key in sections if key not in data]
+        info['changed'] = len(changed)
+    return write_text(path, "{\n" + ",\n".join(members) + "\n}"), changed
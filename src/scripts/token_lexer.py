@@ -0,0 +1,89 @@
+"""
+Streaming lexer for the markdown token sources in src/data/.
+
+All token files share one dialect:
+
+    ## Light Theme            -> SECTION  'Light Theme'
+    ### Blue                  -> FAMILY   'Blue'
+    - Blue/10: #E8F3FF        -> ENTRY    key 'Blue/10', value '#E8F3FF'
+    - Color/text/primary      -> ENTRY    key 'Color/text/primary', value None
+    /**** ...                 -> COMMENT  (whole block skipped up to the line ending in */)
+    ****/
+
+lex_markdown() reads the file line by line and yields one Event per
+meaningful line, so memory use does not grow with the file.
+"""
+
+import os
+import re
+from collections import namedtuple
+
+import token_trace
+
+SECTION = 'section'
+FAMILY = 'family'
+ENTRY = 'entry'
+COMMENT = 'comment'
+
+# key/value are only set for ENTRY; name is the header text (SECTION/FAMILY)
+# or the full bullet text (ENTRY)
+Event = namedtuple('Event', 'kind line name key value')
+
+LINE_RE = re.compile(r'(?:(#{2,3})(?!#)\s*(.*)|-\s+(.*))')
+COMMENT_START_RE = re.compile(r'/\*')
+
+
+def lex_lines(lines):
+    """Yields Events for an iterable of lines (line numbers start at 1)."""
+    comment_start = None
+    for line_no, raw in enumerate(lines, 1):
+        line = raw.strip()
+        if not line:
+            continue
+
+        if comment_start is not None:
+            if line.endswith('*/'):
+                yield Event(COMMENT, comment_start, None, None, None)
+                comment_start = None
+            continue
+
+        if COMMENT_START_RE.match(line):
+            if line.endswith('*/') and len(line) > 2:
+                yield Event(COMMENT, line_no, None, None, None)
+            else:
+                comment_start = line_no
+            continue
+
+        match = LINE_RE.match(line)
+        if not match:
+            continue
+        hashes, header, bullet = match.groups()
+        if hashes:
+            header = header.strip()
+            yield Event(SECTION if len(hashes) == 2 else FAMILY, line_no, header, None, None)
+        else:
+            key, sep, value = bullet.partition(':')
+            key = key.strip()
+            if key:
+                yield Event(ENTRY, line_no, bullet.strip(), key, value.strip() if sep else None)
+
+    if comment_start is not None:
+        # Unterminated block: everything after it was skipped
+        yield Event(COMMENT, comment_start, None, None, None)
+
+
+def lex_markdown(path):
+    """Yields Events for the markdown file at path."""
+    if token_trace.ENABLED:
+        # Traced builds read and lex up front so the two phases are timed separately
+        with token_trace.span('read', file=os.path.basename(path)):
+            with open(path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        with token_trace.span('lex', file=os.path.basename(path)) as info:
+            events = list(lex_lines(lines))
+            info['tokens'] = sum(1 for event in events if event.kind == ENTRY)
+        yield from events
+        return
+
+    with open(path, 'r', encoding='utf-8') as f:
+        yield from lex_lines(f)
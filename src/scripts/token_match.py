@@ -0,0 +1,190 @@
+"""
+Design token <-> dev token matching for semantic_color_mapping.json.
+
+Matching runs in three steps per dev token:
+
+    exact      normalized keys are equal (Color/text/error-light == text.error_light)
+    fuzzy      best candidate scores >= AUTO_LINK and clearly beats the runner-up;
+               it is linked automatically
+    suggested  best candidate scores >= SUGGEST; reported but not linked
+
+Candidates come from a trigram index over the normalized design keys.
+A dev key's trigrams are looked up rarest first, stopping after RARE_GRAMS
+once MAX_CANDIDATES design tokens were found, and only those sharing the
+most trigrams are ranked, so a lookup does not walk the whole token set. Candidates are ranked by edit
+distance (score = 1 - distance / longer length), with a bonus for staying
+in the same category. A token whose group was renamed (bg/strong vs
+background.strong) is found through its category and the rest of its key,
+scoring RENAMED_GROUP. Each design token is linked at most once;
+exact matches are claimed before any fuzzy ones (but, as before, several
+dev tokens may share an exact match). When several design tokens normalize
+to the same key, the last one is the exact match, as before, and the
+others are listed under "duplicateDesignTokens" in the report.
+"""
+
+import re
+from collections import Counter, defaultdict
+
+AUTO_LINK = 0.85
+SUGGEST = 0.6
+# A fuzzy link must beat the runner-up by this much, otherwise it is only suggested
+MARGIN = 0.05
+MAX_CANDIDATES = 12
+RARE_GRAMS = 6
+CATEGORY_BONUS = 0.05
+RENAMED_GROUP = 0.9
+
+
+def normalize_key(key):
+    """Normalizes key for matching."""
+    # Remove 'Color/' prefix case-insensitively
+    key = re.sub(r'^Color/', '', key, flags=re.IGNORECASE)
+    # Remove all non-alphanumeric characters (including spaces, dots, slashes) and lowercase
+    return re.sub(r'[^a-zA-Z0-9]', '', key).lower()
+
+
+def trigrams(key):
+    padded = f"^{key}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a, b):
+    """Levenshtein distance, bit-parallel over a (Myers / Hyyrö) so each char of b is O(1) big-int ops."""
+    m = len(a)
+    if not m:
+        return len(b)
+    peq = {}
+    for i, c in enumerate(a):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    mask = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv, mv, score = mask, 0, m
+    for c in b:
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & mask) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+    return score
+
+
+def tail_key(token):
+    """Normalized key without its group: Color/bg/strong and background.strong -> 'strong'"""
+    token = re.sub(r'^Color/', '', token, flags=re.IGNORECASE)
+    parts = re.split(r'[./]', token, maxsplit=1)
+    return normalize_key(parts[1]) if len(parts) > 1 else ''
+
+
+class TokenMatcher:
+    def __init__(self, design_tokens_by_cat):
+        # design entries: (token, category, normalized key)
+        self.entries = []
+        self.exact = {}
+        self.index = defaultdict(list)
+        # (category, tail key) -> entry ids, for renamed groups
+        self.tails = defaultdict(list)
+        # normalized key -> every design token with that key, when there is more than one
+        self.duplicates = {}
+        for category, tokens in design_tokens_by_cat.items():
+            for token in tokens:
+                norm = normalize_key(token)
+                entry_id = len(self.entries)
+                self.entries.append((token, category, norm))
+                if norm in self.exact:
+                    self.duplicates.setdefault(norm, [self.entries[self.exact[norm]][0]]).append(token)
+                self.exact[norm] = entry_id
+                tail = tail_key(token)
+                if tail:
+                    self.tails[(category, tail)].append(entry_id)
+                for gram in trigrams(norm):
+                    self.index[gram].append(entry_id)
+
+    def candidates(self, dev_token, norm, category, taken):
+        """(score, design entry id) for the closest untaken design tokens, best first."""
+        grams = sorted(trigrams(norm), key=lambda gram: len(self.index.get(gram, ())))
+        shared = Counter()
+        for used, gram in enumerate(grams, 1):
+            for entry_id in self.index.get(gram, ()):
+                if entry_id not in taken:
+                    shared[entry_id] += 1
+            # Commoner trigrams are only walked while too few candidates were found
+            if used >= RARE_GRAMS and len(shared) >= MAX_CANDIDATES:
+                break
+
+        scores = {}
+        for entry_id, _ in shared.most_common(MAX_CANDIDATES):
+            _, design_category, design_norm = self.entries[entry_id]
+            longer = max(len(norm), len(design_norm)) or 1
+            score = 1 - edit_distance(norm, design_norm) / longer
+            if design_category == category:
+                score = min(1.0, score + CATEGORY_BONUS)
+            scores[entry_id] = round(score, 3)
+
+        tail = tail_key(dev_token)
+        for entry_id in self.tails.get((category, tail), ()) if tail else ():
+            if entry_id not in taken:
+                scores[entry_id] = max(scores.get(entry_id, 0.0), RENAMED_GROUP)
+
+        return sorted(((score, entry_id) for entry_id, score in scores.items()), key=lambda item: (-item[0], item[1]))
+
+    def match_all(self, dev_tokens_by_cat):
+        """
+        Matches every dev token.
+
+        Returns:
+            List of report rows in dev token order, each a dict with
+            category, devToken, designToken ('' if not linked), match
+            ('exact', 'fuzzy', 'suggested' or 'none'), score and suggestions
+        """
+        rows = []
+        taken = set()
+        pending = []
+        for category, dev_list in dev_tokens_by_cat.items():
+            for dev_item in dev_list:
+                dev_token = dev_item['devToken']
+                norm = normalize_key(dev_token)
+                row = {"category": category, "devToken": dev_token, "designToken": "",
+                       "match": "none", "score": 0.0, "suggestions": []}
+                entry_id = self.exact.get(norm)
+                if entry_id is not None:
+                    taken.add(entry_id)
+                    row.update(designToken=self.entries[entry_id][0], match="exact", score=1.0)
+                else:
+                    pending.append((row, dev_token, norm, category))
+                rows.append(row)
+
+        for row, dev_token, norm, category in pending:
+            ranked = self.candidates(dev_token, norm, category, taken)
+            row["suggestions"] = [{"designToken": self.entries[entry_id][0], "score": score}
+                                  for score, entry_id in ranked[:3] if score >= SUGGEST]
+            if not row["suggestions"]:
+                continue
+            best_score, best_id = ranked[0]
+            runner_up = ranked[1][0] if len(ranked) > 1 else 0.0
+            row["score"] = best_score
+            if best_score >= AUTO_LINK and best_score - runner_up >= MARGIN:
+                taken.add(best_id)
+                row.update(designToken=self.entries[best_id][0], match="fuzzy")
+            else:
+                row["match"] = "suggested"
+
+        return rows
+
+    def report(self, rows):
+        """Match report document: counts, every non-exact row and unlinked design tokens."""
+        linked = {row["designToken"] for row in rows if row["designToken"]}
+        return {
+            "summary": dict(Counter(row["match"] for row in rows)),
+            "tokens": [row for row in rows if row["match"] != "exact"],
+            "unmatchedDesignTokens": [token for token, _, _ in self.entries if token not in linked],
+            "duplicateDesignTokens": [{"key": key, "tokens": tokens, "linked": tokens[-1]}
+                                      for key, tokens in self.duplicates.items()],
+        }
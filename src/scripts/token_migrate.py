@@ -0,0 +1,145 @@
+"""
+Batch token migration across src/data.
+
+A migration map is a JSON or YAML file:
+
+    renames:            # whole-reference renames
+      color_blue_10: Blue/10
+      text.disabled: text.muted
+    segments:           # renames of single '/'-separated parts
+      coolGray: slateGray
+    aliases: false      # also match case/separator variants of the old names
+    keys: true          # also rename JSON object keys
+
+A bare mapping without these sections is read as `renames`.
+
+Every src/data/*.json and src/data/# *.md file is rewritten in one pass
+over its text through a single RenameMap, so formatting, key order and
+escaping are kept byte for byte apart from the renamed references. Files
+are processed on a thread pool.
+"""
+
+import bisect
+import difflib
+import glob
+import json
+import os
+import re
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from token_io import write_text
+from token_lexer import ENTRY, lex_lines
+from token_rename import RenameMap
+
+# changes is a list of (line, old, new)
+FileResult = namedtuple('FileResult', 'path changes old_text new_text')
+
+JSON_STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"(\s*:)?')
+
+
+def load_migration(path):
+    """Reads a migration map file into a RenameMap and its options."""
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith(('.yaml', '.yml')):
+            try:
+                import yaml
+            except ImportError:
+                raise SystemExit("PyYAML is required for YAML migration maps (pip install pyyaml), or use JSON")
+            spec = yaml.safe_load(f) or {}
+        else:
+            spec = json.load(f)
+
+    if not isinstance(spec, dict):
+        raise ValueError(f"{path}: migration map must be a mapping")
+    if not {'renames', 'segments'} & spec.keys():
+        spec = {'renames': spec}
+
+    renames = RenameMap(aliases=bool(spec.get('aliases', False)))
+    for old, new in (spec.get('renames') or {}).items():
+        renames.add(str(old), str(new))
+    for old, new in (spec.get('segments') or {}).items():
+        renames.add_segment(str(old), str(new))
+    return renames, {'keys': bool(spec.get('keys', True))}
+
+
+def data_files(data_dir):
+    return sorted(glob.glob(os.path.join(data_dir, '*.json')) + glob.glob(os.path.join(data_dir, '# *.md')))
+
+
+def migrate_json_text(text, renames, keys=True):
+    changes = []
+    line_starts = [0] + [m.end() for m in re.finditer('\n', text)]
+
+    def replace(match):
+        literal = match.group(0)
+        is_key = match.group(1) is not None
+        if is_key and not keys:
+            return literal
+        quoted = literal[:len(literal) - len(match.group(1) or '')]
+        old = json.loads(quoted)
+        new = renames.lookup(old)
+        if new is None or new == old:
+            return literal
+        changes.append((bisect.bisect_right(line_starts, match.start()), old, new))
+        # Keep the file's escaping style: only escape non-ASCII if it already did
+        return json.dumps(new, ensure_ascii='\\u' in text) + (match.group(1) or '')
+
+    return JSON_STRING_RE.sub(replace, text), changes
+
+
+def migrate_markdown_text(text, renames):
+    lines = text.splitlines(keepends=True)
+    changes = []
+    for event in lex_lines(lines):
+        if event.kind != ENTRY:
+            continue
+        index = event.line - 1
+        line = lines[index]
+        bullet_at = line.index('-') + 1
+        head, sep, tail = line[bullet_at:].partition(':')
+
+        new_key = renames.lookup(event.key)
+        if new_key is not None and new_key != event.key:
+            head = head.replace(event.key, new_key, 1)
+            changes.append((event.line, event.key, new_key))
+        if sep and event.value:
+            new_value = renames.lookup(event.value)
+            if new_value is not None and new_value != event.value:
+                tail = tail.replace(event.value, new_value, 1)
+                changes.append((event.line, event.value, new_value))
+        lines[index] = line[:bullet_at] + head + sep + tail
+    return ''.join(lines), changes
+
+
+def migrate_file(path, renames, keys=True, dry_run=False):
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        text = f.read()
+    if path.endswith('.json'):
+        new_text, changes = migrate_json_text(text, renames, keys)
+    else:
+        new_text, changes = migrate_markdown_text(text, renames)
+    if changes and not dry_run:
+        write_text(path, new_text)
+    return FileResult(path, changes, text, new_text)
+
+
+def migrate(data_dir, renames, keys=True, dry_run=False, workers=None):
+    """
+    Applies renames to every token data file in data_dir.
+
+    Returns:
+        List of FileResult in file name order (one per scanned file)
+    """
+    paths = data_files(data_dir)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda p: migrate_file(p, renames, keys, dry_run), paths))
+
+
+def unified_diff(result, root=None):
+    name = os.path.relpath(result.path, root) if root else result.path
+    return ''.join(difflib.unified_diff(
+        result.old_text.splitlines(keepends=True),
+        result.new_text.splitlines(keepends=True),
+        fromfile=f"a/{name}", tofile=f"b/{name}"))
+
@@ -0,0 +1,119 @@
+"""
+Per-category ES modules (src/data/tokens/).
+
+Importing a whole generated JSON ties every component to every token in
+it, so one edited avatar color reloads them all. This stage emits one
+small module per category instead:
+
+    tokens/palette/blue.ts        color_palette.json family
+    tokens/theme/brand.ts         theme_color_mapping.json category
+    tokens/theme/avatar/red.ts    avatar tokens, one module per color
+    tokens/semantic/text.ts       semantic_color_mapping.json category
+    tokens/semantic/avatar/red.ts
+    tokens/<kind>/index.ts        the kind's modules combined into the shape of its JSON file
+
+Components import the categories they render, or the kind index when they
+list all of them:
+
+    import semanticIcon from '../data/tokens/semantic/icon';
+    import themeMapping from '../data/tokens/theme';
+
+Modules are rewritten only when their content changes, so an edited
+semantic category reloads the semantic pages, not the palette or theme
+ones. The indexes change only when categories are added or removed.
+
+The stage is optional (tokens.py build --modules); once src/data/tokens/
+exists it is kept up to date by every build.
+"""
+
+import json
+import re
+
+HEADER = "// Generated by src/scripts/tokens.py build. Do not edit by hand.\n"
+MODULE_DIR = 'tokens'
+# kind -> default export of tokens/<kind>/index.ts, named like the designSystemData.colors fields it replaced
+INDEX_NAMES = {'palette': 'palette', 'theme': 'themeMapping', 'semantic': 'semanticMapping'}
+# Avatar colors are spread back into one object (theme) or array (semantic)
+SPREAD = {'theme': ('{ ', ' }'), 'semantic': ('[', ']')}
+
+
+def module_name(name):
+    """yellowOrange, yellow_orange, YellowOrange -> yellow-orange"""
+    name = re.sub(r'(?<=[a-z0-9])(?=[A-Z])', '-', name)
+    return re.sub(r'[^a-zA-Z0-9]+', '-', name).strip('-').lower()
+
+
+def identifier(*parts):
+    """('theme', 'avatar', 'yellow-orange') -> themeAvatarYellowOrange"""
+    words = [w for part in parts for w in module_name(part).split('-') if w]
+    return words[0] + ''.join(w[:1].upper() + w[1:] for w in words[1:])
+
+
+def _avatar_color(key):
+    """color_avatar_yellow_orange_20 -> yellow-orange"""
+    return module_name(re.sub(r'^color_avatar_|_[^_]+$', '', key))
+
+
+def _module(name, data):
+    body = json.dumps(data, indent=2, ensure_ascii=False)
+    return f"{HEADER}const {name} = {body};\n\nexport default {name};\n".encode('utf-8')
+
+
+def build_token_modules(palette_path, theme_path, semantic_path):
+    """Returns {relative path: bytes} for every category module and the three kind indexes."""
+    def load(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    # (kind, category path parts, data); avatar categories are split per color
+    modules = []
+    for family, shades in load(palette_path)['colors']['palette'].items():
+        modules.append(('palette', (family,), shades))
+    for category, tokens in load(theme_path).items():
+        if category == 'avatar':
+            colors = {}
+            for key, value in tokens.items():
+                colors.setdefault(_avatar_color(key), {})[key] = value
+            modules.extend(('theme', (category, color), group) for color, group in colors.items())
+        else:
+            modules.append(('theme', (category,), tokens))
+    for category, entries in load(semantic_path).items():
+        if category == 'avatar':
+            colors = {}
+            for entry in entries:
+                colors.setdefault(module_name(entry['devToken'].split('.')[1]), []).append(entry)
+            modules.extend(('semantic', (category, color), group) for color, group in colors.items())
+        else:
+            modules.append(('semantic', (category,), entries))
+
+    files = {}
+    groups = {kind: [] for kind in INDEX_NAMES}
+    for kind, parts, data in modules:
+        relative = '/'.join(module_name(part) for part in parts)
+        if relative == 'index':
+            raise ValueError(f"{kind} category '{parts[0]}' would overwrite tokens/{kind}/index.ts")
+        files[f"{MODULE_DIR}/{kind}/{relative}.ts"] = _module(identifier(kind, *parts), data)
+        groups[kind].append((parts, relative))
+
+    for kind, members in groups.items():
+        name = INDEX_NAMES[kind]
+        lines = [HEADER.rstrip('\n')]
+        lines.extend(f"import {identifier(kind, *parts)} from './{relative}';" for parts, relative in members)
+        lines.append('')
+        lines.append(f"const {name} = {{")
+        merged = {}
+        for parts, _ in members:
+            merged.setdefault(parts[0], []).append((len(parts) > 1, identifier(kind, *parts)))
+        for category, entries in merged.items():
+            if entries[0][0]:
+                open_, close = SPREAD[kind]
+                value = open_ + ', '.join(f"...{ident}" for _, ident in entries) + close
+            else:
+                value = entries[0][1]
+            lines.append(f"  {json.dumps(category)}: {value},")
+        lines.append('};')
+        lines.append('')
+        lines.append(f"export default {name};")
+        lines.append('')
+        files[f"{MODULE_DIR}/{kind}/index.ts"] = '\n'.join(lines).encode('utf-8')
+    return files
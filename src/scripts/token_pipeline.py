@@ -0,0 +1,242 @@
+"""
+Incremental build graph for the color token pipeline.
+
+Primitives -> Theme -> Semantic (-> derived outputs) are modelled as stages. Each stage is
+fingerprinted from the content hash of its markdown inputs plus the
+fingerprints of the stages it depends on, so only stages whose inputs
+changed (or whose upstream changed) are rebuilt. A hash of the pipeline
+scripts themselves is mixed in so generator changes rebuild everything.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+
+import token_trace
+from token_bundle import build_token_bundle
+from token_cache import CACHE_DIR
+from token_contrast import build_contrast_matrix
+from token_css import build_tokens_css
+from token_icons import build_icon_assets
+from token_index import build_token_index
+from token_modules import build_token_modules
+from token_io import file_digest, patch_json, write_bytes, write_json, write_text
+from token_prod import PROFILES, prod_path, write_prod_json
+from update_colors import build_palette
+from update_theme_json import build_theme
+from update_semantic_json import build_semantic
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(base_dir, 'data')
+STATE_FILE = 'build-state.json'
+
+
+class Stage:
+    def __init__(self, name, inputs, output, build, deps=(), ensure_ascii=True, kind='json', indent=2, patch=False,
+                 optional=False):
+        self.name = name
+        self.inputs = list(inputs)
+        self.output = output
+        self.build = build
+        self.deps = list(deps)
+        self.ensure_ascii = ensure_ascii
+        # 'json' outputs are serialized by write_json, 'text' builds return the file content,
+        # 'files' builds return {relative path: bytes} (output is the main file among them)
+        self.kind = kind
+        self.indent = indent
+        # Rewrite only the top-level sections of a JSON output that changed
+        self.patch = patch
+        # Runs only when enabled for a build, or once its output exists
+        self.optional = optional
+
+
+STAGES = [
+    Stage('primitives', ['# Primitives.md'], 'color_palette.json', build_palette),
+    Stage('theme', ['# Theme.md'], 'theme_color_mapping.json', build_theme,
+          deps=['primitives']),
+    Stage('semantic', ['# Semantic.md', '# Semantic_dev_code.md'], 'semantic_color_mapping.json',
+          build_semantic, deps=['theme'], ensure_ascii=False, patch=True),
+    # Resolve the Theme/Semantic alias graph against the generated palette; bad references fail here
+    Stage('index', ['color_palette.json', '# Theme.md', '# Semantic_dev_code.md'],
+          'token_index.json', build_token_index, deps=['primitives', 'theme', 'semantic']),
+    Stage('css', ['color_palette.json', '# Theme.md', '# Semantic_dev_code.md'],
+          'tokens.css', build_tokens_css, deps=['primitives', 'theme', 'semantic'], kind='text'),
+    # Packed ratio array, written compact so it stays one line
+    Stage('contrast', ['token_index.json', 'semantic_color_mapping.json'],
+          'contrast_matrix.json', build_contrast_matrix, deps=['index', 'semantic'], indent=None),
+    # Binary bundle plus chunks/<kind>.<category>.bin for non-JSON consumers (build --bundle)
+    Stage('bundle', ['color_palette.json', '# Theme.md', '# Semantic_dev_code.md', 'semantic_color_mapping.json'],
+          'tokens.bin', build_token_bundle, deps=['primitives', 'theme', 'semantic'], kind='files',
+          optional=True),
+    # Per-category TS modules imported by the color pages, for granular HMR (build --modules)
+    Stage('modules', ['color_palette.json', 'theme_color_mapping.json', 'semantic_color_mapping.json'],
+          'tokens/palette/index.ts', build_token_modules, deps=['primitives', 'theme', 'semantic'], kind='files',
+          optional=True),
+    # Last, so a broken icon mapping (IconError) fails the build after every color output is written.
+    # Directory inputs are fingerprinted by their file listing, sizes and mtimes
+    Stage('icons', ['../assets/icons', 'icon_filename_mapping.json', 'line_icons.json', 'filled_icons.json',
+                    'illustration_icons.json'], 'icon_manifest.json', build_icon_assets, kind='files'),
+]
+
+
+def code_version():
+    """Digest of the .py files in src/scripts/."""
+    scripts_dir = os.path.dirname(os.path.abspath(__file__))
+    h = hashlib.sha256()
+    for name in sorted(os.listdir(scripts_dir)):
+        if name.endswith('.py'):
+            h.update(f"{name}:{file_digest(os.path.join(scripts_dir, name))}\n".encode('utf-8'))
+    return h.hexdigest()
+
+
+def input_digest(path):
+    """sha256 of a file, or of (path, size, mtime) for every file under a directory; None if missing."""
+    if not os.path.isdir(path):
+        return file_digest(path)
+    h = hashlib.sha256()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            file_path = os.path.join(root, name)
+            stat = os.stat(file_path)
+            h.update(f"{os.path.relpath(file_path, path)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode('utf-8'))
+    return h.hexdigest()
+
+
+def ordered_stages(stages):
+    """Returns the stages topologically sorted by their deps."""
+    by_name = {stage.name: stage for stage in stages}
+    ordered = []
+    visiting = set()
+    done = set()
+
+    def visit(stage):
+        if stage.name in done:
+            return
+        if stage.name in visiting:
+            raise ValueError(f"Dependency cycle at stage '{stage.name}'")
+        visiting.add(stage.name)
+        for dep in stage.deps:
+            if dep not in by_name:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{dep}'")
+            visit(by_name[dep])
+        visiting.discard(stage.name)
+        done.add(stage.name)
+        ordered.append(stage)
+
+    for stage in stages:
+        visit(stage)
+    return ordered
+
+
+def load_state(cache_dir):
+    path = os.path.join(cache_dir, STATE_FILE)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_state(cache_dir, state):
+    write_json(os.path.join(cache_dir, STATE_FILE), state)
+
+
+def write_files(data_dir, files):
+    """
+    Writes {relative path: bytes}. Files and directories left over from a
+    previous build in the subdirectories written to (e.g. chunks of a removed
+    category) are deleted.
+
+    Returns:
+        True if any file was written or removed
+    """
+    written = False
+    for name, content in files.items():
+        written |= write_bytes(os.path.join(data_dir, name), content)
+
+    # Every directory the files are written under (below data_dir itself)
+    subdirs = set()
+    for name in files:
+        subdir = os.path.dirname(name)
+        while subdir:
+            subdirs.add(subdir)
+            subdir = os.path.dirname(subdir)
+    for subdir in subdirs:
+        # Immediate children that should exist: written files and the directories leading to them
+        expected = {name[len(subdir) + 1:].split('/', 1)[0] for name in files if name.startswith(subdir + '/')}
+        for name in os.listdir(os.path.join(data_dir, subdir)):
+            if name in expected:
+                continue
+            path = os.path.join(data_dir, subdir, name)
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+            written = True
+    return written
+
+
+def build(data_dir=DATA_DIR, cache_dir=CACHE_DIR, force=False, stages=STAGES, profile='dev', enable=()):
+    """
+    Runs every stage whose fingerprint changed since the last build.
+
+    The 'prod' profile additionally writes the minified prod/ variant of
+    every JSON output (see token_prod). Optional stages run when named in
+    enable or when their output already exists.
+
+    Returns:
+        List of (stage name, status) tuples where status is 'built' (output
+        rewritten), 'unchanged' (rebuilt, identical output) or 'skipped'
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown profile '{profile}' (expected one of: {', '.join(PROFILES)})")
+    state = load_state(cache_dir)
+    version = code_version()
+    fingerprints = {}
+    results = []
+
+    for stage in ordered_stages(stages):
+        input_paths = [os.path.join(data_dir, name) for name in stage.inputs]
+        output_path = os.path.join(data_dir, stage.output)
+        if stage.optional and stage.name not in enable and not os.path.exists(output_path):
+            continue
+
+        h = hashlib.sha256(f"{stage.name}:{version}\n".encode('utf-8'))
+        for name, path in zip(stage.inputs, input_paths):
+            digest = input_digest(path)
+            if digest is None:
+                raise FileNotFoundError(f"Stage '{stage.name}' input not found: {path}")
+            h.update(f"{name}:{digest}\n".encode('utf-8'))
+        for dep in stage.deps:
+            h.update(f"{dep}:{fingerprints[dep]}\n".encode('utf-8'))
+        fingerprint = h.hexdigest()
+        fingerprints[stage.name] = fingerprint
+
+        prod = profile == 'prod' and stage.kind == 'json'
+        state_key = f"{stage.name}@prod" if prod else stage.name
+        outputs_exist = os.path.exists(output_path) and (not prod or os.path.exists(prod_path(output_path)))
+        if not force and state.get(state_key) == fingerprint and outputs_exist:
+            results.append((stage.name, 'skipped'))
+            continue
+
+        with token_trace.span(f"stage {stage.name}"):
+            data = stage.build(*input_paths)
+            if stage.kind == 'text':
+                written = write_text(output_path, data)
+            elif stage.kind == 'files':
+                written = write_files(data_dir, data)
+            elif stage.patch:
+                written, _ = patch_json(output_path, data, ensure_ascii=stage.ensure_ascii, indent=stage.indent)
+            else:
+                written = write_json(output_path, data, ensure_ascii=stage.ensure_ascii, indent=stage.indent)
+            if prod:
+                written |= write_prod_json(output_path, data)
+
+        state[stage.name] = fingerprint
+        state[state_key] = fingerprint
+        save_state(cache_dir, state)
+        results.append((stage.name, 'built' if written else 'unchanged'))
+
+    return results
@@ -0,0 +1,141 @@
+"""
+Production ('prod' profile) variants of the generated JSON.
+
+write_prod_json() writes <dir>/prod/<name>.json next to each readable
+output, plus .json.gz and, when the brotli module is installed,
+.json.br siblings. The prod document is
+
+    {"$schema": {...}, "data": <minified data>}
+
+where data has:
+
+    - derivable fields dropped (e.g. rgb/hsl, computable from hex)
+    - keys with "" values omitted
+    - object keys that repeat across the document replaced by short keys
+
+and $schema records how to expand it again:
+
+    {"profile": "prod", "version": 1,
+     "keys": {"a": "hex", ...}, "dropped": ["rgb", ...], "emptyOmitted": true}
+
+Files are serialized with compact separators. Compression uses fixed
+timestamps so unchanged data produces byte-identical .gz files.
+"""
+
+import argparse
+import gzip
+import itertools
+import json
+import os
+import string
+from collections import Counter
+
+from token_io import write_bytes
+
+PROFILES = ('dev', 'prod')
+PROD_DIR = 'prod'
+SCHEMA_VERSION = 1
+
+# Fields computable on the client, per generated file (a palette variable is
+# "<family>/<level>", with level "alpha (10%)" written as "alpha")
+DERIVED_FIELDS = {
+    'color_palette.json': ('variable', 'rgb', 'hsl'),
+}
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def _short_keys():
+    """a, b, ... z, aa, ab, ..."""
+    for width in itertools.count(1):
+        for letters in itertools.product(string.ascii_lowercase, repeat=width):
+            yield ''.join(letters)
+
+
+def _strip(data, dropped):
+    if isinstance(data, dict):
+        return {k: _strip(v, dropped) for k, v in data.items() if k not in dropped and v != ""}
+    if isinstance(data, list):
+        return [_strip(v, dropped) for v in data]
+    return data
+
+
+def _count_keys(data, counts):
+    if isinstance(data, dict):
+        counts.update(data.keys())
+        for value in data.values():
+            _count_keys(value, counts)
+    elif isinstance(data, list):
+        for value in data:
+            _count_keys(value, counts)
+
+
+def _rename(data, keys):
+    if isinstance(data, dict):
+        return {keys.get(k, k): _rename(v, keys) for k, v in data.items()}
+    if isinstance(data, list):
+        return [_rename(v, keys) for v in data]
+    return data
+
+
+def minify(data, dropped=()):
+    """Returns the prod document for data (see module docstring)."""
+    dropped = set(dropped)
+    data = _strip(data, dropped)
+
+    counts = Counter()
+    _count_keys(data, counts)
+    # Only keys that repeat are schema keys; one-off keys are data (token names, families)
+    repeated = sorted((k for k, n in counts.items() if n > 1), key=lambda k: (-counts[k] * len(k), k))
+    keys = {}
+    taken = set(counts)
+    candidates = (k for k in _short_keys() if k not in taken)
+    for key in repeated:
+        short = next(candidates)
+        if len(short) < len(key):
+            keys[key] = short
+
+    return {
+        "$schema": {
+            "profile": "prod",
+            "version": SCHEMA_VERSION,
+            "keys": {short: key for key, short in keys.items()},
+            "dropped": sorted(dropped),
+            "emptyOmitted": True,
+        },
+        "data": _rename(data, keys),
+    }
+
+
+def parse_profile(description, argv=None):
+    """--profile option shared by the update_* scripts."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--profile', choices=PROFILES, default='dev',
+                        help='prod also writes the minified prod/ variant with .gz/.br siblings')
+    return parser.parse_args(argv).profile
+
+
+def prod_path(path):
+    return os.path.join(os.path.dirname(path), PROD_DIR, os.path.basename(path))
+
+
+def write_prod_json(path, data, dropped=None):
+    """
+    Writes the prod variant of the JSON output at path and its compressed siblings.
+
+    Returns:
+        True if any of the files changed
+    """
+    if dropped is None:
+        dropped = DERIVED_FIELDS.get(os.path.basename(path), ())
+    content = json.dumps(minify(data, dropped), separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+    target = prod_path(path)
+    written = write_bytes(target, content)
+    written |= write_bytes(target + '.gz', gzip.compress(content, compresslevel=9, mtime=0))
+    if brotli is not None:
+        written |= write_bytes(target + '.br', brotli.compress(content, quality=11))
+    return written
@@ -0,0 +1,131 @@
+"""
+Token rename engine.
+
+A RenameMap is built once from old -> new pairs and indexes every old name
+three ways:
+
+    exact       color_blue_10          -> Blue/10
+    case-folded color_Blue_10          -> Blue/10
+    alias       color-blue/10, Blue10  -> Blue/10  (case and separators ignored)
+
+Segment renames (coolGray -> slateGray) rewrite individual '/'-separated
+parts of a reference, so avatar/coolGray/20 becomes avatar/slateGray/20
+without listing every shade.
+
+apply() then walks a parsed JSON tree a single time, so a migration costs
+one dict lookup per string value no matter how many renames there are.
+Every value it replaces is reported as a Change with its JSON path.
+"""
+
+import re
+from collections import namedtuple
+
+# path is a tuple of dict keys / list indexes leading to the value
+Change = namedtuple('Change', 'path old new')
+
+SEPARATOR_RE = re.compile(r'[\s_\-/.]+')
+
+
+def fold(name):
+    return name.casefold()
+
+
+def alias_key(name):
+    """Case and separator insensitive form: 'color_Yellow-Orange/10' -> 'coloryelloworange10'"""
+    return SEPARATOR_RE.sub('', name).casefold()
+
+
+def format_path(path):
+    return ''.join(f"[{p}]" if isinstance(p, int) else f".{p}" for p in path).lstrip('.')
+
+
+class RenameMap:
+    def __init__(self, renames=(), aliases=True):
+        self.exact = {}
+        self.folded = {}
+        self.aliased = {}
+        self.use_aliases = aliases
+        self.segments = {}
+        # Folded/alias keys that more than one rename maps to different targets
+        self.ambiguous = set()
+        for old, new in (renames.items() if isinstance(renames, dict) else renames):
+            self.add(old, new)
+
+    def add(self, old, new):
+        self.exact[old] = new
+        self._index(self.folded, fold(old), new)
+        if self.use_aliases:
+            self._index(self.aliased, alias_key(old), new)
+
+    def add_segment(self, old, new):
+        self.segments[old] = new
+
+    def _index(self, index, key, new):
+        if index.get(key, new) != new:
+            self.ambiguous.add(key)
+        index[key] = new
+
+    def __len__(self):
+        return len(self.exact) + len(self.segments)
+
+    def lookup(self, value):
+        """New name for value, or None if no rename applies."""
+        new = self.exact.get(value)
+        if new is not None:
+            return new
+        key = fold(value)
+        if key in self.folded and key not in self.ambiguous:
+            return self.folded[key]
+        if self.use_aliases:
+            key = alias_key(value)
+            if key in self.aliased and key not in self.ambiguous:
+                return self.aliased[key]
+        if self.segments and '/' in value:
+            parts = value.split('/')
+            renamed = [self.segments.get(part, part) for part in parts]
+            if renamed != parts:
+                return '/'.join(renamed)
+        return None
+
+    def apply(self, tree, rename_keys=False):
+        """
+        Renames every matching string value in tree, in place.
+
+        Args:
+            tree: Parsed JSON (dicts, lists and scalars)
+            rename_keys: Also rename matching dict keys
+
+        Returns:
+            List of Change in document order
+        """
+        changes = []
+        root = [tree]
+        # Explicit stack of (container, key, path) so deeply nested documents
+        # never hit the recursion limit; children are pushed in reverse to
+        # keep changes in document order
+        stack = [(root, 0, ())]
+        while stack:
+            container, key, path = stack.pop()
+            value = container[key]
+            if isinstance(value, str):
+                new = self.lookup(value)
+                if new is not None and new != value:
+                    container[key] = new
+                    changes.append(Change(path, value, new))
+            elif isinstance(value, dict):
+                if rename_keys:
+                    self._rename_keys(value, path, changes)
+                stack.extend((value, k, path + (k,)) for k in reversed(list(value)))
+            elif isinstance(value, list):
+                stack.extend((value, i, path + (i,)) for i in reversed(range(len(value))))
+        return changes
+
+    def _rename_keys(self, node, path, changes):
+        items = list(node.items())
+        node.clear()
+        for key, value in items:
+            new = self.lookup(key)
+            if new is not None and new != key:
+                changes.append(Change(path + (key,), key, new))
+                key = new
+            node[key] = value
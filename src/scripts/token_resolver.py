@@ -0,0 +1,184 @@
+"""
+Alias graph resolver for color tokens.
+
+Every token reference is a node. Primitive variables (Blue/60) are
+terminal values; theme tokens (brand/60) and semantic dev tokens
+(text.primary) are aliases pointing at another node. resolve() walks the
+graph once in dependency order, memoizing each node, so alias chains of
+any depth cost one step per node. Cycles, dangling references and
+duplicate definitions are collected with their source file and line and
+raised together as a ResolutionError.
+"""
+
+import json
+import os
+
+import token_trace
+from token_lexer import ENTRY, SECTION, lex_markdown
+from update_theme_json import SECTION_MAP
+
+
+class ResolutionError(ValueError):
+    def __init__(self, problems):
+        self.problems = problems
+        super().__init__("Token resolution failed:\n" + "\n".join(f"  {p}" for p in problems))
+
+    def __reduce__(self):
+        # Keep problems intact when raised inside a worker process
+        return ResolutionError, (self.problems,)
+
+
+class AliasGraph:
+    def __init__(self):
+        # ref -> (target ref or None, value, source, line)
+        self.nodes = {}
+        self.problems = []
+
+    def _add(self, ref, target, value, source, line):
+        if ref in self.nodes:
+            _, _, prev_source, prev_line = self.nodes[ref]
+            self.problems.append(
+                f"{_where(source, line)}: '{ref}' is already defined at {_where(prev_source, prev_line)}")
+            return
+        self.nodes[ref] = (target, value, source, line)
+
+    def add_value(self, ref, value, source=None, line=None):
+        self._add(ref, None, value, source, line)
+
+    def add_alias(self, ref, target, source=None, line=None):
+        self._add(ref, target, None, source, line)
+
+    def resolve(self):
+        """
+        Resolves every alias to its terminal node.
+
+        Returns:
+            Dict of ref -> terminal ref (terminal refs map to themselves)
+
+        Raises:
+            ResolutionError listing every cycle, dangling or duplicate reference
+        """
+        with token_trace.span('resolve') as info:
+            info['tokens'] = len(self.nodes)
+            return self._resolve()
+
+    def _resolve(self):
+        problems = list(self.problems)
+        resolved = {}
+        failed = set()
+        ordered = []
+        done = set()
+
+        # Iterative DFS so long chains never hit the recursion limit
+        for start in self.nodes:
+            if start in done:
+                continue
+            path = []
+            on_path = {}
+            ref = start
+            while ref not in done:
+                if ref in on_path:
+                    cycle = path[on_path[ref]:] + [ref]
+                    target, _, source, line = self.nodes[ref]
+                    problems.append(f"{_where(source, line)}: alias cycle {' -> '.join(cycle)}")
+                    failed.update(cycle)
+                    break
+                on_path[ref] = len(path)
+                path.append(ref)
+                target, _, source, line = self.nodes[ref]
+                if target is None:
+                    break
+                if not target:
+                    problems.append(f"{_where(source, line)}: '{ref}' has no value")
+                    failed.add(ref)
+                    break
+                if target not in self.nodes:
+                    problems.append(f"{_where(source, line)}: '{ref}' references unknown token '{target}'")
+                    failed.add(ref)
+                    break
+                ref = target
+            # Walk the path back so each node is finished after its target
+            for node in reversed(path):
+                if node not in done:
+                    done.add(node)
+                    ordered.append(node)
+
+        for ref in ordered:
+            target = self.nodes[ref][0]
+            if ref in failed or (target is not None and target in failed):
+                failed.add(ref)
+            elif target is None:
+                resolved[ref] = ref
+            else:
+                resolved[ref] = resolved[target]
+
+        if problems:
+            raise ResolutionError(problems)
+        return resolved
+
+    def value(self, ref, resolved):
+        """Terminal value for ref, given the mapping returned by resolve()."""
+        return self.nodes[resolved[ref]][1]
+
+
+def _where(source, line):
+    if source is None:
+        return '<unknown>'
+    name = os.path.basename(source)
+    return f"{name}:{line}" if line else name
+
+
+def scan_aliases(md_path, section_filter):
+    """
+    Yields (key, value, line) for every '- key: value' bullet in md_path.
+
+    value is None for bullets without a ':'. Bullets under '## ' headers for
+    which section_filter(header) is false are skipped.
+    """
+    current_section = None
+    for event in lex_markdown(md_path):
+        if event.kind == SECTION:
+            current_section = event.name
+        elif event.kind == ENTRY and current_section is not None and section_filter(current_section):
+            yield event.key, event.value, event.line
+
+
+def theme_aliases(theme_md):
+    """(key, value, line) for # Theme.md bullets, same sections and rules as parse_theme_md."""
+    return [alias for alias in scan_aliases(theme_md, lambda header: header in SECTION_MAP)
+            if alias[1] is not None]
+
+
+def semantic_aliases(semantic_dev_md):
+    """(key, value, line) for # Semantic_dev_code.md bullets, same rules as parse_dev_tokens."""
+    return [(key, value or '', line)
+            for key, value, line in scan_aliases(semantic_dev_md, lambda header: header.startswith('COLOR - '))]
+
+
+def graph_from_sources(palette, theme, semantic, theme_md=None, semantic_dev_md=None, palette_path=None):
+    """
+    Builds the alias graph from already parsed sources.
+
+    Args:
+        palette: {family: [shade]} as in color_palette.json
+        theme: theme_aliases() result
+        semantic: semantic_aliases() result
+        theme_md, semantic_dev_md, palette_path: Source names used in error messages
+    """
+    graph = AliasGraph()
+    for shades in palette.values():
+        for shade in shades:
+            graph.add_value(shade['variable'], shade, palette_path)
+    for key, value, line in theme:
+        graph.add_alias(key, value, theme_md, line)
+    for key, value, line in semantic:
+        graph.add_alias(key, value, semantic_dev_md, line)
+    return graph
+
+
+def load_graph(palette_path, theme_md, semantic_dev_md):
+    """Builds the alias graph from color_palette.json, # Theme.md and # Semantic_dev_code.md."""
+    with open(palette_path, 'r', encoding='utf-8') as f:
+        palette = json.load(f)['colors']['palette']
+    return graph_from_sources(palette, theme_aliases(theme_md), semantic_aliases(semantic_dev_md),
+                              theme_md, semantic_dev_md, palette_path)
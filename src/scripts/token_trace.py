@@ -0,0 +1,150 @@
+"""
+Opt-in per-stage tracing for the token build (tokens.py build --trace).
+
+Instrumented code wraps its phases in span():
+
+    with token_trace.span('resolve') as info:
+        ...
+        info['tokens'] = len(nodes)
+
+When tracing is off span() only yields a throwaway dict. When it is on,
+every span records wall time, CPU time, net allocated bytes and peak
+traced memory (tracemalloc) plus whatever the caller put in info. Spans
+nest, and the peak of a span includes the peaks of its children.
+
+chrome_trace() turns the spans into Chrome trace-event JSON (open in
+chrome://tracing or https://ui.perfetto.dev); summary_rows() aggregates
+them by name for a table.
+"""
+
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+ENABLED = False
+
+_events = []
+_stack = []
+_origin = 0.0
+
+
+def start():
+    global ENABLED, _origin
+    _events.clear()
+    _stack.clear()
+    _origin = time.perf_counter()
+    tracemalloc.start()
+    ENABLED = True
+
+
+def stop():
+    global ENABLED
+    ENABLED = False
+    tracemalloc.stop()
+    return list(_events)
+
+
+@contextmanager
+def span(name, **info):
+    if not ENABLED:
+        yield info
+        return
+
+    current, peak = tracemalloc.get_traced_memory()
+    if _stack:
+        # The parent's peak so far would be lost by the reset below
+        _stack[-1]['child_peak'] = max(_stack[-1]['child_peak'], peak)
+    tracemalloc.reset_peak()
+    frame = {'child_peak': 0}
+    _stack.append(frame)
+
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    try:
+        yield info
+    finally:
+        wall_end = time.perf_counter()
+        cpu_end = time.process_time()
+        end_current, end_peak = tracemalloc.get_traced_memory()
+        _stack.pop()
+        span_peak = max(end_peak, frame['child_peak'])
+        if _stack:
+            _stack[-1]['child_peak'] = max(_stack[-1]['child_peak'], span_peak)
+
+        _events.append({
+            'name': name,
+            'start': wall - _origin,
+            'wall': wall_end - wall,
+            'cpu': cpu_end - cpu,
+            'alloc': end_current - current,
+            'peak': span_peak - current,
+            'depth': len(_stack),
+            'info': info,
+        })
+
+
+def chrome_trace(events):
+    pid = os.getpid()
+    tid = threading.get_ident() % 100000
+    return {
+        'displayTimeUnit': 'ms',
+        'traceEvents': [{
+            'name': event['name'],
+            'cat': 'tokens',
+            'ph': 'X',
+            'ts': round(event['start'] * 1e6, 3),
+            'dur': round(event['wall'] * 1e6, 3),
+            'pid': pid,
+            'tid': tid,
+            'args': dict(event['info'], cpuMs=round(event['cpu'] * 1000, 3),
+                         allocBytes=event['alloc'], peakBytes=event['peak']),
+        } for event in sorted(events, key=lambda e: e['start'])],
+    }
+
+
+def summary_rows(events):
+    """
+    Aggregates events by name, in order of first appearance.
+
+    Returns:
+        List of dicts with name, count, wall, self (wall minus child spans),
+        cpu, alloc, peak and tokens
+    """
+    ordered = sorted(events, key=lambda e: (e['start'], e['depth']))
+    self_time = {}
+    for i, event in enumerate(ordered):
+        end = event['start'] + event['wall']
+        children = 0.0
+        for child in ordered[i + 1:]:
+            if child['start'] >= end:
+                break
+            if child['depth'] == event['depth'] + 1:
+                children += child['wall']
+        self_time[id(event)] = event['wall'] - children
+
+    rows = {}
+    for event in ordered:
+        row = rows.setdefault(event['name'], {
+            'name': event['name'], 'count': 0, 'wall': 0.0, 'self': 0.0, 'cpu': 0.0,
+            'alloc': 0, 'peak': 0, 'tokens': 0,
+        })
+        row['count'] += 1
+        row['wall'] += event['wall']
+        row['self'] += self_time[id(event)]
+        row['cpu'] += event['cpu']
+        row['alloc'] += event['alloc']
+        row['peak'] = max(row['peak'], event['peak'])
+        row['tokens'] += event['info'].get('tokens', 0)
+    return list(rows.values())
+
+
+def format_summary(rows):
+    lines = [f"{'span':<22}{'count':>6}{'wall ms':>10}{'self ms':>10}{'cpu ms':>10}"
+             f"{'alloc KB':>10}{'peak KB':>10}{'tokens':>9}"]
+    for row in rows:
+        lines.append(f"{row['name']:<22}{row['count']:>6}{row['wall'] * 1000:>10.2f}{row['self'] * 1000:>10.2f}"
+                     f"{row['cpu'] * 1000:>10.2f}{row['alloc'] / 1024:>10.1f}{row['peak'] / 1024:>10.1f}"
+                     f"{row['tokens']:>9}")
+    return "\n".join(lines)
@@ -0,0 +1,162 @@
+"""
+Multi-brand / multi-mode token builds (N brands x M modes).
+
+Variants are declared in a manifest (src/data/theme_variants.json):
+
+    {
+      "primitives": "# Primitives.md",
+      "modes": {
+        "light": {"section": "Light Theme", "dark": "dark"},
+        "dark": {"section": "Dark Theme", "fallback": "light"},
+        "high-contrast": {"section": "High Contrast Theme", "fallback": "light"}
+      },
+      "brands": {
+        "default": {"theme": "# Theme.md"},
+        "partner": {"theme": "brands/partner/# Theme.md",
+                    "semanticDev": "brands/partner/# Semantic_dev_code.md"}
+      }
+    }
+
+A mode picks one '## ' section of the primitives file, which must exist;
+shades it does not define are taken from its fallback mode. Its palette's
+hexDark values come from the mode named by "dark" (default: the mode
+itself, so a mode without a pair reads the same in both themes). A brand
+supplies its own Theme
+(and optionally Semantic / Semantic_dev_code) markdown; missing entries
+default to the files in src/data. Paths are relative to the manifest.
+
+The primitives file is parsed once, and each brand's markdown once, in the
+parent process. Every (brand, mode) pair is then built on a process pool
+into <out>/<brand>/<mode>/:
+
+    color_palette.json           palette with this mode's hex values
+    theme_color_mapping.json
+    semantic_color_mapping.json
+    token_index.json             every reference resolved for this mode
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from token_cache import cached_parse
+from token_index import index_from_graph
+from token_io import write_json
+from token_resolver import graph_from_sources, semantic_aliases, theme_aliases
+from update_colors import generate_json, parse_primitive_modes
+from update_semantic_json import merge_semantic, parse_design_tokens, parse_dev_tokens
+from update_theme_json import build_theme
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MANIFEST = os.path.join(base_dir, 'data', 'theme_variants.json')
+OUTPUT_DIR = os.path.join(os.path.dirname(base_dir), 'dist', 'tokens')
+
+BRAND_DEFAULTS = {
+    'theme': '# Theme.md',
+    'semantic': '# Semantic.md',
+    'semanticDev': '# Semantic_dev_code.md',
+}
+
+
+def load_manifest(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    for field in ('modes', 'brands'):
+        if not manifest.get(field):
+            raise ValueError(f"{path}: '{field}' must list at least one entry")
+    return manifest
+
+
+def mode_levels(primitive_modes, modes, mode, seen=()):
+    """{family: {level: hex}} for mode, filled in from its fallback chain."""
+    if mode in seen:
+        raise ValueError(f"Mode fallback cycle: {' -> '.join(seen + (mode,))}")
+    if mode not in modes:
+        raise ValueError(f"Unknown mode '{mode}'")
+    config = modes[mode]
+    section = config.get('section', mode)
+
+    # A missing section would silently make the mode a copy of its fallback
+    if section not in primitive_modes:
+        raise ValueError(f"Mode '{mode}': section '## {section}' not found in primitives")
+
+    levels = {}
+    fallback = config.get('fallback')
+    if fallback:
+        for family, shades in mode_levels(primitive_modes, modes, fallback, seen + (mode,)).items():
+            levels[family] = dict(shades)
+
+    for family, shades in primitive_modes.get(section, {}).items():
+        levels.setdefault(family, {}).update(shades)
+    return levels
+
+
+def load_brand(manifest_dir, config):
+    """Parses one brand's markdown sources."""
+    paths = {key: os.path.join(manifest_dir, config.get(key, default)) for key, default in BRAND_DEFAULTS.items()}
+    return {
+        'theme': build_theme(paths['theme']),
+        'semantic': merge_semantic(cached_parse(parse_design_tokens, paths['semantic']),
+                                   cached_parse(parse_dev_tokens, paths['semanticDev'])),
+        'themeAliases': theme_aliases(paths['theme']),
+        'semanticAliases': semantic_aliases(paths['semanticDev']),
+        'themePath': paths['theme'],
+        'semanticDevPath': paths['semanticDev'],
+    }
+
+
+def build_variant(job):
+    """Worker: builds and writes one (brand, mode) variant. Returns (brand, mode, files written)."""
+    brand, mode, levels, dark_levels, sources, out_dir = job
+    palette = generate_json(levels, dark_levels)
+    graph = graph_from_sources(palette, sources['themeAliases'], sources['semanticAliases'],
+                               sources['themePath'], sources['semanticDevPath'])
+    outputs = [
+        ('color_palette.json', {"colors": {"palette": palette}}, True),
+        ('theme_color_mapping.json', sources['theme'], True),
+        ('semantic_color_mapping.json', sources['semantic'], False),
+        ('token_index.json', index_from_graph(graph), True),
+    ]
+
+    variant_dir = os.path.join(out_dir, brand, mode)
+    written = []
+    for name, data, ensure_ascii in outputs:
+        if write_json(os.path.join(variant_dir, name), data, ensure_ascii=ensure_ascii):
+            written.append(name)
+    return brand, mode, written
+
+
+def build_variants(manifest_path=MANIFEST, out_dir=OUTPUT_DIR, workers=None):
+    """
+    Builds every brand x mode variant listed in the manifest.
+
+    Returns:
+        List of (brand, mode, files written) in manifest order
+    """
+    manifest = load_manifest(manifest_path)
+    manifest_dir = os.path.dirname(os.path.abspath(manifest_path))
+    modes = manifest['modes']
+
+    # Shared inputs are parsed once here and shipped to the workers
+    primitive_modes = cached_parse(parse_primitive_modes,
+                                   os.path.join(manifest_dir, manifest.get('primitives', '# Primitives.md')))
+    levels = {mode: mode_levels(primitive_modes, modes, mode) for mode in modes}
+    dark = {}
+    for mode, config in modes.items():
+        dark[mode] = config.get('dark', mode)
+        if dark[mode] not in modes:
+            raise ValueError(f"Mode '{mode}': dark mode '{dark[mode]}' is not in the manifest")
+    brands = {brand: load_brand(manifest_dir, config or {}) for brand, config in manifest['brands'].items()}
+
+    jobs = [(brand, mode, levels[mode], levels[dark[mode]], brands[brand], out_dir)
+            for brand in brands for mode in modes]
+    if workers == 1 or len(jobs) == 1:
+        results = [build_variant(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(build_variant, jobs))
+
+    write_json(os.path.join(out_dir, 'index.json'), {
+        "variants": [{"brand": brand, "mode": mode, "path": f"{brand}/{mode}"} for brand, mode, _ in results],
+    })
+    return results
@@ -0,0 +1,122 @@
+"""
+File watching for the token pipeline.
+
+Uses inotify through ctypes on Linux and falls back to polling mtimes
+elsewhere. Bursts of events (editor save + rename + chmod) are coalesced
+into one callback per debounce window.
+"""
+
+import ctypes
+import ctypes.util
+import fnmatch
+import os
+import select
+import struct
+import sys
+import time
+
+DEBOUNCE_SECONDS = 0.2
+POLL_INTERVAL = 0.5
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct('iIII')
+
+
+class InotifyWatcher:
+    def __init__(self, directory):
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.fd = libc.inotify_init()
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init failed')
+        wd = libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), f'inotify_add_watch failed for {directory}')
+
+    def read(self, timeout):
+        """Returns the file names that changed within timeout seconds."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        buf = os.read(self.fd, 64 * 1024)
+        names = set()
+        offset = 0
+        while offset < len(buf):
+            _, _, _, length = EVENT_HEADER.unpack_from(buf, offset)
+            offset += EVENT_HEADER.size
+            name = buf[offset:offset + length].rstrip(b'\0')
+            offset += length
+            if name:
+                names.add(os.fsdecode(name))
+        return names
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    def __init__(self, directory, interval=POLL_INTERVAL):
+        self.directory = directory
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self):
+        snapshot = {}
+        for entry in os.scandir(self.directory):
+            if entry.is_file():
+                stat = entry.stat()
+                snapshot[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def read(self, timeout):
+        time.sleep(min(timeout, self.interval))
+        current = self._scan()
+        names = {name for name in current.keys() | self.snapshot.keys()
+                 if current.get(name) != self.snapshot.get(name)}
+        self.snapshot = current
+        return names
+
+    def close(self):
+        pass
+
+
+def create_watcher(directory, polling=False):
+    if not polling and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(directory)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(directory)
+
+
+def watch(directory, on_change, patterns=('# *.md',), debounce=DEBOUNCE_SECONDS, polling=False):
+    """
+    Calls on_change(changed_names) whenever files matching patterns change.
+
+    Runs until interrupted. Changes arriving within `debounce` seconds of
+    each other are delivered as one batch.
+    """
+    watcher = create_watcher(directory, polling=polling)
+    try:
+        while True:
+            pending = _matching(watcher.read(1.0), patterns)
+            if not pending:
+                continue
+            # Keep collecting until the directory has been quiet for a full window
+            while True:
+                more = _matching(watcher.read(debounce), patterns)
+                if not more:
+                    break
+                pending |= more
+            on_change(sorted(pending))
+    finally:
+        watcher.close()
+
+
+def _matching(names, patterns):
+    return {name for name in names if any(fnmatch.fnmatchcase(name, p) for p in patterns)}
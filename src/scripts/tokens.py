@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Design token pipeline CLI
+
+Usage:
+    python src/scripts/tokens.py build [--force] [--no-cache] [--profile=prod] [--trace [PATH]] [--match-report [PATH]] [--modules] [--bundle] [--watch [--poll]]
+    python src/scripts/tokens.py migrate MAP [--dry-run] [--workers N]
+    python src/scripts/tokens.py variants [--manifest PATH] [--out DIR] [--workers N]
+    python src/scripts/tokens.py bench [--scales 10 100 1000] [--repeat N] [--out PATH] [--compare PATH]
+    python src/scripts/tokens.py serve [--socket PATH | --port N] [--no-watch] [--poll]
+    python src/scripts/tokens.py query METHOD [ARG ...] [--socket PATH | --port N] [--force]
+"""
+
+import argparse
+import json
+import sys
+import os
+import signal
+import time
+
+import token_bench
+import token_cache
+import token_daemon
+import token_migrate
+import token_pipeline
+import token_trace
+import token_variants
+import token_watch
+import update_semantic_json
+from token_io import write_json
+from token_icons import IconError
+from token_resolver import ResolutionError
+
+
+def print_results(results):
+    for name, status in results:
+        print(f"  {name}: {status}")
+    built = sum(1 for _, status in results if status == 'built')
+    print(f"Token build finished ({built}/{len(results)} outputs updated)")
+
+
+def traced_build(args, **kwargs):
+    kwargs['enable'] = tuple(name for name in ('modules', 'bundle') if getattr(args, name))
+    if not args.trace:
+        return token_pipeline.build(profile=args.profile, **kwargs)
+
+    token_trace.start()
+    try:
+        with token_trace.span('build'):
+            return token_pipeline.build(profile=args.profile, **kwargs)
+    finally:
+        events = token_trace.stop()
+        print(token_trace.format_summary(token_trace.summary_rows(events)))
+        write_json(args.trace, token_trace.chrome_trace(events))
+        print(f"Trace written to {args.trace}")
+
+
+def report_matches(args):
+    if args.match_report:
+        data_dir = token_pipeline.DATA_DIR
+        print(update_semantic_json.write_match_report(os.path.join(data_dir, '# Semantic.md'),
+                                                      os.path.join(data_dir, '# Semantic_dev_code.md'),
+                                                      args.match_report))
+
+
+def cmd_build(args):
+    if args.no_cache:
+        token_cache.ENABLED = False
+    try:
+        print_results(traced_build(args, force=args.force))
+        report_matches(args)
+    except (ResolutionError, IconError) as e:
+        print(e)
+        if not args.watch:
+            return 1
+    if not args.watch:
+        return 0
+
+    def on_change(names):
+        print(f"\n[{time.strftime('%H:%M:%S')}] Changed: {', '.join(names)}")
+        try:
+            print_results(traced_build(args))
+            report_matches(args)
+        except Exception as e:
+            # Keep watching; the next save usually fixes a half-edited file
+            print(f"Build failed: {e}")
+
+    print(f"Watching {token_pipeline.DATA_DIR} (Ctrl+C to stop)")
+    try:
+        token_watch.watch(token_pipeline.DATA_DIR, on_change, polling=args.poll)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def cmd_migrate(args):
+    renames, options = token_migrate.load_migration(args.map)
+    results = token_migrate.migrate(token_pipeline.DATA_DIR, renames, keys=options['keys'],
+                                    dry_run=args.dry_run, workers=args.workers)
+    root = os.path.dirname(os.path.dirname(token_pipeline.DATA_DIR))
+    changed = [r for r in results if r.changes]
+
+    for result in changed:
+        if args.dry_run:
+            print(token_migrate.unified_diff(result, root), end='')
+        else:
+            for line, old, new in result.changes:
+                print(f"  {os.path.relpath(result.path, root)}:{line}: {old} -> {new}")
+
+    print("Changed files:" if changed else "No references matched.")
+    for result in changed:
+        print(f"  {os.path.relpath(result.path, root)} ({len(result.changes)} changes)")
+    verb = "would change" if args.dry_run else "changed"
+    print(f"Migration finished ({len(changed)}/{len(results)} files {verb})")
+    if changed and not args.dry_run:
+        print("Run 'tokens.py build' to regenerate derived outputs.")
+    return 0
+
+
+def cmd_variants(args):
+    try:
+        results = token_variants.build_variants(args.manifest, args.out, workers=args.workers)
+    except ValueError as e:
+        # Manifest problems and ResolutionError
+        print(e)
+        return 1
+    for brand, mode, written in results:
+        print(f"  {brand}/{mode}: {len(written)} files updated")
+    print(f"Variant build finished ({len(results)} variants in {args.out})")
+    return 0
+
+
+def cmd_bench(args):
+    def progress(scale, result):
+        sizes = result['sizes']
+        print(f"{scale}x: {sizes['primitives']} primitives, {sizes['themeTokens']} theme, "
+              f"{sizes['semanticTokens']} semantic tokens ({sizes['sourceBytes'] // 1024} KB of markdown)")
+        for stage, timing in result['stages'].items():
+            print(f"  {stage:<18} {timing['seconds'] * 1000:10.2f} ms  {timing['peakBytes'] / 1024:10.0f} KB peak")
+
+    results = token_bench.run_benchmarks(args.scales, args.repeat, progress)
+    write_json(args.out, results)
+    print(f"Results written to {args.out}")
+
+    if not args.compare:
+        return 0
+    with open(args.compare, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    rows, regressions = token_bench.compare_results(baseline, results, args.threshold)
+    for scale, stage, before, after, ratio in rows:
+        flag = '  <-- slower' if ratio > args.threshold else ''
+        print(f"  {scale}x {stage:<18} {before * 1000:10.2f} -> {after * 1000:10.2f} ms ({ratio:.2f}x){flag}")
+    if regressions:
+        print(f"{len(regressions)} stage(s) regressed by more than {args.threshold}x")
+        return 1
+    return 0
+
+
+def cmd_serve(args):
+    # Stop cleanly (removing the socket file) when killed by a process manager
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    store = token_daemon.TokenStore()
+    try:
+        token_daemon.serve(store, socket_path=args.socket, port=args.port, watch=not args.no_watch,
+                           polling=args.poll, on_ready=lambda address: print(f"Serving tokens on {address} (Ctrl+C to stop)"))
+    except KeyboardInterrupt:
+        pass
+    except RuntimeError as e:
+        print(e)
+        return 1
+    return 0
+
+
+def cmd_query(args):
+    if args.method == 'resolve':
+        params = {'refs': args.args}
+    elif args.method == 'reverse-lookup':
+        if len(args.args) != 1:
+            print("reverse-lookup takes one '#RRGGBB' or token reference")
+            return 2
+        params = {'hex': args.args[0]} if args.args[0].startswith('#') else {'ref': args.args[0]}
+    elif args.method == 'rebuild':
+        params = {'force': args.force}
+    else:
+        params = {}
+
+    try:
+        result = token_daemon.request(args.method, params, socket_path=args.socket, port=args.port)
+    except OSError as e:
+        print(f"No token daemon reachable ({e}); start one with 'tokens.py serve'")
+        return 1
+    except token_daemon.RpcError as e:
+        print(f"Error {e.code}: {e}")
+        for problem in e.data or ():
+            print(f"  {problem}")
+        return 1
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='tokens', description='Design token pipeline')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help='Rebuild token JSON whose sources changed')
+    build_parser.add_argument('--force', action='store_true', help='Rebuild every stage')
+    build_parser.add_argument('--no-cache', action='store_true', help='Parse sources without the parse cache')
+    build_parser.add_argument('--profile', choices=token_pipeline.PROFILES, default='dev',
+                              help='prod also writes minified prod/*.json with .gz/.br siblings')
+    # --profile selects the output profile, so timing instrumentation lives under --trace
+    build_parser.add_argument('--trace', nargs='?', const=os.path.join(token_cache.CACHE_DIR, 'trace.json'),
+                              help='Record per-stage timings and memory; writes a Chrome trace (default .cache/tokens/trace.json)')
+    build_parser.add_argument('--match-report', nargs='?', const=update_semantic_json.MATCH_REPORT,
+                              help='Write the design/dev semantic token match report (default .cache/tokens/semantic-match-report.json)')
+    build_parser.add_argument('--modules', action='store_true',
+                              help='Also emit per-category TS modules in src/data/tokens/ (kept up to date afterwards)')
+    build_parser.add_argument('--bundle', action='store_true',
+                              help='Also emit the binary bundle src/data/tokens.bin and src/data/chunks/ '
+                                   '(kept up to date afterwards)')
+    build_parser.add_argument('--watch', action='store_true', help='Keep running and rebuild on source changes')
+    build_parser.add_argument('--poll', action='store_true', help='Watch by polling instead of inotify')
+    build_parser.set_defaults(func=cmd_build)
+
+    migrate_parser = subparsers.add_parser('migrate', help='Apply a rename map to every token data file')
+    migrate_parser.add_argument('map', help='Rename map (.json, .yaml or .yml)')
+    migrate_parser.add_argument('--dry-run', action='store_true', help='Print a diff instead of writing files')
+    migrate_parser.add_argument('--workers', type=int, default=None, help='Thread pool size')
+    migrate_parser.set_defaults(func=cmd_migrate)
+
+    variants_parser = subparsers.add_parser('variants', help='Build every brand x mode variant in a manifest')
+    variants_parser.add_argument('--manifest', default=token_variants.MANIFEST, help='Variant manifest JSON')
+    variants_parser.add_argument('--out', default=token_variants.OUTPUT_DIR, help='Output directory')
+    variants_parser.add_argument('--workers', type=int, default=None, help='Process pool size')
+    variants_parser.set_defaults(func=cmd_variants)
+
+    bench_parser = subparsers.add_parser('bench', help='Benchmark pipeline stages on synthetic token sets')
+    bench_parser.add_argument('--scales', type=int, nargs='+', default=list(token_bench.DEFAULT_SCALES),
+                              help="Multiples of today's token count")
+    bench_parser.add_argument('--repeat', type=int, default=3, help='Timing runs per stage (best is kept)')
+    bench_parser.add_argument('--out', default=os.path.join(token_cache.CACHE_DIR, 'bench.json'),
+                              help='Where to write the results JSON')
+    bench_parser.add_argument('--compare', help='Previous results JSON to compare against')
+    bench_parser.add_argument('--threshold', type=float, default=1.25,
+                              help='Slowdown ratio reported as a regression (exit code 1)')
+    bench_parser.set_defaults(func=cmd_bench)
+
+    serve_parser = subparsers.add_parser('serve', help='Keep resolved tokens in memory and answer JSON-RPC queries')
+    serve_parser.add_argument('--socket', default=token_daemon.SOCKET_PATH, help='Unix socket path')
+    serve_parser.add_argument('--port', type=int, default=None, help='Listen on 127.0.0.1:PORT instead of a socket')
+    serve_parser.add_argument('--no-watch', action='store_true', help='Only rebuild on request')
+    serve_parser.add_argument('--poll', action='store_true', help='Watch by polling instead of inotify')
+    serve_parser.set_defaults(func=cmd_serve)
+
+    query_parser = subparsers.add_parser('query', help='Send one request to a running token daemon')
+    query_parser.add_argument('method', choices=('resolve', 'reverse-lookup', 'rebuild', 'status'))
+    query_parser.add_argument('args', nargs='*', help='Token references for resolve; a hex or reference for reverse-lookup')
+    query_parser.add_argument('--socket', default=token_daemon.SOCKET_PATH, help='Unix socket path')
+    query_parser.add_argument('--port', type=int, default=None, help='Connect to 127.0.0.1:PORT instead of a socket')
+    query_parser.add_argument('--force', action='store_true', help='With rebuild, rebuild every stage')
+    query_parser.set_defaults(func=cmd_query)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,133 +1,127 @@
-import re
-import json
-import colorsys
-
-source_file = '/Users/im_018/Documents/GitHub/Project/whatt/design-system-site/src/data/# Primitives.md'
-target_file = '/Users/im_018/Documents/GitHub/Project/whatt/design-system-site/src/data/color_palette.json'
-
-def hex_to_rgb(hex_color):
-    hex_color = hex_color.lstrip('#')
-    if len(hex_color) == 8: # Handle alpha
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-
-def hex_to_hsl(hex_color):
-    hex_color = hex_color.lstrip('#')
-    if len(hex_color) == 8:
-        hex_color = hex_color[:6] # Ignore alpha for HSL calculation base on standard hex
-    
-    r, g, b = (int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-    h, l, s = colorsys.rgb_to_hls(r / 255.0, g / 255.0, b / 255.0)
-    return h * 360, s * 100, l * 100
+import os
+
+from color_engine import compute_colors, format_hsl, format_rgb
+from token_cache import cached_parse
+from token_io import write_json
+from token_lexer import ENTRY, FAMILY, SECTION, lex_markdown
+from token_prod import parse_profile, write_prod_json
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+source_file = os.path.join(base_dir, 'data', '# Primitives.md')
+target_file = os.path.join(base_dir, 'data', 'color_palette.json')
+
+def parse_primitive_modes(file_path):
+    """
+    Parses # Primitives.md into {mode section: {family: {level: hex}}}.
+
+    Every '## ' header is a mode ('Light Theme', 'Dark Theme', ...); entries
+    before the first header belong to 'Light Theme'.
+    """
+    modes = {}
+    current_data = modes.setdefault("Light Theme", {})
+    current_family = None
+
+    for event in lex_markdown(file_path):
+        if event.kind == SECTION:
+            current_data = modes.setdefault(event.name, {})
+        elif event.kind == FAMILY:
+            current_family = event.name
+            current_data.setdefault(current_family, {})
+        elif event.kind == ENTRY and current_family and event.value is not None:
+            # - Family/Level: #Hex
+            if "/" in event.key:
+                _, level = event.key.split("/", 1)
+            else:
+                level = event.key # Fallback
+
+            current_data.setdefault(current_family, {})[level] = event.value
+
+    return modes
 
 def parse_primitives(file_path):
-    with open(file_path, 'r') as f:
-        content = f.read()
-
-    # Extract Light Theme section
-    print(f"Total content length: {len(content)}")
-    # Split using explicit section headers instead of regex to avoid confusion with ### subheaders
-    parts = content.split('## Light Theme')
-    if len(parts) < 2:
-        print("Light Theme section not found")
-        return {}
-    
-    # Take everything after Light Theme
-    after_light = parts[1]
-    
-    # content ends at '## Dark Theme' or EOF
-    light_theme_content = after_light.split('## Dark Theme')[0]
-    print(f"Found Light Theme content length: {len(light_theme_content)}")
-    
-    # Split by ### headers
-    sections = re.split(r'### ', light_theme_content)
-    palette = {}
-
-    family_mapping = {
-        'YellowOrange': 'Yellow Orange',
-        'DeepGreen': 'Deep Green',
-        'LightBlue': 'Light Blue',
-        'DeepBlue': 'Deep Blue',
-        'CoolGray': 'Cool Gray',
-        # Others match directly
-    }
-
-    for section in sections:
-        if not section.strip():
+    """Parses # Primitives.md into {family: {level: hex}} dicts for light and dark."""
+    light_data = {}
+    dark_data = {}
+    for name, families in parse_primitive_modes(file_path).items():
+        if name.startswith("Dark Theme"):
+            target = dark_data
+        elif name.startswith("Light Theme"):
+            target = light_data
+        else:
             continue
-        
-        lines = section.strip().split('\n')
-        family_name = lines[0].strip()
-        
-        # Map family name if needed
-        json_family_name = family_mapping.get(family_name, family_name)
-        
-        tokens = []
-        for line in lines[1:]:
-            line = line.strip()
-            if not line.startswith('-'):
-                continue
-            
-            # Parse line: - Family/Level: #Hex
-            match = re.match(r'- (.*?)/(.*?): (#([0-9A-Fa-f]+))', line)
-            if match:
-                # family_part = match.group(1) # Unused
-                level = match.group(2)
-                hex_value = match.group(3)
-                
-                # Special handling for level names
-                if level == 'white':
-                    level = 'white'
-                elif level == 'alpha':
-                    level = 'alpha (10%)'
-                elif json_family_name == 'Black alpha':
-                     # Keep strict mapping if possible, but MD has just "10", "20"
-                     # Target JSON has "10 (10%)"
-                     # But plan allowed "10". Let's use simple "10" as per MD to stay clean
-                     # UNLESS compatibility is broken. 
-                     # Checking previous file content: "10 (10%)" was used.
-                     # Let's clean it up to "10" if strict compliance to MD is goal.
-                     # But to match logic, maybe appending % is good?
-                     # Plan said: "Black alpha 10 is 10%. So '10' is fine."
-                     pass
-                
-                rgb = hex_to_rgb(hex_value)
-                hsl = hex_to_hsl(hex_value)
-                
-                variable_name = f"color_{json_family_name.lower().replace(' ', '_')}_{level.replace(' (10%)', '_alpha').replace('%', '')}"
-                # logic to match existing variable naming convention roughly
-                # Existing: color_blue_10, color_gray_10, color_red_alpha, color_blackalpha
-                
-                if level == 'alpha (10%)':
-                     variable_name = f"color_{json_family_name.lower().replace(' ', '_')}_alpha"
-                elif json_family_name == 'Black alpha':
-                     variable_name = "color_blackalpha" 
-                
-                rgb_str = f"rgb({rgb[0]}, {rgb[1]}, {rgb[2]})"
-                hsl_str = f"hsl({round(hsl[0])}, {round(hsl[1])}, {round(hsl[2])})"
-                
-                token = {
-                    "level": level,
-                    "hex": hex_value,
-                    "rgb": rgb_str,
-                    "hsl": hsl_str,
-                    "variable": variable_name
-                }
-                tokens.append(token)
-        
-        if tokens:
-            palette[json_family_name] = tokens
-
-    return palette
-
-def update_json(data, target_path):
-    with open(target_path, 'w') as f:
-        json.dump(data, f, indent=2)
+        for family, levels in families.items():
+            target.setdefault(family, {}).update(levels)
+    return light_data, dark_data
 
-if __name__ == "__main__":
-    new_palette = parse_primitives(source_file)
-    if new_palette:
-        update_json(new_palette, target_file)
+# Display order of the families in color_palette.json (the UI lists them in this order);
+# families not listed here follow in markdown order
+FAMILY_ORDER = (
+    'DeepGreen', 'Red', 'Blue', 'Pink', 'BlackAlpha', 'Cyan', 'DeepBlue', 'Purple',
+    'CoolGray', 'Green', 'Gray', 'Orange', 'LightBlue', 'YellowOrange',
+)
+
+def sort_key(level):
+    # Numeric levels in order, 'white' first and alpha levels last
+    level = level.lower()
+    if level == 'white': return -1
+    if level == 'alpha': return 999
+    if 'alpha' in level: return 998
+    try:
+        return int(level)
+    except ValueError:
+        return 1000
+
+def generate_json(light_data, dark_data):
+    """Merges light and dark primitives into the color_palette.json family lists."""
+    # Known families keep their display order, new ones their order of appearance in the markdown (light first)
+    all_families = list(light_data.keys())
+    all_families += [family for family in dark_data if family not in light_data]
+    rank = {family: i for i, family in enumerate(FAMILY_ORDER)}
+    all_families.sort(key=lambda family: rank.get(family, len(rank)))
+    rows = []
+    for family in all_families:
+        light_levels = light_data.get(family, {})
+        dark_levels = dark_data.get(family, {})
+        all_levels = set(light_levels) | set(dark_levels)
+        for level in sorted(all_levels, key=sort_key):
+            rows.append((family, level, light_levels.get(level), dark_levels.get(level)))
+
+    # Color values are based on the light hex if available, else the dark hex,
+    # computed for the whole palette in one batch
+    colors = compute_colors([l_hex or d_hex for _, _, l_hex, d_hex in rows])
+
+    output = {family: [] for family in all_families}
+    for (family, level, l_hex, d_hex), color in zip(rows, colors):
+        output[family].append({
+            # The UI expects "alpha (10%)" for the alpha level
+            "level": 'alpha (10%)' if level == 'alpha' else level,
+            "variable": f"{family}/{level}",
+            "hex": l_hex or "",
+            "hexDark": d_hex or "",
+            "rgb": format_rgb(color['rgb']),
+            "hsl": format_hsl(color['hsl']),
+        })
+
+    return output
+
+def build_palette(file_path):
+    """Builds the full color_palette.json document from # Primitives.md."""
+    light_data, dark_data = cached_parse(parse_primitives, file_path)
+    return {"colors": {"palette": generate_json(light_data, dark_data)}}
+
+def main():
+    profile = parse_profile("Generate color_palette.json from # Primitives.md")
+    if not os.path.exists(source_file):
+        print(f"Error: {source_file} not found")
+        return
+
+    palette = build_palette(source_file)
+    if write_json(target_file, palette):
         print(f"Updated {target_file} successfully.")
     else:
-        print("No data parsed.")
+        print(f"{target_file} is already up to date.")
+    if profile == 'prod' and write_prod_json(target_file, palette):
+        print(f"Updated prod variant of {target_file}.")
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,29 @@
-import re
-import json
 import os
 
+from token_cache import CACHE_DIR, cached_parse
+from token_io import patch_json, write_json
+from token_lexer import ENTRY, SECTION, lex_markdown
+from token_match import TokenMatcher
+from token_prod import parse_profile, write_prod_json
+
+CATEGORY_PREFIX = 'COLOR - '
+MATCH_REPORT = os.path.join(CACHE_DIR, 'semantic-match-report.json')
+
 def parse_design_tokens(filepath):
     """Parses # Semantic.md to get design tokens by category."""
     tokens = {}
     current_category = None
     
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        for event in lex_markdown(filepath):
+            if event.kind == SECTION and event.name.startswith(CATEGORY_PREFIX):
+                current_category = event.name[len(CATEGORY_PREFIX):].strip()
+                tokens.setdefault(current_category, [])
+            elif event.kind == ENTRY and event.name.startswith('Color/') and current_category:
+                tokens[current_category].append(event.name)
     except FileNotFoundError:
         print(f"Error: File not found: {filepath}")
         return {}
-
-    for line in lines:
-        line = line.strip()
-        if line.startswith('## COLOR - '):
-            current_category = line.replace('## COLOR - ', '').strip()
-            if current_category not in tokens:
-                tokens[current_category] = []
-        elif line.startswith('- Color/'):
-            token_name = line.replace('- ', '').strip()
-            if current_category:
-                tokens[current_category].append(token_name)
     
     return tokens
 
@@ -33,93 +33,91 @@ def parse_dev_tokens(filepath):
     current_category = None
     
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        for event in lex_markdown(filepath):
+            if event.kind == SECTION and event.name.startswith(CATEGORY_PREFIX):
+                current_category = event.name[len(CATEGORY_PREFIX):].strip()
+                tokens.setdefault(current_category, [])
+            elif event.kind == ENTRY and current_category:
+                # e.g. - text.primary: neutral/100 (entries without a value get "")
+                tokens[current_category].append({
+                    "devToken": event.key,
+                    "value": event.value or ""
+                })
     except FileNotFoundError:
          print(f"Error: File not found: {filepath}")
          return {}
 
-    for line in lines:
-        line = line.strip()
-        if line.startswith('## COLOR - '):
-            current_category = line.replace('## COLOR - ', '').strip()
-            if current_category not in tokens:
-                tokens[current_category] = []
-        elif line.startswith('- ') and ':' in line: # e.g. - text.primary: neutral/100
-            parts = line.replace('- ', '').split(':')
-            token_name = parts[0].strip()
-            token_value = parts[1].strip() if len(parts) > 1 else ""
-            if current_category:
-                tokens[current_category].append({
-                    "devToken": token_name,
-                    "value": token_value
-                })
-        elif line.startswith('- ') and ':' not in line: # Handle cases without value if any
-            token_name = line.replace('- ', '').strip()
-            if current_category and token_name:
-                 tokens[current_category].append({
-                    "devToken": token_name,
-                    "value": ""
-                })
-
     return tokens
 
-def normalize_key(key):
-    """Normalizes key for matching."""
-    # Remove 'Color/' prefix case-insensitively
-    key = re.sub(r'^Color/', '', key, flags=re.IGNORECASE)
-    # Remove all non-alphanumeric characters (including spaces, dots, slashes) and lowercase
-    return re.sub(r'[^a-zA-Z0-9]', '', key).lower()
-
-def main():
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    design_file = os.path.join(base_dir, 'data', '# Semantic.md')
-    dev_file = os.path.join(base_dir, 'data', '# Semantic_dev_code.md')
-    output_file = os.path.join(base_dir, 'data', 'semantic_color_mapping.json')
-
-    design_tokens_by_cat = parse_design_tokens(design_file)
-    dev_tokens_by_cat = parse_dev_tokens(dev_file)
+def merge_semantic(design_tokens_by_cat, dev_tokens_by_cat, report=None):
+    """
+    Joins dev tokens with their design token names, keyed by category.
 
-    # Flatten design tokens for easier lookup map
-    design_token_map = {}
-    for cat, tokens in design_tokens_by_cat.items():
-        for token in tokens:
-            # normalize 
-            # Example: Color/text/primary -> textprimary
-            norm = normalize_key(token)
-            design_token_map[norm] = token
+    Args:
+        report: Optional dict, filled with the match report (see token_match)
+    """
+    matcher = TokenMatcher(design_tokens_by_cat)
+    rows = matcher.match_all(dev_tokens_by_cat)
+    linked = iter(rows)
 
     merged_data = {}
-
     for cat, dev_list in dev_tokens_by_cat.items():
         merged_data[cat] = []
         for dev_item in dev_list:
-            dev_token = dev_item['devToken']
-            val = dev_item['value']
-            
-            # Try to match design token
-            # devToken: text.primary -> textprimary
-            norm = normalize_key(dev_token)
-            
-            design_token = design_token_map.get(norm, "")
-            
-            # Fallback check for partial matches or specific adjustments if needed
-            if not design_token:
-                # Debug print
-                # print(f"Warning: No match for dev token: {dev_token} (norm: {norm})")
-                pass
-
             merged_data[cat].append({
-                "devToken": dev_token,
-                "designToken": design_token, # Might be empty if no match
-                "value": val
+                "devToken": dev_item['devToken'],
+                "designToken": next(linked)["designToken"], # Empty if nothing matched
+                "value": dev_item['value']
             })
 
-    # Write to JSON
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(merged_data, f, indent=2, ensure_ascii=False)
-    
-    print(f"Successfully generated {output_file}")
+    if report is not None:
+        report.update(matcher.report(rows))
+    return merged_data
+
+def build_semantic(design_file, dev_file):
+    """Builds the semantic_color_mapping.json document from both markdown sources."""
+    return merge_semantic(
+        cached_parse(parse_design_tokens, design_file),
+        cached_parse(parse_dev_tokens, dev_file),
+    )
+
+def write_match_report(design_file, dev_file, report_path=MATCH_REPORT):
+    """
+    Writes the design/dev token match report (tokens.py build --match-report).
+
+    Returns:
+        One-line summary of the non-exact matches, unlinked and duplicate design tokens
+    """
+    report = {}
+    merge_semantic(
+        cached_parse(parse_design_tokens, design_file),
+        cached_parse(parse_dev_tokens, dev_file),
+        report,
+    )
+    write_json(report_path, report, ensure_ascii=False)
+    counts = ", ".join(f"{count} {kind}" for kind, count in report['summary'].items() if kind != 'exact')
+    return (f"Semantic token matching: {counts or 'all exact'}; "
+            f"{len(report['unmatchedDesignTokens'])} design tokens unlinked, "
+            f"{len(report['duplicateDesignTokens'])} duplicate keys (see {report_path})")
+
+def main():
+    profile = parse_profile("Generate semantic_color_mapping.json from the Semantic markdown files")
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    design_file = os.path.join(base_dir, 'data', '# Semantic.md')
+    dev_file = os.path.join(base_dir, 'data', '# Semantic_dev_code.md')
+    output_file = os.path.join(base_dir, 'data', 'semantic_color_mapping.json')
+
+    merged_data = build_semantic(design_file, dev_file)
+
+    # Only categories whose entries changed are re-serialized; the rest keep their previous text
+    written, changed = patch_json(output_file, merged_data, ensure_ascii=False)
+    if written:
+        detail = f" (categories: {', '.join(changed)})" if changed else ""
+        print(f"Successfully generated {output_file}{detail}")
+    else:
+        print(f"{output_file} is already up to date")
+    if profile == 'prod' and write_prod_json(output_file, merged_data):
+        print(f"Updated prod variant of {output_file}")
 
 if __name__ == "__main__":
     main()
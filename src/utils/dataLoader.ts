@@ -1,6 +1,3 @@
-import colorPalette from '../data/color_palette.json';
-import themeColorMapping from '../data/theme_color_mapping.json';
-import semanticColorMapping from '../data/semantic_color_mapping.json';
 import typographyStyles from '../data/typography_styles.json';
 import spacingSystem from '../data/spacing_system.json';
 import deviceResolutions from '../data/device_resolutions.json';
@@ -15,11 +12,9 @@ import radiusTokens from '../data/radius.json';
 import motionTokens from '../data/motion.json';
 
 export const designSystemData = {
-  colors: {
-    palette: colorPalette.colors.palette,
-    themeMapping: themeColorMapping,
-    semanticMapping: semanticColorMapping,
-  },
+  // Colors are not loaded here: pages import their categories from src/data/tokens/ (see
+  // src/scripts/token_modules.py), colorUtils resolves references through token_index.json
+  // and loads the contrast matrix on demand
   typography: typographyStyles,
   spacing: spacingSystem,
   radius: radiusTokens,